@@ -0,0 +1,237 @@
+"""Dialogue text straight from Skyrim plugins (.esp/.esm/.esl), as mapping pairs for LipGUI.
+
+The plugin is memory-mapped and only its DIAL top group is walked; everything else is
+skipped by group size, so even the big master files are never read as a whole. Each INFO
+record yields its response texts (NAM1) keyed like Skyrim's voice file names:
+
+    000A1234    first response of INFO 000A1234 (load-order byte cleared)
+    000A1234_2  response number 2
+
+Localized plugins keep the text in Strings/<plugin>_<language>.ILSTRINGS. Selecting that
+file instead of the plugin picks the language; for the plugin itself the only string table
+(or the English one) is used.
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+
+PLUGIN_SUFFIXES = {".esp", ".esm", ".esl"}
+STRINGS_SUFFIXES = {".strings", ".dlstrings", ".ilstrings"}
+
+_RECORD = struct.Struct("<4sIII")  # type, data size, flags, FormID (+ 8 bytes version info)
+_GROUP = struct.Struct("<4sI4si")  # "GRUP", group size incl. header, label, group type
+_HEADER_SIZE = 24
+_SUBRECORD = struct.Struct("<4sH")
+_FLAG_LOCALIZED = 0x00000080  # TES4
+_FLAG_COMPRESSED = 0x00040000
+
+
+def is_plugin_source(path: Path) -> bool:
+    suffix = path.suffix.lower()
+    return suffix in PLUGIN_SUFFIXES or suffix in STRINGS_SUFFIXES
+
+
+def _decode(raw: bytes) -> str:
+    raw = raw.split(b"\0", 1)[0]
+    try:
+        return raw.decode("utf-8").strip()
+    except UnicodeDecodeError:
+        # Oldrim plugins and string tables are usually Windows-1252.
+        return raw.decode("cp1252", errors="replace").strip()
+
+
+class StringTable:
+    """A .STRINGS/.DLSTRINGS/.ILSTRINGS file: string ID -> text, read on demand from an mmap."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        # DL/IL tables prefix each string with its length, .STRINGS are only NUL-terminated.
+        self._sized = path.suffix.lower() != ".strings"
+        with path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        count, _ = struct.unpack_from("<II", self._mm, 0)
+        self._data = 8 + count * 8
+        directory = struct.unpack_from(f"<{count * 2}I", self._mm, 8)
+        self._offsets = dict(zip(directory[0::2], directory[1::2]))
+
+    def get(self, string_id: int) -> str:
+        offset = self._offsets.get(string_id)
+        if offset is None:
+            return ""
+        pos = self._data + offset
+        if self._sized:
+            (length,) = struct.unpack_from("<I", self._mm, pos)
+            return _decode(self._mm[pos + 4 : pos + 4 + length])
+        end = self._mm.find(b"\0", pos)
+        return _decode(self._mm[pos : end if end >= 0 else len(self._mm)])
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def _plugin_for_strings(strings_path: Path) -> Path:
+    """Data/Strings/Skyrim_german.ILSTRINGS -> Data/Skyrim.esm."""
+    stem = strings_path.stem.rsplit("_", 1)[0]
+    for folder in (strings_path.parent.parent, strings_path.parent):
+        for suffix in (".esm", ".esp", ".esl"):
+            candidate = folder / f"{stem}{suffix}"
+            if candidate.exists():
+                return candidate
+    raise FileNotFoundError(f"Plugin zu {strings_path.name} nicht gefunden ({stem}.esm/.esp/.esl)")
+
+
+def _strings_for_plugin(plugin_path: Path) -> Path:
+    folder = plugin_path.parent / "Strings"
+    prefix = f"{plugin_path.stem.lower()}_"
+    tables = (
+        sorted(p for p in folder.iterdir() if p.suffix.lower() == ".ilstrings" and p.name.lower().startswith(prefix))
+        if folder.is_dir()
+        else []
+    )
+    if not tables:
+        raise FileNotFoundError(f"{plugin_path.name} ist lokalisiert, aber Strings/{plugin_path.stem}_*.ILSTRINGS fehlt.")
+    if len(tables) == 1:
+        return tables[0]
+    for table in tables:
+        if table.stem.lower() == f"{prefix}english":
+            return table
+    raise ValueError(
+        f"{plugin_path.name}: mehrere Sprachen gefunden ({', '.join(t.name for t in tables)}). "
+        "Bitte statt des Plugins die .ILSTRINGS-Datei der gewünschten Sprache auswählen."
+    )
+
+
+def _info_responses(data: bytes | mmap.mmap, start: int, end: int) -> Iterator[tuple[int, bytes]]:
+    """(response number, raw NAM1 data) of one INFO record's subrecords."""
+    number = 0
+    pos = start
+    # An XXXX subrecord carries the 32-bit size of the next one.
+    large = 0
+    while pos + 6 <= end:
+        sig, size = _SUBRECORD.unpack_from(data, pos)
+        pos += 6
+        if large:
+            size, large = large, 0
+        if sig == b"XXXX":
+            (large,) = struct.unpack_from("<I", data, pos)
+        elif sig == b"TRDT" and size > 12:
+            number = data[pos + 12]
+        elif sig == b"NAM1":
+            yield number, bytes(data[pos : pos + size])
+        pos += size
+
+
+def iter_plugin_texts(path: Path) -> Iterator[tuple[str, str]]:
+    """Yield (key, text) for every INFO response of a plugin (or of the plugin of a string table)."""
+    strings_path: Path | None = None
+    if path.suffix.lower() in STRINGS_SUFFIXES:
+        strings_path, path = path, _plugin_for_strings(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Plugin nicht gefunden: {path}")
+
+    with path.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    strings: StringTable | None = None
+    try:
+        if len(mm) < _HEADER_SIZE or mm[:4] != b"TES4":
+            raise ValueError(f"Keine Skyrim-Plugin-Datei: {path}")
+        _, size, flags, _ = _RECORD.unpack_from(mm, 0)
+        if flags & _FLAG_LOCALIZED:
+            strings = StringTable(strings_path or _strings_for_plugin(path))
+
+        pos = _HEADER_SIZE + size
+        end = len(mm)
+        while pos + _HEADER_SIZE <= end:
+            sig, group_size, label, group_type = _GROUP.unpack_from(mm, pos)
+            if sig != b"GRUP":
+                raise ValueError(f"Beschädigte Plugin-Datei {path.name} bei Offset {pos}")
+            if label == b"DIAL" and group_type == 0:
+                yield from _iter_dial_group(mm, pos + _HEADER_SIZE, pos + group_size, strings)
+            pos += group_size
+    finally:
+        if strings is not None:
+            strings.close()
+        mm.close()
+
+
+def count_info_records(path: Path) -> int:
+    """Number of INFO records in a plugin (or the plugin of a string table), from record headers only.
+
+    Nothing is decompressed or looked up, so this is cheap enough to size an index with.
+    """
+    if path.suffix.lower() in STRINGS_SUFFIXES:
+        path = _plugin_for_strings(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Plugin nicht gefunden: {path}")
+    with path.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(mm) < _HEADER_SIZE or mm[:4] != b"TES4":
+            raise ValueError(f"Keine Skyrim-Plugin-Datei: {path}")
+        pos = _HEADER_SIZE + _RECORD.unpack_from(mm, 0)[1]
+        count = 0
+        while pos + _HEADER_SIZE <= len(mm):
+            sig, group_size, label, group_type = _GROUP.unpack_from(mm, pos)
+            if sig != b"GRUP":
+                raise ValueError(f"Beschädigte Plugin-Datei {path.name} bei Offset {pos}")
+            if label == b"DIAL" and group_type == 0:
+                count += _count_infos(mm, pos + _HEADER_SIZE, pos + group_size)
+            pos += group_size
+        return count
+    finally:
+        mm.close()
+
+
+def _count_infos(mm: mmap.mmap, pos: int, end: int) -> int:
+    count = 0
+    while pos + _HEADER_SIZE <= end:
+        sig, size, _, _ = _RECORD.unpack_from(mm, pos)
+        if sig == b"GRUP":
+            count += _count_infos(mm, pos + _HEADER_SIZE, pos + size)
+            pos += size
+            continue
+        if sig == b"INFO":
+            count += 1
+        pos += _HEADER_SIZE + size
+    return count
+
+
+def _iter_dial_group(mm: mmap.mmap, pos: int, end: int, strings: StringTable | None) -> Iterator[tuple[str, str]]:
+    # DIAL records, each followed by a topic children group (type 7) with its INFO records.
+    while pos + _HEADER_SIZE <= end:
+        sig, size, flags, form_id = _RECORD.unpack_from(mm, pos)
+        if sig == b"GRUP":
+            # Descend: the group holds records, its size includes the header.
+            yield from _iter_dial_group(mm, pos + _HEADER_SIZE, pos + size, strings)
+            pos += size
+            continue
+        data_start = pos + _HEADER_SIZE
+        pos = data_start + size
+        if sig != b"INFO":
+            continue
+        if flags & _FLAG_COMPRESSED:
+            try:
+                data: bytes | mmap.mmap = zlib.decompress(mm[data_start + 4 : data_start + size])
+            except zlib.error:
+                continue
+            start, stop = 0, len(data)
+        else:
+            data, start, stop = mm, data_start, data_start + size
+
+        key = f"{form_id & 0xFFFFFF:08X}"
+        first = True
+        for number, raw in _info_responses(data, start, stop):
+            if strings is not None:
+                text = strings.get(struct.unpack("<I", raw[:4])[0]) if len(raw) >= 4 else ""
+            else:
+                text = _decode(raw)
+            if not text:
+                continue
+            if first:
+                yield key, text
+                first = False
+            yield f"{key}_{number}", text
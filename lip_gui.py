@@ -1,20 +1,36 @@
 from __future__ import annotations
 
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
 import os
+import hashlib
+import heapq
+import io
+import itertools
 import json
+import mmap
 import queue
-import random
 import re
+import struct
 import subprocess
 import sys
 import threading
-import webbrowser
-from csv import reader as csv_reader
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from tkinter import BOTH, END, LEFT, RIGHT, X, Y, DISABLED, NORMAL
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+try:
+    from tkinter import BOTH, END, LEFT, RIGHT, X, Y, DISABLED, NORMAL
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
+except ImportError:
+    # Headless build workers (lip_queue.py) only use the batch code; App needs Tk.
+    tk = None  # type: ignore[assignment]
+
+from mapping_parser import iter_delimited_mapping, scan_delimited
 
 
 APP_NAME = "LipGUI"
@@ -70,8 +86,18 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "mapping": "Aus Mapping-Datei (CSV/TSV: Voice Type + File Name → Text)",
         "fixed_text": "Fester Text:",
         "mapping_file": "Mapping-Datei(en):",
+        "workers": "Parallele Prozesse:",
+        "adaptive_workers": "automatisch anpassen",
         "generate": "LIP Dateien generieren",
         "test_mapping": "Mapping testen",
+        "watch": "Ordner überwachen",
+        "more_languages": "Weitere Sprachen…",
+        "languages_title": "Weitere Sprachen",
+        "languages_hint": "Zusätzlich zur Hauptsprache in einem Durchlauf erzeugen. Jede Sprache braucht einen eigenen Output-Ordner; die Mapping-Datei(en) werden nur bei der Textquelle Mapping-Datei verwendet.",
+        "lang_mapping": "Mapping…",
+        "lang_no_mapping": "(keine Mapping-Datei)",
+        "err_lang_output": "Bitte für {lang} einen eigenen Output-Ordner wählen.",
+        "err_lang_mapping": "Bitte für {lang} eine Mapping-Datei auswählen.",
         "pause": "Pause",
         "resume": "Fortsetzen",
         "stop": "Stop",
@@ -81,6 +107,18 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "menu_theme_light": "Hell",
         "menu_theme_dark": "Dunkel",
         "menu_lang": "Sprache",
+        "menu_prewarm": "LipGenerator vorwärmen",
+        "menu_prewarm_off": "Aus",
+        "menu_prewarm_read": "In den Dateicache lesen",
+        "menu_prewarm_copy": "In lokalen Temp-Ordner kopieren",
+        "menu_profile": "Profiling",
+        "menu_profile_off": "Aus",
+        "menu_profile_timers": "Zeiten je Phase",
+        "menu_profile_full": "Zeiten, cProfile und Speicher",
+        "menu_priority": "Priorität der Generator-Prozesse",
+        "menu_priority_normal": "Normal",
+        "menu_priority_below_normal": "Niedriger als normal",
+        "menu_priority_idle": "Niedrig (nur im Leerlauf)",
         "menu_help": "Hilfe",
         "menu_about": "Über…",
         "menu_faq": "FAQ (English)",
@@ -91,7 +129,9 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "err_need_mapping": "Bitte mindestens eine Mapping-Datei auswählen.",
         "info_no_wav": "Keine .wav Dateien gefunden.",
         "stop_requested": "Stop angefordert…",
+        "retry_failed": "Fehlgeschlagene wiederholen",
         "paused": "Pausiert.",
+        "processes_suspended": " {n} Generator-Prozess(e) angehalten.",
         "resumed": "Fortgesetzt.",
         "donate_missing": "Keine Donate-URL konfiguriert.\n\nDu kannst sie in settings.json als 'donate_url' setzen.",
         "about": f"{APP_NAME} {APP_VERSION}\n\nBatch-GUI für LipGenerator.exe (Skyrim).\n\nAuthor: Winnie (rore58)",
@@ -114,8 +154,18 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "mapping": "From mapping file (CSV/TSV: Voice Type + File Name → Text)",
         "fixed_text": "Fixed text:",
         "mapping_file": "Mapping file(s):",
+        "workers": "Parallel processes:",
+        "adaptive_workers": "adjust automatically",
         "generate": "Generate LIP files",
         "test_mapping": "Test mapping",
+        "watch": "Watch folder",
+        "more_languages": "More languages…",
+        "languages_title": "More languages",
+        "languages_hint": "Generate these in the same pass as the main language. Each language needs its own output folder; its mapping file(s) are only used with the mapping file text source.",
+        "lang_mapping": "Mapping…",
+        "lang_no_mapping": "(no mapping file)",
+        "err_lang_output": "Please choose a separate output folder for {lang}.",
+        "err_lang_mapping": "Please select a mapping file for {lang}.",
         "pause": "Pause",
         "resume": "Resume",
         "stop": "Stop",
@@ -125,6 +175,18 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "menu_theme_light": "Light",
         "menu_theme_dark": "Dark",
         "menu_lang": "Language",
+        "menu_prewarm": "Prewarm LipGenerator",
+        "menu_prewarm_off": "Off",
+        "menu_prewarm_read": "Read into file cache",
+        "menu_prewarm_copy": "Copy to local temp folder",
+        "menu_profile": "Profiling",
+        "menu_profile_off": "Off",
+        "menu_profile_timers": "Time per phase",
+        "menu_profile_full": "Times, cProfile and memory",
+        "menu_priority": "Generator process priority",
+        "menu_priority_normal": "Normal",
+        "menu_priority_below_normal": "Below normal",
+        "menu_priority_idle": "Low (idle only)",
         "menu_help": "Help",
         "menu_about": "About…",
         "menu_faq": "FAQ (English)",
@@ -135,7 +197,9 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
         "err_need_mapping": "Please select at least one mapping file.",
         "info_no_wav": "No .wav files found.",
         "stop_requested": "Stop requested…",
+        "retry_failed": "Retry failed",
         "paused": "Paused.",
+        "processes_suspended": " {n} generator process(es) suspended.",
         "resumed": "Resumed.",
         "donate_missing": "No donate URL configured.\n\nYou can set it in settings.json as 'donate_url'.",
         "about": f"{APP_NAME} {APP_VERSION}\n\nBatch GUI for LipGenerator.exe (Skyrim).\n\nAuthor: Winnie (rore58)",
@@ -149,18 +213,240 @@ class Job:
     lip_path: Path
     text: str
     note: str = ""
+    # LipGenerator -Language for this job; empty means the batch language.
+    language: str = ""
+
+
+@dataclass(frozen=True)
+class LanguageTarget:
+    """One language of a multi-language batch: its own mapping files and output root."""
+
+    language: str
+    output_folder: Path
+    mapping_files: tuple[Path, ...] = ()
+
+
+class JobTable(Sequence[Job]):
+    """Column-wise job list for very large batches.
+
+    Folders, texts, notes and languages are stored once in pools and referenced by index from
+    compact arrays, so half a million jobs cost a few dozen MB instead of hundreds. Job objects
+    (with their Paths) are only created when an entry is read, e.g. when a job is dispatched.
+    """
+
+    def __init__(self) -> None:
+        self._dirs: list[str] = []
+        self._dir_ids: dict[str, int] = {}
+        self._texts: list[str] = []
+        self._text_ids: dict[str, int] = {}
+        self._notes: list[str] = [""]
+        self._langs: list[str] = [""]
+        self._wav_dir = array("I")
+        self._wav_name: list[str] = []
+        self._lip_dir = array("I")
+        # Only for jobs whose .lip is not named like the WAV.
+        self._lip_names: dict[int, str] = {}
+        self._text = array("I")
+        self._note = array("B")
+        self._lang = array("B")
+
+    @staticmethod
+    def _pool_id(pool: list[str], ids: dict[str, int], value: str) -> int:
+        found = ids.get(value)
+        if found is None:
+            found = ids[value] = len(pool)
+            pool.append(value)
+        return found
+
+    @staticmethod
+    def _small_id(pool: list[str], value: str) -> int:
+        # Notes and languages: only a handful of distinct values, a list scan is enough.
+        try:
+            return pool.index(value)
+        except ValueError:
+            pool.append(value)
+            return len(pool) - 1
+
+    def append(self, job: Job) -> None:
+        wav_dir, wav_name = os.path.split(str(job.wav_path))
+        lip_dir, lip_name = os.path.split(str(job.lip_path))
+        index = len(self._wav_name)
+        self._wav_dir.append(self._pool_id(self._dirs, self._dir_ids, wav_dir))
+        self._wav_name.append(wav_name)
+        self._lip_dir.append(self._pool_id(self._dirs, self._dir_ids, lip_dir))
+        if lip_name != os.path.splitext(wav_name)[0] + ".lip":
+            self._lip_names[index] = lip_name
+        self._text.append(self._pool_id(self._texts, self._text_ids, job.text))
+        self._note.append(self._small_id(self._notes, job.note))
+        self._lang.append(self._small_id(self._langs, job.language))
+
+    def extend(self, jobs: Iterable[Job]) -> None:
+        for job in jobs:
+            self.append(job)
+
+    def set_text(self, index: int, text: str, note: str = "") -> None:
+        """Change the text (and note) of one job in place."""
+        self._text[index] = self._pool_id(self._texts, self._text_ids, text)
+        self._note[index] = self._small_id(self._notes, note)
+
+    def take(self, indices: Iterable[int]) -> JobTable:
+        """A new table with the given rows; the pools are shared, not copied."""
+        table = JobTable()
+        table._dirs, table._dir_ids = self._dirs, self._dir_ids
+        table._texts, table._text_ids = self._texts, self._text_ids
+        table._notes, table._langs = self._notes, self._langs
+        for index in indices:
+            if index in self._lip_names:
+                table._lip_names[len(table._wav_name)] = self._lip_names[index]
+            table._wav_dir.append(self._wav_dir[index])
+            table._wav_name.append(self._wav_name[index])
+            table._lip_dir.append(self._lip_dir[index])
+            table._text.append(self._text[index])
+            table._note.append(self._note[index])
+            table._lang.append(self._lang[index])
+        return table
+
+    def wav_path(self, index: int) -> Path:
+        return Path(self._dirs[self._wav_dir[index]], self._wav_name[index])
+
+    def lip_folders(self) -> set[Path]:
+        return {Path(self._dirs[i]) for i in set(self._lip_dir)}
+
+    def __len__(self) -> int:
+        return len(self._wav_name)
+
+    def __getitem__(self, index: int) -> Job:  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]  # type: ignore[return-value]
+        if index < 0:
+            index += len(self)
+        wav_name = self._wav_name[index]
+        lip_name = self._lip_names.get(index)
+        if lip_name is None:
+            lip_name = os.path.splitext(wav_name)[0] + ".lip"
+        return Job(
+            wav_path=Path(self._dirs[self._wav_dir[index]], wav_name),
+            lip_path=Path(self._dirs[self._lip_dir[index]], lip_name),
+            text=self._texts[self._text[index]],
+            note=self._notes[self._note[index]],
+            language=self._langs[self._lang[index]],
+        )
+
+
+# Directory mtimes this close to the scan time are not trusted: a file created within the same
+# timestamp tick (2 s on FAT, coarse on some SMB servers) would not change the mtime again.
+_SCAN_MTIME_SLACK_NS = 2_000_000_000
+
+
+class ScanSnapshot:
+    """Directory listings of one input folder keyed by directory mtime, persisted as JSON.
+
+    With a snapshot, find_wav_files only re-lists directories whose mtime changed since the
+    last scan, so rescanning an unchanged tree costs one stat per directory.
+    """
+
+    _VERSION = 1
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        # relative dir ("" = root) -> [mtime_ns or -1, wav names, subdir names]
+        self.dirs: dict[str, list] = {}
+        self.listed = 0
+        self.visited = 0
+        self._dirty = False
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if data.get("version") == self._VERSION:
+                    self.dirs = data.get("dirs", {})
+            except Exception:
+                self.dirs = {}
+
+    @staticmethod
+    def path_for(cache_dir: Path, folder: Path) -> Path:
+        key = str(folder.resolve())
+        if os.name == "nt":
+            key = key.lower()
+        return cache_dir / f"scan-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.json"
+
+    def update(self, dirs: dict[str, list], listed: int, complete: bool) -> None:
+        if complete:
+            self.dirs = dirs
+        else:
+            self.dirs.update(dirs)
+        self.listed = listed
+        self.visited = len(dirs)
+        self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        payload = json.dumps({"version": self._VERSION, "dirs": self.dirs}, ensure_ascii=False)
+        self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # Non-fatal: the next scan just lists everything again.
+            pass
+
+
+def _list_wav_dir(path: str) -> tuple[list[str], list[str]]:
+    wavs: list[str] = []
+    subdirs: list[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.name.lower().endswith(".wav") and entry.is_file():
+                    wavs.append(entry.name)
+            except OSError:
+                continue
+    return wavs, subdirs
 
 
-def find_wav_files(folder: Path, recursive: bool) -> list[Path]:
+def find_wav_files(folder: Path, recursive: bool, snapshot: ScanSnapshot | None = None) -> list[Path]:
+    """All .wav files (any case) in folder, sorted case-insensitively.
+
+    With a snapshot, directories whose mtime is unchanged are taken from it instead of being
+    listed again; the snapshot is updated (call snapshot.save() to persist it).
+    """
     if not folder.exists():
         return []
-    pattern = "**/*.wav" if recursive else "*.wav"
-    files = [p for p in folder.glob(pattern) if p.is_file()]
-    # Case-insensitive safety (glob is case-sensitive on some platforms)
-    files.extend([p for p in folder.glob(pattern.replace(".wav", ".WAV")) if p.is_file()])
-    # De-dup
-    unique: dict[str, Path] = {str(p.resolve()): p for p in files}
-    return sorted(unique.values(), key=lambda p: str(p).lower())
+    previous = snapshot.dirs if snapshot is not None else {}
+    scanned: dict[str, list] = {}
+    files: list[str] = []
+    listed = 0
+    now_ns = time.time_ns()
+    root = str(folder)
+    stack = [""]
+    while stack:
+        rel = stack.pop()
+        path = os.path.join(root, rel) if rel else root
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        entry = previous.get(rel)
+        if entry is not None and entry[0] == mtime_ns:
+            wavs, subdirs = entry[1], entry[2]
+        else:
+            try:
+                wavs, subdirs = _list_wav_dir(path)
+            except OSError:
+                continue
+            listed += 1
+        scanned[rel] = [mtime_ns if now_ns - mtime_ns > _SCAN_MTIME_SLACK_NS else -1, wavs, subdirs]
+        files.extend(os.path.join(path, name) for name in wavs)
+        if recursive:
+            stack.extend(os.path.join(rel, name) if rel else name for name in subdirs)
+    if snapshot is not None:
+        snapshot.update(scanned, listed, complete=recursive)
+    files.sort(key=str.lower)
+    return [Path(p) for p in files]
 
 
 def text_from_filename(wav_path: Path) -> str:
@@ -177,19 +463,62 @@ def text_from_sidecar_txt(wav_path: Path) -> str:
     return content
 
 
-_FORMID_PREFIX_RE = re.compile(r"^([0-9A-Fa-f]{8})")
-_FORMID_ANYWHERE_RE = re.compile(r"([0-9A-Fa-f]{8})")
+def load_sidecar_texts(
+    wav_paths: list[Path],
+    max_workers: int = 8,
+) -> tuple[dict[Path, str], list[str]]:
+    """Read the sidecar .txt of many WAVs in a thread pool.
+
+    Each folder is listed once instead of an exists() call per WAV, which matters on
+    network shares. Returns (texts by WAV path, problems); WAVs with a missing or empty
+    .txt are left out of the texts and reported in problems instead of raising.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
+    by_folder: dict[Path, list[Path]] = {}
+    for wav_path in wav_paths:
+        by_folder.setdefault(wav_path.parent, []).append(wav_path)
 
-def normalize_mapping_key(raw_key: str) -> str:
-    key = raw_key.strip()
-    if not key:
-        return ""
-    key = key.removeprefix("0x").removeprefix("0X").strip()
-    m = _FORMID_PREFIX_RE.match(key)
-    if m:
-        return m.group(1).upper()
-    return key.lower()
+    # Windows file systems are case-insensitive, so Foo.TXT counts as foo.txt there.
+    fold = str.lower if os.name == "nt" else (lambda name: name)
+
+    def _list(folder: Path) -> set[str]:
+        try:
+            with os.scandir(folder) as it:
+                return {fold(e.name) for e in it if e.name.lower().endswith(".txt")}
+        except OSError:
+            return set()
+
+    def _read(txt_path: Path) -> str:
+        try:
+            return txt_path.read_text(encoding="utf-8", errors="replace").strip()
+        except OSError:
+            return ""
+
+    texts: dict[Path, str] = {}
+    problems: list[str] = []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        folders = list(by_folder)
+        to_read: list[tuple[Path, Path]] = []
+        for folder, names in zip(folders, pool.map(_list, folders)):
+            for wav_path in by_folder[folder]:
+                txt_path = wav_path.with_suffix(".txt")
+                if fold(txt_path.name) in names:
+                    to_read.append((wav_path, txt_path))
+                else:
+                    problems.append(f"Fehlende Textdatei: {txt_path}")
+        for (wav_path, txt_path), content in zip(to_read, pool.map(_read, [t for _, t in to_read])):
+            if content:
+                texts[wav_path] = content
+            else:
+                problems.append(f"Textdatei ist leer: {txt_path}")
+    return texts, problems
+
+
+_FORMID_PREFIX_RE = re.compile(r"^([0-9A-Fa-f]{8})")
+_FORMID_ANYWHERE_RE = re.compile(r"([0-9A-Fa-f]{8})")
+# Skyrim voice files: <quest>_<topic>_<INFO FormID>_<response number>.wav
+_FORMID_RESPONSE_RE = re.compile(r"([0-9A-Fa-f]{8})_(\d{1,3})$")
 
 
 def mapping_keys_from_wav(wav_path: Path) -> list[str]:
@@ -208,7 +537,10 @@ def mapping_keys_from_wav(wav_path: Path) -> list[str]:
         keys.append(f"{parent}/{stem.lower()}")
         keys.append(f"{parent}\\{stem.lower()}")
 
-    # 2) FormID patterns
+    # 2) FormID patterns; FormID + response number first (keys of plugin sources, see esp_text)
+    m_response = _FORMID_RESPONSE_RE.search(stem)
+    if m_response:
+        keys.append(f"{m_response.group(1).upper()}_{int(m_response.group(2))}")
     m_prefix = _FORMID_PREFIX_RE.match(stem)
     if m_prefix:
         keys.append(m_prefix.group(1).upper())
@@ -227,147 +559,107 @@ def mapping_keys_from_wav(wav_path: Path) -> list[str]:
     return out
 
 
-def load_text_mapping(mapping_file: Path) -> dict[str, str]:
-    if not mapping_file.exists():
-        raise FileNotFoundError(f"Mapping-Datei nicht gefunden: {mapping_file}")
+def _scan_mapping_file(mapping_file: Path) -> tuple[str, int]:
+    """Return (delimiter, line count) of a mapping file without holding it in memory.
 
-    raw = mapping_file.read_text(encoding="utf-8", errors="replace")
-    # Heuristic delimiter detection: prefer tab, then semicolon, then comma
-    delimiter = "\t" if "\t" in raw else (";" if ";" in raw and "," not in raw else ",")
-
-    rows = [r for r in csv_reader(raw.splitlines(), delimiter=delimiter) if any((c or "").strip() for c in r)]
-    if not rows:
-        raise ValueError("Mapping-Datei ist leer.")
-
-    def _norm_header(name: str) -> str:
-        # Keep '-' so we can still do substring checks like 'dialogue2-german'
-        return name.strip().lower().replace(" ", "").replace("_", "")
-
-    header = [_norm_header(c) for c in rows[0]]
-    has_header = any(
-        token in header
-        for token in {
-            "formid",
-            "id",
-            "key",
-            "filename",
-            "file",
-            "wav",
-            "path",
-            "voicefile",
-            "subtitle",
-            "text",
-            "dialogue",
-            "translated",
-            "translation",
-            "target",
-        }
-    )
+    For plugin sources (no delimiter) the count is an estimate of the pairs they yield: the key
+    and the first response per INFO record (build_mapped_text_mapping grows if there are more).
+    """
+    if _is_plugin_source(mapping_file):
+        from esp_text import count_info_records
 
-    key_idx: int | None = None
-    text_idx: int | None = None
-    voice_idx: int | None = None
+        return "", 2 * count_info_records(mapping_file) + 1
+    if mapping_file.suffix.lower() == ".xml":
+        # Each <String> yields at most two pairs (FormID and FormID_N).
+        strings = 0
+        with mapping_file.open("rb") as f:
+            tail = b""
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                strings += (tail + chunk).count(b"<String ") - tail.count(b"<String ")
+                tail = chunk[-7:]
+        return "", 2 * strings + 1
+    return scan_delimited(mapping_file)
 
-    if has_header:
-        def _first_index(candidates: set[str]) -> int | None:
-            for i, col in enumerate(header):
-                if col in candidates:
-                    return i
-            return None
 
-        def _first_index_contains(needles: list[str]) -> int | None:
-            for i, col in enumerate(header):
-                for needle in needles:
-                    if needle in col:
-                        return i
-            return None
+# esp_text.PLUGIN_SUFFIXES | STRINGS_SUFFIXES, without importing it for every CSV.
+_PLUGIN_SOURCE_SUFFIXES = (".esp", ".esm", ".esl", ".strings", ".dlstrings", ".ilstrings")
 
-        key_idx = _first_index({"formid", "id", "key"})
-        if key_idx is None:
-            key_idx = _first_index({"filename", "file", "wav", "path", "voicefile"})
-        if key_idx is None:
-            key_idx = _first_index_contains(["filename", "file", "wav", "path", "voice"])
-
-        voice_idx = _first_index({"voicetype", "voice", "voicename"})
-        if voice_idx is None:
-            voice_idx = _first_index_contains(["voicetype", "voice"])
-
-        # Prefer translated/target text columns, fall back to subtitle/text
-        text_idx = _first_index({"translated", "translation", "target", "targettext", "translatedtext"})
-        if text_idx is None:
-            text_idx = _first_index({"subtitle", "subtitles", "text", "dialogue", "line"})
-        if text_idx is None:
-            # Handles headers like "Dialogue2-German" / "Dialogue 2 - German"
-            text_idx = _first_index_contains([
-                "translated",
-                "translation",
-                "target",
-                "subtitle",
-                "dialogue",
-                "text",
-            ])
-
-        # If both detected but point to same column, prefer finding another text column
-        if key_idx is not None and text_idx is not None and key_idx == text_idx:
-            alt = _first_index_contains(["dialogue", "subtitle", "translated", "target", "text"])
-            if alt is not None and alt != key_idx:
-                text_idx = alt
-
-    start_row = 1 if has_header else 0
-
-    def _extract_key(cell: str) -> str:
-        raw_cell = (cell or "").strip()
-        if not raw_cell:
-            return ""
-        # If it's a path or filename, reduce to stem
-        lowered = raw_cell.lower()
-        if "\\" in raw_cell or "/" in raw_cell or lowered.endswith(".wav"):
-            try:
-                stem = Path(raw_cell).stem
-            except Exception:
-                stem = raw_cell
-            return normalize_mapping_key(stem)
-        return normalize_mapping_key(raw_cell)
 
-    mapping: dict[str, str] = {}
-    for row in rows[start_row:]:
-        if not row:
-            continue
+def _is_plugin_source(path: Path) -> bool:
+    return path.suffix.lower() in _PLUGIN_SOURCE_SUFFIXES
 
-        # Fallback behavior: if we couldn't detect indices, use first two columns
-        if key_idx is None or text_idx is None:
-            if len(row) < 2:
-                continue
-            raw_key, raw_text = row[0], row[1]
-            raw_voice = ""
-        else:
-            if key_idx >= len(row) or text_idx >= len(row):
-                continue
-            raw_key, raw_text = row[key_idx], row[text_idx]
-            raw_voice = row[voice_idx] if (has_header and voice_idx is not None and voice_idx < len(row)) else ""
 
-        key = _extract_key(str(raw_key))
-        if not key:
-            continue
+# File dialog filters for mapping files. Both cases, since Tk matches case-sensitively on Linux
+# and the games ship e.g. Skyrim_English.STRINGS.
+MAPPING_FILETYPES = [
+    ("CSV/TSV", "*.csv *.tsv *.txt"),
+    ("xTranslator XML", "*.xml"),
+    ("Plugins/Strings", " ".join(f"*{s} *{s.upper()}" for s in _PLUGIN_SOURCE_SUFFIXES)),
+    ("Alle Dateien", "*.*"),
+]
 
-        text = str(raw_text).strip()
-        if not text:
-            continue
 
-        # Ignore header-ish rows even if delimiter guessing failed
-        if key in {"formid", "id", "key", "filename", "file", "wav", "path", "voicefile"}:
-            continue
+def iter_text_mapping(mapping_file: Path, delimiter: str | None = None) -> Iterator[tuple[str, str]]:
+    """Yield (key, text) pairs of a mapping file in file order, streaming row by row.
 
-        mapping[key] = text
+    Skyrim plugins and their string tables are read with esp_text, .xml files as xTranslator
+    dictionaries (iter_xtranslator_xml), everything else as CSV/TSV.
 
-        # Extra composite keys for LazyVoiceFinder-style exports:
-        # Voice Type (folder) + File Name stem
-        voice = str(raw_voice).strip().lower()
-        if voice:
-            # When key is a stem-like string, prefer composing with that
-            # (If key is already a FormID, this still doesn't hurt; it just won't match most WAVs.)
-            mapping[f"{voice}/{key}"] = text
-            mapping[f"{voice}\\{key}"] = text
+    Later pairs override earlier ones with the same key (see load_text_mapping).
+    """
+    if not mapping_file.exists():
+        raise FileNotFoundError(f"Mapping-Datei nicht gefunden: {mapping_file}")
+    if _is_plugin_source(mapping_file):
+        from esp_text import iter_plugin_texts
+
+        yield from iter_plugin_texts(mapping_file)
+        return
+    if mapping_file.suffix.lower() == ".xml":
+        yield from iter_xtranslator_xml(mapping_file)
+        return
+    yield from iter_delimited_mapping(mapping_file, delimiter)
+
+
+def iter_xtranslator_xml(xml_file: Path) -> Iterator[tuple[str, str]]:
+    """Yield (key, text) for the dialogue responses (INFO:NAM1) of an xTranslator XML dictionary.
+
+    Streams the file with iterparse and drops every <String> once it is handled, so memory
+    grows with the mapping, not with the XML tree. Keys match esp_text: the FormID (sID,
+    load-order byte cleared) and FormID_<response number>; the text is <Dest>, or <Source>
+    for untranslated entries.
+    """
+    from xml.etree.ElementTree import ParseError, iterparse
+
+    parents: list[object] = []
+    try:
+        for event, elem in iterparse(str(xml_file), events=("start", "end")):
+            if event == "start":
+                parents.append(elem)
+                continue
+            parents.pop()
+            if elem.tag != "String":
+                continue
+            rec = elem.find("REC")
+            sid = elem.get("sID", "")
+            if rec is not None and (rec.text or "").strip() == "INFO:NAM1" and _FORMID_PREFIX_RE.match(sid):
+                text = (elem.findtext("Dest") or "").strip() or (elem.findtext("Source") or "").strip()
+                if text:
+                    key = f"{int(sid[:8], 16) & 0xFFFFFF:08X}"
+                    number = int(rec.get("id", "0") or 0) + 1
+                    if number == 1:
+                        yield key, text
+                    yield f"{key}_{number}", text
+            # Drop the handled entry from its parent (<Content>) so the tree stays small.
+            if parents:
+                parents[-1].clear()  # type: ignore[attr-defined]
+    except ParseError as exc:
+        raise ValueError(f"xTranslator-XML nicht lesbar ({xml_file.name}): {exc}") from exc
+
+
+def load_text_mapping(mapping_file: Path) -> dict[str, str]:
+    mapping: dict[str, str] = {}
+    for key, text in iter_text_mapping(mapping_file):
+        mapping[key] = text
 
     if not mapping:
         raise ValueError(
@@ -393,6 +685,504 @@ def load_text_mappings(files: list[Path]) -> dict[str, str]:
     return merge_text_mappings(mappings)
 
 
+# On-disk mapping index: "<name>.idx" holds a header plus an open-addressing hash table of
+# fixed-size slots, "<name>.data" holds the key/text records the slots point to.
+_MAPPED_MAGIC = b"LIPMAP02"
+_MAPPED_HEADER = struct.Struct("<8sQQ")  # magic, slot count, entry count
+# key hash, data offset + 1 (0 = empty), text length, source file no., and while building: the
+# offset + 1 and text length of the value the earlier files agreed on (0 = none).
+_MAPPED_SLOT = struct.Struct("<QQIIQI")
+_MAPPED_RECORD = struct.Struct("<II")  # key bytes, text bytes
+MAPPED_MAPPING_THRESHOLD = 64 * 1024 * 1024
+
+
+def _mapped_hash(key: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+class MappedTextMapping(Mapping[str, str]):
+    """Read-only text mapping that resolves keys directly against a memory-mapped index.
+
+    Only the pages touched by lookups are loaded, so the Python heap stays flat no matter
+    how large the underlying mapping files are. Build one with build_mapped_text_mapping.
+    """
+
+    def __init__(self, index_path: Path) -> None:
+        self.index_path = index_path
+        self._files = [index_path.open("rb"), index_path.with_suffix(".data").open("rb")]
+        try:
+            self._slots = mmap.mmap(self._files[0].fileno(), 0, access=mmap.ACCESS_READ)
+            self._data = mmap.mmap(self._files[1].fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.close()
+            raise
+        magic, self._slot_count, self._entry_count = _MAPPED_HEADER.unpack_from(self._slots, 0)
+        if magic != _MAPPED_MAGIC or self._slot_count == 0:
+            self.close()
+            raise ValueError(f"Ungültiger Mapping-Index: {index_path}")
+
+    def _find(self, key: bytes) -> int:
+        """Return the data offset of key's record, or -1."""
+        h = _mapped_hash(key)
+        slot = h % self._slot_count
+        base = _MAPPED_HEADER.size
+        while True:
+            slot_hash, ref, *_ = _MAPPED_SLOT.unpack_from(self._slots, base + slot * _MAPPED_SLOT.size)
+            if ref == 0:
+                return -1
+            if slot_hash == h:
+                off = ref - 1
+                key_len, _ = _MAPPED_RECORD.unpack_from(self._data, off)
+                start = off + _MAPPED_RECORD.size
+                if key_len == len(key) and self._data[start:start + key_len] == key:
+                    return off
+            slot = (slot + 1) % self._slot_count
+
+    def __getitem__(self, key: str) -> str:
+        off = self._find(key.encode("utf-8"))
+        if off < 0:
+            raise KeyError(key)
+        key_len, text_len = _MAPPED_RECORD.unpack_from(self._data, off)
+        start = off + _MAPPED_RECORD.size + key_len
+        return self._data[start:start + text_len].decode("utf-8")
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key.encode("utf-8")) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        base = _MAPPED_HEADER.size
+        for slot in range(self._slot_count):
+            _, ref, *_ = _MAPPED_SLOT.unpack_from(self._slots, base + slot * _MAPPED_SLOT.size)
+            if ref:
+                off = ref - 1
+                key_len, _ = _MAPPED_RECORD.unpack_from(self._data, off)
+                start = off + _MAPPED_RECORD.size
+                yield self._data[start:start + key_len].decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._entry_count
+
+    def close(self) -> None:
+        """Release the maps and files; safe to call more than once."""
+        for m in (getattr(self, "_slots", None), getattr(self, "_data", None)):
+            if m is not None:
+                m.close()
+        for f in self._files:
+            f.close()
+
+
+def close_text_mapping(mapping: Mapping[str, str] | None) -> None:
+    """Close a mapping from open_mapped_text_mapping; in-memory dicts need nothing."""
+    if isinstance(mapping, MappedTextMapping):
+        mapping.close()
+
+
+def mapped_index_path(files: list[Path], cache_dir: Path) -> Path:
+    """Cache location of the index for these mapping files; changes whenever a file does."""
+    digest = hashlib.sha1(_MAPPED_MAGIC)
+    for p in files:
+        st = p.stat()
+        digest.update(f"{p.resolve()}|{st.st_size}|{st.st_mtime_ns}\n".encode("utf-8"))
+    return cache_dir / f"mapping-{digest.hexdigest()[:16]}.idx"
+
+
+def build_mapped_text_mapping(files: list[Path], index_path: Path) -> MappedTextMapping:
+    """Stream the mapping files into an on-disk index with the merge rules of load_text_mappings.
+
+    Within one file later rows win, across files the longer text wins: the first row of a file
+    for a key parks the value of the earlier files in the slot, and once the file is done the
+    file's last value only stays if it is longer. Slots are matched by hash and full key bytes.
+    """
+    if not files:
+        raise ValueError("Bitte mindestens eine Mapping-Datei auswählen.")
+    for p in files:
+        if not p.exists():
+            raise FileNotFoundError(f"Mapping-Datei nicht gefunden: {p}")
+    scans = [_scan_mapping_file(p) for p in files]
+    # Up to three keys per row (key + two composite Voice Type keys), load factor <= 0.5. Plugin
+    # and XML counts are estimates; the table doubles whenever it gets more than half full.
+    slot_count = max(1024, 6 * sum(lines for _, lines in scans))
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    data_path = index_path.with_suffix(".data")
+    tmp_index = index_path.with_name(index_path.name + ".tmp")
+    tmp_data = data_path.with_name(data_path.name + ".tmp")
+    base = _MAPPED_HEADER.size
+    slot_size = _MAPPED_SLOT.size
+
+    entries = 0
+    fi = tmp_index.open("w+b")
+    slots: mmap.mmap | None = None
+    try:
+        fi.truncate(base + slot_count * slot_size)
+        slots = mmap.mmap(fi.fileno(), 0)
+        with tmp_data.open("wb") as fd, tmp_data.open("rb") as fr:
+            data_off = 0
+            flushed = 0
+            for source_no, (path, (delimiter, _)) in enumerate(zip(files, scans)):
+                rows_in_file = 0
+                # Slots that parked an earlier file's value during this file.
+                parked = array("Q")
+                for key, text in iter_text_mapping(path, delimiter=delimiter):
+                    rows_in_file += 1
+                    kb = key.encode("utf-8")
+                    h = _mapped_hash(kb)
+                    slot = h % slot_count
+                    while True:
+                        pos = base + slot * slot_size
+                        slot_hash, ref, old_len, old_source, prev_ref, prev_len = _MAPPED_SLOT.unpack_from(slots, pos)
+                        if ref == 0:
+                            break
+                        if slot_hash == h:
+                            # Same hash: compare the stored key, flushing pending writes if it's among them.
+                            if ref - 1 + _MAPPED_RECORD.size + len(kb) > flushed:
+                                fd.flush()
+                                flushed = data_off
+                            fr.seek(ref - 1)
+                            key_len, _ = _MAPPED_RECORD.unpack(fr.read(_MAPPED_RECORD.size))
+                            if key_len == len(kb) and fr.read(key_len) == kb:
+                                break
+                        slot = (slot + 1) % slot_count
+                    if not ref:
+                        entries += 1
+                    elif old_source != source_no:
+                        prev_ref, prev_len = ref, old_len
+                        parked.append(pos)
+                    tb = text.encode("utf-8")
+                    fd.write(_MAPPED_RECORD.pack(len(kb), len(tb)))
+                    fd.write(kb)
+                    fd.write(tb)
+                    _MAPPED_SLOT.pack_into(slots, pos, h, data_off + 1, len(text), source_no, prev_ref, prev_len)
+                    data_off += _MAPPED_RECORD.size + len(kb) + len(tb)
+                    if entries * 2 > slot_count:
+                        fi, slots, parked = _grow_mapped_slots(fi, slots, slot_count, parked)
+                        slot_count *= 2
+                if rows_in_file == 0:
+                    raise ValueError(
+                        "Mapping-Datei enthält keine verwertbaren Zeilen. Erwartet wird entweder: "
+                        "(a) 2 Spalten: ID<TAB>Text oder (b) CSV/TSV mit Header-Spalten wie FormID/FileName + Text/Subtitle."
+                    )
+                # This file's last value per key is final now; it replaces the earlier files' only if longer.
+                for pos in parked:
+                    h, ref, text_len, _, prev_ref, prev_len = _MAPPED_SLOT.unpack_from(slots, pos)
+                    if text_len <= prev_len:
+                        ref, text_len = prev_ref, prev_len
+                    _MAPPED_SLOT.pack_into(slots, pos, h, ref, text_len, source_no, 0, 0)
+        _MAPPED_HEADER.pack_into(slots, 0, _MAPPED_MAGIC, slot_count, entries)
+        slots.flush()
+    except BaseException:
+        if slots is not None:
+            slots.close()
+        fi.close()
+        Path(fi.name).unlink(missing_ok=True)
+        tmp_data.unlink(missing_ok=True)
+        raise
+    slots.close()
+    fi.close()
+
+    # The index is replaced last so its presence means the data file is complete.
+    os.replace(tmp_data, data_path)
+    os.replace(fi.name, index_path)
+    return MappedTextMapping(index_path)
+
+
+def _grow_mapped_slots(
+    fi: io.BufferedRandom, slots: mmap.mmap, slot_count: int, parked: array[int]
+) -> tuple[io.BufferedRandom, mmap.mmap, array[int]]:
+    """Rehash a slot table under construction into one twice the size, in a sibling file.
+
+    Keys are already unique, so each occupied slot moves by its stored hash without touching
+    the data file. Returns the new file, its map and the new positions of the parked slots.
+    The old file is deleted; the builder renames whichever file it ends up with.
+    """
+    base = _MAPPED_HEADER.size
+    slot_size = _MAPPED_SLOT.size
+    new_count = slot_count * 2
+    old_path = Path(fi.name)
+    new_path = old_path.with_name(old_path.stem + (".tmp" if old_path.suffix == ".grow" else ".grow"))
+    moved = dict.fromkeys(parked, 0)
+
+    nf = new_path.open("w+b")
+    try:
+        nf.truncate(base + new_count * slot_size)
+        grown = mmap.mmap(nf.fileno(), 0)
+    except Exception:
+        nf.close()
+        raise
+    for slot in range(slot_count):
+        pos = base + slot * slot_size
+        h, ref, *_ = _MAPPED_SLOT.unpack_from(slots, pos)
+        if not ref:
+            continue
+        new_slot = h % new_count
+        while _MAPPED_SLOT.unpack_from(grown, base + new_slot * slot_size)[1]:
+            new_slot = (new_slot + 1) % new_count
+        new_pos = base + new_slot * slot_size
+        grown[new_pos : new_pos + slot_size] = slots[pos : pos + slot_size]
+        if pos in moved:
+            moved[pos] = new_pos
+
+    slots.close()
+    fi.close()
+    old_path.unlink()
+    return nf, grown, array("Q", (moved[pos] for pos in parked))
+
+
+def open_mapped_text_mapping(files: list[Path], cache_dir: Path) -> MappedTextMapping:
+    """Open the cached index for these mapping files, building it first if needed.
+
+    Next to each index, "<name>.json" lists its source files; after a build, indexes whose
+    sources changed or are gone (and those of an older layout) are deleted.
+    """
+    index_path = mapped_index_path(files, cache_dir)
+    if index_path.exists() and index_path.with_suffix(".data").exists():
+        try:
+            return MappedTextMapping(index_path)
+        except Exception:
+            pass
+    mapping = build_mapped_text_mapping(files, index_path)
+    try:
+        index_path.with_suffix(".json").write_text(
+            json.dumps([_mapped_source(p) for p in files], ensure_ascii=False), encoding="utf-8"
+        )
+    except OSError:
+        pass
+    _prune_mapped_indexes(cache_dir, keep=index_path)
+    return mapping
+
+
+def _mapped_source(path: Path) -> list[object]:
+    st = path.stat()
+    return [str(path.resolve()), st.st_size, st.st_mtime_ns]
+
+
+def _mapped_index_stale(index_path: Path) -> bool:
+    try:
+        with index_path.open("rb") as f:
+            if f.read(len(_MAPPED_MAGIC)) != _MAPPED_MAGIC:
+                return True
+        sources = json.loads(index_path.with_suffix(".json").read_text(encoding="utf-8"))
+        return any(_mapped_source(Path(source[0])) != source for source in sources)
+    except (OSError, ValueError, TypeError, IndexError):
+        return True
+
+
+def _prune_mapped_indexes(cache_dir: Path, keep: Path) -> None:
+    """Delete cached indexes other than `keep` that no longer match their source files.
+
+    Day-old leftovers of interrupted builds go too. Files still open elsewhere (Windows) are
+    kept until the next build.
+    """
+    stale: list[Path] = []
+    for index_path in cache_dir.glob("mapping-*.idx"):
+        if index_path != keep and _mapped_index_stale(index_path):
+            stale += [index_path, index_path.with_suffix(".data"), index_path.with_suffix(".json")]
+    # Another LipGUI may be building right now, so only leftovers older than a day count.
+    cutoff = time.time() - 86400
+    for pattern in ("mapping-*.tmp", "mapping-*.grow"):
+        for path in cache_dir.glob(pattern):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    stale.append(path)
+            except OSError:
+                pass
+    for path in stale:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"\x02{text}\x03"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class KeyIndex:
+    """Trigram index over the plain mapping keys for near-miss suggestions.
+
+    Only keys without a voice type prefix are indexed: a WAV whose stem exists as a plain key is
+    always a hit, so misses can only come from stem differences. Each query only walks the
+    posting lists of its rarest trigrams (up to `budget` entries in total) and scores at most
+    `candidates` keys exactly, so its cost does not grow with the number of keys.
+    """
+
+    def __init__(self, keys: list[str], postings: dict[str, array[int]]) -> None:
+        self.keys = keys
+        self._postings = postings
+
+    @classmethod
+    def build(cls, mapping: Mapping[str, str], stop_event: threading.Event | None = None) -> KeyIndex:
+        keys: list[str] = []
+        postings: dict[str, array[int]] = {}
+        for key in mapping:
+            if "/" in key or "\\" in key:
+                continue
+            key_id = len(keys)
+            keys.append(key)
+            for gram in _trigrams(key.lower()):
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array("I")
+                posting.append(key_id)
+            if stop_event is not None and not key_id % 50_000 and stop_event.is_set():
+                break
+        return cls(keys, postings)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def suggest(
+        self,
+        query: str,
+        top_k: int = 3,
+        min_score: float = 0.5,
+        budget: int = 5_000,
+        candidates: int = 64,
+    ) -> list[tuple[str, float]]:
+        """Return up to top_k (key, score) pairs, score being the Dice coefficient of the trigrams."""
+        from collections import Counter
+
+        query = query.lower()
+        grams = _trigrams(query)
+        lists = sorted((self._postings[g] for g in grams if g in self._postings), key=len)
+        if not lists:
+            return []
+        used = 0
+        for n, posting in enumerate(lists):
+            if n >= 2 and used + len(posting) > budget:
+                lists = lists[:n]
+                break
+            used += len(posting)
+        counts = Counter(itertools.chain.from_iterable(lists))
+        # Keys that share less than half of the best candidate's trigrams rarely make the top k.
+        floor = max(counts.values()) // 2
+        shortlist = heapq.nlargest(candidates, (item for item in counts.items() if item[1] > floor), key=lambda item: item[1])
+        scored: list[tuple[float, str]] = []
+        for key_id, _ in shortlist:
+            key = self.keys[key_id]
+            key_grams = _trigrams(key.lower())
+            score = 2 * len(grams & key_grams) / (len(grams) + len(key_grams))
+            if score >= min_score:
+                scored.append((score, key))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(key, score) for score, key in scored[:top_k]]
+
+
+def suggest_fix(stem: str, key: str) -> str:
+    """Describe how `stem` differs from `key` as a replace rule, e.g. "Ende: '01' → '1'".
+
+    The comparison works on "_"-separated tokens so that similar misses produce the same
+    rule and can be counted together.
+    """
+    old_tokens, new_tokens = stem.lower().split("_"), key.lower().split("_")
+    prefix = 0
+    while prefix < min(len(old_tokens), len(new_tokens)) and old_tokens[prefix] == new_tokens[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < min(len(old_tokens), len(new_tokens)) - prefix
+        and old_tokens[-1 - suffix] == new_tokens[-1 - suffix]
+    ):
+        suffix += 1
+    old = "_".join(old_tokens[prefix : len(old_tokens) - suffix])
+    new = "_".join(new_tokens[prefix : len(new_tokens) - suffix])
+    if prefix and not suffix:
+        where = "Ende"
+    elif suffix and not prefix:
+        where = "Anfang"
+    elif prefix:
+        where = "Mitte"
+    else:
+        where = "Name"
+    return f"{where}: '{old}' → '{new}'"
+
+
+@dataclass
+class CoverageMiss:
+    wav_path: Path
+    voice: str
+    suggestions: list[tuple[str, float]]
+
+
+@dataclass
+class CoverageReport:
+    hits: dict[str, int]
+    totals: dict[str, int]
+    misses: list[CoverageMiss]
+
+    def suggest(
+        self,
+        index: KeyIndex,
+        top_k: int = 3,
+        stop_event: threading.Event | None = None,
+        progress: Callable[[int], None] | None = None,
+    ) -> None:
+        """Fill in the closest mapping keys for every miss."""
+        for n, miss in enumerate(self.misses, start=1):
+            if stop_event is not None and stop_event.is_set():
+                break
+            miss.suggestions = index.suggest(miss.wav_path.stem, top_k=top_k)
+            if progress is not None and not n % 100:
+                progress(n)
+        if progress is not None:
+            progress(len(self.misses))
+
+    def fixes(self, voice: str | None = None, limit: int = 5) -> list[tuple[str, int]]:
+        """Most common replace rules between missing stems and their best suggestion."""
+        from collections import Counter
+
+        rules = Counter(
+            suggest_fix(m.wav_path.stem, m.suggestions[0][0])
+            for m in self.misses
+            if m.suggestions and (voice is None or m.voice == voice)
+        )
+        return rules.most_common(limit)
+
+
+def build_coverage_report(mapping: Mapping[str, str], wav_files: list[Path]) -> CoverageReport:
+    """Hit rate per voice type (WAV parent folder); see CoverageReport.suggest for the misses."""
+    hits: dict[str, int] = {}
+    totals: dict[str, int] = {}
+    misses: list[CoverageMiss] = []
+    for wav_path in wav_files:
+        voice = wav_path.parent.name
+        totals[voice] = totals.get(voice, 0) + 1
+        if any(mapping.get(k, "").strip() for k in mapping_keys_from_wav(wav_path)):
+            hits[voice] = hits.get(voice, 0) + 1
+        else:
+            misses.append(CoverageMiss(wav_path, voice, []))
+    return CoverageReport(hits, totals, misses)
+
+
+def write_coverage_report(report: CoverageReport, path: Path) -> None:
+    """Write the per voice type table, the most common fixes and all misses as text."""
+    lines = ["Voice Type\tTreffer\tWAVs\tQuote"]
+    for voice in sorted(report.totals, key=lambda v: (report.hits.get(v, 0) / report.totals[v], v)):
+        hit, total = report.hits.get(voice, 0), report.totals[voice]
+        lines.append(f"{voice}\t{hit}\t{total}\t{hit / total:.1%}")
+    lines += ["", "Häufigste Abweichungen (WAV-Name → Mapping-Key):"]
+    for rule, count in report.fixes(limit=20):
+        lines.append(f"{count}\t{rule}")
+    lines += ["", "Ohne Treffer\tVoice Type\tVorschläge"]
+    for miss in report.misses:
+        proposals = ", ".join(f"{key} ({score:.2f})" for key, score in miss.suggestions)
+        lines.append(f"{miss.wav_path}\t{miss.voice}\t{proposals}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _sidecar_texts_or_raise(wav_files: list[Path], problems: list[str] | None) -> dict[Path, str]:
+    texts, missing = load_sidecar_texts(wav_files)
+    if missing and problems is None:
+        shown = "\n".join(missing[:20])
+        more = f"\n… und {len(missing) - 20} weitere" if len(missing) > 20 else ""
+        raise ValueError(f"{len(missing)} Textdatei(en) fehlen oder sind leer:\n{shown}{more}")
+    if problems is not None:
+        problems.extend(missing)
+    return texts
+
+
 def build_jobs(
     input_folder: Path,
     output_folder: Path,
@@ -401,189 +1191,2904 @@ def build_jobs(
     text_source: str,
     fixed_text: str,
     mapping_file: Path | None,
-) -> list[Job]:
+    mapping: Mapping[str, str] | None = None,
+    problems: list[str] | None = None,
+) -> JobTable:
+    """Build one job per WAV in input_folder.
+
+    For TextSource.SIDECAR_TXT, WAVs without usable .txt are collected: if `problems` is
+    given they are skipped and reported there, otherwise one ValueError lists all of them.
+    """
     wav_files = find_wav_files(input_folder, recursive)
 
-    mapping: dict[str, str] | None = None
-    if text_source == TextSource.MAPPING_FILE:
+    jobs = JobTable()
+    if text_source == TextSource.SIDECAR_TXT:
+        texts = _sidecar_texts_or_raise(wav_files, problems)
+        jobs.extend(
+            build_job(wav_path, input_folder, output_folder, preserve_structure, text_source, fixed_text, None, text=texts[wav_path])
+            for wav_path in wav_files
+            if wav_path in texts
+        )
+        return jobs
+
+    if text_source == TextSource.MAPPING_FILE and mapping is None:
         if mapping_file is None:
             raise ValueError("Bitte eine Mapping-Datei auswählen.")
         mapping = load_text_mapping(mapping_file)
 
-    jobs: list[Job] = []
-    for wav_path in wav_files:
-        if preserve_structure:
-            rel = wav_path.relative_to(input_folder)
-            lip_path = (output_folder / rel).with_suffix(".lip")
-        else:
-            lip_path = (output_folder / f"{wav_path.stem}.lip")
+    jobs.extend(
+        build_job(wav_path, input_folder, output_folder, preserve_structure, text_source, fixed_text, mapping)
+        for wav_path in wav_files
+    )
+    return jobs
+
+
+def build_language_jobs(
+    input_folder: Path,
+    recursive: bool,
+    preserve_structure: bool,
+    text_source: str,
+    fixed_text: str,
+    targets: list[LanguageTarget],
+    mappings: Mapping[tuple[Path, ...], Mapping[str, str]] | None = None,
+    problems: list[str] | None = None,
+    wav_files: list[Path] | None = None,
+) -> JobTable:
+    """Build the jobs of several languages from one scan of input_folder.
+
+    The WAV list and sidecar texts are shared; for TextSource.MAPPING_FILE each target looks
+    up its text in mappings[target.mapping_files]. Missing sidecar texts are handled as in
+    build_jobs. Pass `wav_files` to reuse an existing scan.
+    """
+    if wav_files is None:
+        wav_files = find_wav_files(input_folder, recursive)
+
+    texts: dict[Path, str] | None = None
+    if text_source == TextSource.SIDECAR_TXT:
+        texts = _sidecar_texts_or_raise(wav_files, problems)
+        wav_files = [p for p in wav_files if p in texts]
+
+    jobs = JobTable()
+    for target in targets:
+        mapping: Mapping[str, str] | None = None
+        if text_source == TextSource.MAPPING_FILE:
+            mapping = (mappings or {}).get(target.mapping_files)
+            if mapping is None:
+                raise ValueError(f"Keine Mapping-Datei für {target.language} ausgewählt.")
+        jobs.extend(
+            build_job(
+                wav_path,
+                input_folder,
+                target.output_folder,
+                preserve_structure,
+                text_source,
+                fixed_text,
+                mapping,
+                text=texts[wav_path] if texts is not None else None,
+                language=target.language,
+            )
+            for wav_path in wav_files
+        )
+    return jobs
+
+
+def build_job(
+    wav_path: Path,
+    input_folder: Path,
+    output_folder: Path,
+    preserve_structure: bool,
+    text_source: str,
+    fixed_text: str,
+    mapping: Mapping[str, str] | None,
+    text: str | None = None,
+    language: str = "",
+) -> Job:
+    """Build the job for one WAV (see build_jobs). `text` skips the text source lookup."""
+    if preserve_structure:
+        rel = wav_path.relative_to(input_folder)
+        lip_path = (output_folder / rel).with_suffix(".lip")
+    else:
+        lip_path = (output_folder / f"{wav_path.stem}.lip")
 
-        note = ""
+    note = ""
 
-        if text_source == TextSource.FILENAME:
+    if text is not None:
+        pass
+    elif text_source == TextSource.FILENAME:
+        text = text_from_filename(wav_path)
+    elif text_source == TextSource.SIDECAR_TXT:
+        text = text_from_sidecar_txt(wav_path)
+    elif text_source == TextSource.FIXED:
+        text = fixed_text.strip()
+        if not text:
+            raise ValueError("Der feste Text ist leer.")
+    elif text_source == TextSource.MAPPING_FILE:
+        assert mapping is not None
+        text = ""
+        for key in mapping_keys_from_wav(wav_path):
+            text = mapping.get(key, "").strip()
+            if text:
+                break
+        if not text:
+            # Fallback: still produce something usable, but warn.
             text = text_from_filename(wav_path)
-        elif text_source == TextSource.SIDECAR_TXT:
-            text = text_from_sidecar_txt(wav_path)
-        elif text_source == TextSource.FIXED:
-            text = fixed_text.strip()
-            if not text:
-                raise ValueError("Der feste Text ist leer.")
-        elif text_source == TextSource.MAPPING_FILE:
-            assert mapping is not None
-            text = ""
-            for key in mapping_keys_from_wav(wav_path):
-                text = mapping.get(key, "").strip()
-                if text:
+            note = "WARN: Kein Mapping-Eintrag gefunden, nutze Dateiname als Text."
+    else:
+        raise ValueError("Unbekannte Textquelle.")
+
+    return Job(wav_path=wav_path, lip_path=lip_path, text=text, note=note, language=language)
+
+
+@dataclass(frozen=True)
+class WavInfo:
+    """RIFF/WAVE header facts of one file. `error` means LipGenerator can't use it."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    format_tag: int = 0
+    channels: int = 0
+    sample_rate: int = 0
+    bits_per_sample: int = 0
+    duration: float = 0.0
+    error: str = ""
+    warning: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+LIPGEN_SAMPLE_RATES = (11025, 16000, 22050, 32000, 44100, 48000)
+_WAV_FMT = struct.Struct("<HHIIHH")  # format tag, channels, sample rate, byte rate, block align, bits
+
+
+def probe_wav(wav_path: Path, st: os.stat_result | None = None) -> WavInfo:
+    """Read only the RIFF chunk headers of a WAV file and check it against what LipGenerator expects."""
+    if st is None:
+        st = wav_path.stat()
+    base = {"path": wav_path, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    fmt: bytes | None = None
+    data_size: int | None = None
+    truncated = False
+    try:
+        with wav_path.open("rb") as f:
+            head = f.read(12)
+            if len(head) < 12 or head[:4] != b"RIFF" or head[8:12] != b"WAVE":
+                return WavInfo(**base, error="Keine RIFF/WAVE-Datei")
+            pos = 12
+            while pos + 8 <= st.st_size and (fmt is None or data_size is None):
+                f.seek(pos)
+                chunk = f.read(8)
+                if len(chunk) < 8:
+                    break
+                chunk_id, chunk_size = chunk[:4], int.from_bytes(chunk[4:], "little")
+                if chunk_id == b"fmt ":
+                    fmt = f.read(min(chunk_size, 40))
+                elif chunk_id == b"data":
+                    available = st.st_size - pos - 8
+                    truncated = chunk_size > available
+                    data_size = min(chunk_size, available)
+                pos += 8 + chunk_size + (chunk_size & 1)
+    except OSError as exc:
+        return WavInfo(**base, error=f"Nicht lesbar: {exc}")
+
+    if fmt is None or len(fmt) < _WAV_FMT.size:
+        return WavInfo(**base, error="fmt-Chunk fehlt oder ist defekt")
+    format_tag, channels, sample_rate, byte_rate, _, bits = _WAV_FMT.unpack_from(fmt)
+    if format_tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        # First two bytes of the SubFormat GUID carry the actual format tag.
+        format_tag = int.from_bytes(fmt[24:26], "little")
+    fields = {"format_tag": format_tag, "channels": channels, "sample_rate": sample_rate, "bits_per_sample": bits}
+
+    if format_tag != WAVE_FORMAT_PCM:
+        return WavInfo(**base, **fields, error=f"Kein PCM-Audio (Format 0x{format_tag:04X})")
+    if channels == 0 or sample_rate == 0 or byte_rate == 0:
+        return WavInfo(**base, **fields, error="Ungültiger fmt-Chunk")
+    if data_size is None:
+        return WavInfo(**base, **fields, error="data-Chunk fehlt")
+    if data_size == 0:
+        return WavInfo(**base, **fields, error="Keine Audiodaten")
+
+    duration = data_size / byte_rate
+    warnings: list[str] = []
+    if truncated:
+        warnings.append("data-Chunk abgeschnitten")
+    if channels != 1:
+        warnings.append(f"{channels} Kanäle (erwartet: Mono)")
+    if bits != 16:
+        warnings.append(f"{bits} Bit (erwartet: 16 Bit)")
+    if sample_rate not in LIPGEN_SAMPLE_RATES:
+        warnings.append(f"ungewöhnliche Samplerate {sample_rate} Hz")
+    return WavInfo(**base, **fields, duration=duration, warning=", ".join(warnings))
+
+
+class WavProbeCache:
+    """probe_wav results keyed by path and invalidated by (size, mtime), persisted as JSON."""
+
+    _VERSION = 1
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, list] = {}
+        self._dirty = False
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if data.get("version") == self._VERSION:
+                    self._entries = data.get("entries", {})
+            except Exception:
+                self._entries = {}
+
+    def get(self, wav_path: Path, st: os.stat_result) -> WavInfo | None:
+        with self._lock:
+            entry = self._entries.get(str(wav_path))
+        if not entry or entry[0] != st.st_size or entry[1] != st.st_mtime_ns:
+            return None
+        return WavInfo(wav_path, *entry)
+
+    def put(self, info: WavInfo) -> None:
+        entry = [
+            info.size,
+            info.mtime_ns,
+            info.format_tag,
+            info.channels,
+            info.sample_rate,
+            info.bits_per_sample,
+            info.duration,
+            info.error,
+            info.warning,
+        ]
+        with self._lock:
+            self._entries[str(info.path)] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        with self._lock:
+            payload = json.dumps({"version": self._VERSION, "entries": self._entries}, ensure_ascii=False)
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # Non-fatal: the next run just probes again.
+            pass
+
+
+def probe_wav_files(
+    wav_paths: list[Path],
+    cache: WavProbeCache | None = None,
+    max_workers: int = 8,
+    stop_event: threading.Event | None = None,
+) -> dict[Path, WavInfo]:
+    """Probe many WAV headers in a thread pool (I/O bound), reusing cached results where unchanged."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    def _probe(wav_path: Path) -> WavInfo:
+        try:
+            st = wav_path.stat()
+        except OSError as exc:
+            return WavInfo(wav_path, 0, 0, error=f"Nicht lesbar: {exc}")
+        if cache is not None:
+            cached = cache.get(wav_path, st)
+            if cached is not None:
+                return cached
+        info = probe_wav(wav_path, st)
+        if cache is not None:
+            cache.put(info)
+        return info
+
+    results: dict[Path, WavInfo] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = [pool.submit(_probe, p) for p in wav_paths]
+        for fut in as_completed(futures):
+            if stop_event is not None and stop_event.is_set():
+                pool.shutdown(wait=False, cancel_futures=True)
+                break
+            info = fut.result()
+            results[info.path] = info
+    return results
+
+
+STAGING_SUFFIX = ".lipgui-part.lip"
+
+
+def staging_lip_path(lip_path: Path) -> Path:
+    """Where LipGenerator writes before the result is renamed into place (same folder, so same file system)."""
+    return lip_path.with_name(lip_path.stem + STAGING_SUFFIX)
+
+
+def prepare_output_dirs(jobs: Sequence[Job], known: set[Path] | None = None) -> list[tuple[Path, OSError]]:
+    """Create the output folders of all jobs once, parents first, instead of one mkdir per job.
+
+    Folders in `known` are skipped and the new ones are added to it. Returns the folders that
+    could not be created; their jobs fail when LipGenerator cannot write.
+    """
+    known = set() if known is None else known
+    failed: list[tuple[Path, OSError]] = []
+    folders = jobs.lip_folders() if isinstance(jobs, JobTable) else {j.lip_path.parent for j in jobs}
+    for folder in sorted(folders - known, key=lambda p: len(p.parts)):
+        try:
+            folder.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            failed.append((folder, exc))
+            continue
+        known.add(folder)
+    return failed
+
+
+def _lipgenerator_args(exe_path: Path, job: Job, output: Path, language: str, gesture_exaggeration: str) -> list[str]:
+    args: list[str] = [
+        str(exe_path),
+        str(job.wav_path),
+        job.text,
+        f"-Language:{language}",
+        f"-OutputFileName:{output}",
+    ]
+    gesture_exaggeration = gesture_exaggeration.strip()
+    if gesture_exaggeration:
+        args.append(f"-GestureExaggeration:{gesture_exaggeration}")
+    return args
+
+
+def _commit_staged(staged: Path, lip_path: Path, ok: bool) -> None:
+    """Rename a finished .lip into place; drop partial output of failed or canceled runs."""
+    try:
+        if ok and staged.exists() and staged.stat().st_size > 0:
+            os.replace(staged, lip_path)
+        else:
+            staged.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def run_lipgenerator(
+    lipgenerator_dir: Path,
+    exe_path: Path,
+    job: Job,
+    language: str,
+    gesture_exaggeration: str,
+) -> subprocess.CompletedProcess[str]:
+    job.lip_path.parent.mkdir(parents=True, exist_ok=True)
+    staged = staging_lip_path(job.lip_path)
+    args = _lipgenerator_args(exe_path, job, staged, language, gesture_exaggeration)
+
+    cp = subprocess.run(
+        args,
+        cwd=str(lipgenerator_dir),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    _commit_staged(staged, job.lip_path, ok=cp.returncode == 0)
+    return cp
+
+
+# Lines of generator output worth showing in the log; everything else is only kept in the spill file.
+GENERATOR_PROBLEM_RE = re.compile(
+    rb"error|fail|exception|warn|cannot|can't|could not|unable|not found|invalid|fehler", re.IGNORECASE
+)
+GENERATOR_OUTPUT_LIMIT = 64 * 1024
+
+
+class StreamCapture:
+    """Reads one output pipe of a generator process on a background thread with bounded memory.
+
+    Keeps the first and last `limit // 2` bytes and up to `max_problems` lines matching
+    GENERATOR_PROBLEM_RE from anywhere in the stream. With `spill`, every byte is also written
+    to that file (shared by stdout and stderr, hence `spill_lock`).
+    """
+
+    def __init__(
+        self,
+        pipe: io.BufferedIOBase,
+        limit: int = GENERATOR_OUTPUT_LIMIT,
+        spill: io.BufferedIOBase | None = None,
+        spill_lock: threading.Lock | None = None,
+        max_problems: int = 20,
+    ) -> None:
+        self.total = 0
+        self.problems: list[bytes] = []
+        self._pipe = pipe
+        self._half = max(1, limit // 2)
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._partial = b""
+        self._spill = spill
+        self._spill_lock = spill_lock or threading.Lock()
+        self._max_problems = max_problems
+        self._thread = threading.Thread(target=self._pump, name="lipgen-output", daemon=True)
+        self._thread.start()
+
+    def _pump(self) -> None:
+        read = getattr(self._pipe, "read1", self._pipe.read)
+        try:
+            while True:
+                chunk = read(65536)
+                if not chunk:
+                    break
+                self._feed(chunk)
+        except (OSError, ValueError):
+            pass
+        if self._partial:
+            self._scan_line(self._partial)
+
+    def _feed(self, chunk: bytes) -> None:
+        self.total += len(chunk)
+        if self._spill is not None:
+            with self._spill_lock:
+                self._spill.write(chunk)
+
+        room = self._half - len(self._head)
+        if room > 0:
+            self._head += chunk[:room]
+            chunk_rest = chunk[room:]
+        else:
+            chunk_rest = chunk
+        if chunk_rest:
+            self._tail += chunk_rest
+            if len(self._tail) > self._half:
+                del self._tail[: len(self._tail) - self._half]
+
+        if len(self.problems) < self._max_problems:
+            *complete, self._partial = (self._partial + chunk).split(b"\n")
+            # A single huge line without newlines must not grow without bound either.
+            self._partial = self._partial[-4096:]
+            for line in complete:
+                self._scan_line(line)
+
+    def _scan_line(self, line: bytes) -> None:
+        if len(self.problems) < self._max_problems and GENERATOR_PROBLEM_RE.search(line):
+            self.problems.append(line.strip()[:500])
+
+    def join(self, timeout: float | None = None) -> None:
+        self._thread.join(timeout)
+
+    def text(self) -> str:
+        """The kept output; a marker replaces what was dropped in the middle."""
+        import locale
+
+        encoding = locale.getpreferredencoding(False)
+        dropped = self.total - len(self._head) - len(self._tail)
+        if dropped <= 0:
+            return (bytes(self._head) + bytes(self._tail)).decode(encoding, errors="replace")
+        return (
+            bytes(self._head).decode(encoding, errors="replace")
+            + f"\n… {dropped} Bytes ausgelassen …\n"
+            + bytes(self._tail).decode(encoding, errors="replace")
+        )
+
+    def problem_lines(self) -> list[str]:
+        import locale
+
+        encoding = locale.getpreferredencoding(False)
+        return [line.decode(encoding, errors="replace") for line in self.problems if line]
+
+
+def relevant_output_lines(cp: subprocess.CompletedProcess[str], problems: list[str], ok: bool, limit: int = 10) -> list[str]:
+    """What to log for one generator run: problem lines, or the last lines of a failed run."""
+    if problems:
+        return problems[:limit]
+    if ok:
+        return []
+    for stream in (cp.stderr, cp.stdout):
+        tail = [line.strip() for line in stream.strip().splitlines() if line.strip()]
+        if tail:
+            return tail[-limit:]
+    return []
+
+
+def _hidden_window_kwargs() -> dict[str, object]:
+    """Popen arguments that keep a console window from popping up on Windows."""
+    if os.name != "nt":
+        return {}
+    kwargs: dict[str, object] = {"creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0)}
+    try:
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = 0  # SW_HIDE
+        kwargs["startupinfo"] = startupinfo
+    except Exception:
+        pass
+    return kwargs
+
+
+def _nt_suspend_resume(pid: int, resume: bool) -> None:
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    ntdll = ctypes.windll.ntdll  # type: ignore[attr-defined]
+    handle = kernel32.OpenProcess(0x0800, False, pid)  # PROCESS_SUSPEND_RESUME
+    if not handle:
+        raise ctypes.WinError()  # type: ignore[attr-defined]
+    try:
+        status = (ntdll.NtResumeProcess if resume else ntdll.NtSuspendProcess)(handle)
+    finally:
+        kernel32.CloseHandle(handle)
+    if status:
+        raise OSError(f"NTSTATUS 0x{status & 0xFFFFFFFF:08X}")
+
+
+def suspend_process(proc: subprocess.Popen[bytes]) -> None:
+    """Stop a child in place (SIGSTOP / NtSuspendProcess); resume_process continues it."""
+    if proc.poll() is not None:
+        return
+    if os.name == "nt":
+        _nt_suspend_resume(proc.pid, resume=False)
+    else:
+        import signal
+
+        os.kill(proc.pid, signal.SIGSTOP)
+
+
+def resume_process(proc: subprocess.Popen[bytes]) -> None:
+    if proc.poll() is not None:
+        return
+    if os.name == "nt":
+        _nt_suspend_resume(proc.pid, resume=True)
+    else:
+        import signal
+
+        os.kill(proc.pid, signal.SIGCONT)
+
+
+class ProcessRegistry:
+    """Generator processes currently alive, so Pause can suspend all of them at once.
+
+    Processes added while the registry is suspended are suspended right away. Each process
+    is suspended at most once (NtSuspendProcess counts), and a suspended process must be
+    resumed before it is terminated: SIGTERM stays pending on a stopped POSIX process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # process -> currently suspended by us
+        self._procs: dict[subprocess.Popen[bytes], bool] = {}
+        self.suspended = False
+
+    def add(self, proc: subprocess.Popen[bytes]) -> None:
+        with self._lock:
+            self._procs[proc] = False
+            if self.suspended:
+                self._set(proc, True)
+
+    def discard(self, proc: subprocess.Popen[bytes]) -> None:
+        with self._lock:
+            if self._procs.pop(proc, False):
+                self._set_state(proc, False)
+
+    def resume(self, proc: subprocess.Popen[bytes]) -> None:
+        """Continue one process (before terminating it), even while the registry is suspended."""
+        with self._lock:
+            if self._procs.get(proc):
+                self._set(proc, False)
+
+    def suspend_all(self) -> int:
+        """Suspend every registered process; returns how many were suspended."""
+        with self._lock:
+            self.suspended = True
+            return sum(self._set(proc, True) for proc, stopped in list(self._procs.items()) if not stopped)
+
+    def resume_all(self) -> int:
+        with self._lock:
+            self.suspended = False
+            return sum(self._set(proc, False) for proc, stopped in list(self._procs.items()) if stopped)
+
+    def _set(self, proc: subprocess.Popen[bytes], stopped: bool) -> bool:
+        if not self._set_state(proc, stopped):
+            return False
+        self._procs[proc] = stopped
+        return True
+
+    @staticmethod
+    def _set_state(proc: subprocess.Popen[bytes], stopped: bool) -> bool:
+        try:
+            (suspend_process if stopped else resume_process)(proc)
+        except (OSError, AttributeError):
+            return False
+        return proc.poll() is None
+
+
+class ProcessPriority:
+    NORMAL = "normal"
+    BELOW_NORMAL = "below_normal"
+    IDLE = "idle"
+
+
+# nice values (POSIX) and priority classes (Windows) per ProcessPriority
+_NICE = {ProcessPriority.BELOW_NORMAL: 10, ProcessPriority.IDLE: 19}
+_PRIORITY_CLASS = {ProcessPriority.BELOW_NORMAL: 0x00004000, ProcessPriority.IDLE: 0x00000040}
+
+# Run by `python -c` in place of the generator (see ChildLimits.command): sets the limits on
+# itself, then execs the generator, which keeps the pid and inherits them.
+# argv: nice, CPUs (comma-separated), memory bytes, CPU seconds, generator command...
+_POSIX_LIMIT_WRAPPER = """
+import os, sys
+nice, cpus, memory, cpu_seconds = sys.argv[1:5]
+args = sys.argv[5:]
+if int(nice):
+    try:
+        os.setpriority(os.PRIO_PROCESS, 0, int(nice))
+    except OSError as exc:
+        sys.stderr.write(f"WARN: Priorität: {exc}\\n")
+if cpus:
+    try:
+        os.sched_setaffinity(0, {int(c) for c in cpus.split(",")})
+    except (OSError, AttributeError) as exc:
+        sys.stderr.write(f"WARN: CPU-Affinität: {exc}\\n")
+if int(memory) or int(cpu_seconds):
+    import resource
+    for limit, value in ((resource.RLIMIT_AS, int(memory)), (resource.RLIMIT_CPU, int(cpu_seconds))):
+        if value:
+            try:
+                resource.setrlimit(limit, (value, value))
+            except (OSError, ValueError) as exc:
+                sys.stderr.write(f"WARN: rlimit: {exc}\\n")
+try:
+    os.execvp(args[0], args)
+except OSError as exc:
+    sys.stderr.write(f"FEHLER: {args[0]}: {exc}\\n")
+    sys.exit(127)
+"""
+
+
+@dataclass(frozen=True)
+class ChildLimits:
+    """Priority, CPU pinning and resource limits for generator processes (settings.json).
+
+    On POSIX the generator is started through a re-exec of Python that sets the limits on
+    itself before it execs the generator (command()), so they hold from the first instruction;
+    preexec_fn would do the same but is not safe with the runner's threads. A frozen build
+    cannot re-exec Python and applies them right after the start instead (apply()).
+
+    On Windows the priority class is set at creation; CPU pinning and the job object that caps
+    memory and CPU time are applied right after the start, so a process runs unrestricted for
+    a moment (describe() says so).
+    """
+
+    priority: str = ProcessPriority.NORMAL
+    # With pinning: the CPUs to spread the worker slots over (slot n gets cpus[n % len(cpus)]).
+    cpus: tuple[int, ...] = ()
+    memory_mb: int = 0
+    cpu_seconds: int = 0
+
+    def for_slot(self, slot: int) -> ChildLimits:
+        if not self.cpus:
+            return self
+        return ChildLimits(self.priority, (self.cpus[slot % len(self.cpus)],), self.memory_mb, self.cpu_seconds)
+
+    def describe(self) -> str:
+        parts = [f"Priorität {self.priority}"]
+        if self.cpus:
+            parts.append(f"je Slot auf 1 von {len(self.cpus)} CPUs fixiert")
+        if self.memory_mb:
+            parts.append(f"max. {self.memory_mb} MB Speicher")
+        if self.cpu_seconds:
+            parts.append(f"max. {self.cpu_seconds}s CPU")
+        line = "Generator-Prozesse: " + ", ".join(parts)
+        if self._applied_after_start():
+            line += " (nach bestem Bemühen: erst kurz nach dem Start gesetzt)"
+        return line
+
+    def _wrapped(self) -> bool:
+        """Whether command() starts the process through the POSIX limit wrapper."""
+        return (
+            os.name != "nt"
+            and not getattr(sys, "frozen", False)
+            and bool(self.priority in _NICE or self.cpus or self.memory_mb or self.cpu_seconds)
+        )
+
+    def _applied_after_start(self) -> bool:
+        if os.name == "nt":
+            return bool(self.cpus or self.memory_mb or self.cpu_seconds)
+        return not self._wrapped() and bool(self.priority in _NICE or self.cpus or self.memory_mb or self.cpu_seconds)
+
+    def command(self, args: list[str]) -> list[str]:
+        """The command line to start `args` with these limits in place (POSIX wrapper, see above)."""
+        if not self._wrapped():
+            return args
+        return [
+            sys.executable,
+            "-I",
+            "-S",
+            "-c",
+            _POSIX_LIMIT_WRAPPER,
+            str(_NICE.get(self.priority, 0)),
+            ",".join(str(cpu) for cpu in self.cpus),
+            str(self.memory_mb * 1024 * 1024),
+            str(self.cpu_seconds),
+            *args,
+        ]
+
+    def popen_kwargs(self) -> dict[str, object]:
+        """_hidden_window_kwargs plus the Windows priority class."""
+        kwargs = _hidden_window_kwargs()
+        if os.name == "nt" and self.priority in _PRIORITY_CLASS:
+            kwargs["creationflags"] = int(kwargs.get("creationflags", 0)) | _PRIORITY_CLASS[self.priority]  # type: ignore[call-overload]
+        return kwargs
+
+    def apply(self, proc: subprocess.Popen[bytes]) -> list[str]:
+        """Apply the limits command() could not set up front; returns what could not be applied."""
+        failed: list[str] = []
+        if self._wrapped():
+            return failed
+        if os.name == "nt":
+            if self.cpus or self.memory_mb or self.cpu_seconds:
+                try:
+                    _nt_apply_limits(proc, self)
+                except OSError as exc:
+                    failed.append(f"Limits: {exc}")
+            return failed
+        if self.priority in _NICE:
+            try:
+                os.setpriority(os.PRIO_PROCESS, proc.pid, _NICE[self.priority])
+            except (OSError, AttributeError) as exc:
+                failed.append(f"Priorität: {exc}")
+        if self.cpus:
+            try:
+                os.sched_setaffinity(proc.pid, self.cpus)
+            except (OSError, AttributeError) as exc:
+                failed.append(f"CPU-Affinität: {exc}")
+        if self.memory_mb or self.cpu_seconds:
+            try:
+                import resource
+
+                if self.memory_mb:
+                    limit = self.memory_mb * 1024 * 1024
+                    resource.prlimit(proc.pid, resource.RLIMIT_AS, (limit, limit))
+                if self.cpu_seconds:
+                    resource.prlimit(proc.pid, resource.RLIMIT_CPU, (self.cpu_seconds, self.cpu_seconds))
+            except (OSError, ValueError, ImportError, AttributeError) as exc:
+                failed.append(f"rlimit: {exc}")
+        return failed
+
+
+_nt_job_handles: dict[tuple[int, int], int] = {}
+_nt_job_lock = threading.Lock()
+
+
+def _nt_job_object(memory_mb: int, cpu_seconds: int) -> int:
+    """One job object per limit combination; the limits apply to each process in it."""
+    import ctypes
+    from ctypes import wintypes
+
+    key = (memory_mb, cpu_seconds)
+    with _nt_job_lock:
+        if key in _nt_job_handles:
+            return _nt_job_handles[key]
+
+        class BasicLimits(ctypes.Structure):
+            _fields_ = [
+                ("PerProcessUserTimeLimit", ctypes.c_int64),
+                ("PerJobUserTimeLimit", ctypes.c_int64),
+                ("LimitFlags", wintypes.DWORD),
+                ("MinimumWorkingSetSize", ctypes.c_size_t),
+                ("MaximumWorkingSetSize", ctypes.c_size_t),
+                ("ActiveProcessLimit", wintypes.DWORD),
+                ("Affinity", ctypes.c_size_t),
+                ("PriorityClass", wintypes.DWORD),
+                ("SchedulingClass", wintypes.DWORD),
+            ]
+
+        class ExtendedLimits(ctypes.Structure):
+            _fields_ = [
+                ("BasicLimitInformation", BasicLimits),
+                ("IoInfo", ctypes.c_uint64 * 6),
+                ("ProcessMemoryLimit", ctypes.c_size_t),
+                ("JobMemoryLimit", ctypes.c_size_t),
+                ("PeakProcessMemoryUsed", ctypes.c_size_t),
+                ("PeakJobMemoryUsed", ctypes.c_size_t),
+            ]
+
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+        job = kernel32.CreateJobObjectW(None, None)
+        if not job:
+            raise ctypes.WinError()  # type: ignore[attr-defined]
+        info = ExtendedLimits()
+        if cpu_seconds:
+            info.BasicLimitInformation.LimitFlags |= 0x0002  # JOB_OBJECT_LIMIT_PROCESS_TIME
+            info.BasicLimitInformation.PerProcessUserTimeLimit = cpu_seconds * 10_000_000
+        if memory_mb:
+            info.BasicLimitInformation.LimitFlags |= 0x0100  # JOB_OBJECT_LIMIT_PROCESS_MEMORY
+            info.ProcessMemoryLimit = memory_mb * 1024 * 1024
+        # 9 = JobObjectExtendedLimitInformation
+        if not kernel32.SetInformationJobObject(job, 9, ctypes.byref(info), ctypes.sizeof(info)):
+            error = ctypes.WinError()  # type: ignore[attr-defined]
+            kernel32.CloseHandle(job)
+            raise error
+        _nt_job_handles[key] = job
+        return job
+
+
+def _nt_apply_limits(proc: subprocess.Popen[bytes], limits: ChildLimits) -> None:
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    # PROCESS_SET_QUOTA | PROCESS_TERMINATE | PROCESS_SET_INFORMATION | PROCESS_QUERY_INFORMATION
+    handle = kernel32.OpenProcess(0x0100 | 0x0001 | 0x0200 | 0x0400, False, proc.pid)
+    if not handle:
+        raise ctypes.WinError()  # type: ignore[attr-defined]
+    try:
+        if limits.cpus:
+            mask = 0
+            for cpu in limits.cpus:
+                mask |= 1 << cpu
+            if not kernel32.SetProcessAffinityMask(handle, ctypes.c_size_t(mask)):
+                raise ctypes.WinError()  # type: ignore[attr-defined]
+        if limits.memory_mb or limits.cpu_seconds:
+            job = _nt_job_object(limits.memory_mb, limits.cpu_seconds)
+            if not kernel32.AssignProcessToJobObject(ctypes.c_void_p(job), handle):
+                raise ctypes.WinError()  # type: ignore[attr-defined]
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+@dataclass(frozen=True)
+class ChildUsage:
+    """Resources one generator process used (rusage / GetProcessTimes)."""
+
+    cpu_user: float
+    cpu_system: float
+    peak_rss_mb: float
+
+
+def _nt_usage(proc: subprocess.Popen[bytes]) -> ChildUsage | None:
+    import ctypes
+    from ctypes import wintypes
+
+    class MemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    # Popen keeps the process handle open until it is collected, so the exited process can still be queried.
+    handle = getattr(proc, "_handle", None)
+    if handle is None:
+        return None
+    handle = wintypes.HANDLE(int(handle))
+    times = [wintypes.FILETIME() for _ in range(4)]
+    if not ctypes.windll.kernel32.GetProcessTimes(handle, *(ctypes.byref(t) for t in times)):  # type: ignore[attr-defined]
+        return None
+    user, kernel = ((t.dwHighDateTime << 32 | t.dwLowDateTime) / 1e7 for t in (times[3], times[2]))
+    counters = MemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    peak = 0.0
+    if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):  # type: ignore[attr-defined]
+        peak = counters.PeakWorkingSetSize / (1024 * 1024)
+    return ChildUsage(user, kernel, peak)
+
+
+def _poll_child(proc: subprocess.Popen[bytes], usage: list[ChildUsage] | None) -> int | None:
+    """proc.poll() that also records the child's resource usage once it has exited.
+
+    On POSIX the child is reaped with os.wait4 (which returns its rusage) instead of waitpid.
+    """
+    if usage is None or proc.returncode is not None:
+        return proc.poll()
+    if os.name == "nt":
+        rc = proc.poll()
+        if rc is not None:
+            try:
+                info = _nt_usage(proc)
+            except (OSError, AttributeError, ValueError):
+                info = None
+            if info is not None:
+                usage.append(info)
+        return rc
+    try:
+        pid, status, rusage = os.wait4(proc.pid, os.WNOHANG)
+    except ChildProcessError:
+        # Reaped elsewhere (e.g. a concurrent poll()); the usage is gone.
+        return proc.poll()
+    if pid == 0:
+        return None
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is in KB on Linux, bytes on macOS.
+    peak = rusage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    usage.append(ChildUsage(rusage.ru_utime, rusage.ru_stime, peak))
+    return proc.returncode
+
+
+def run_lipgenerator_background(
+    lipgenerator_dir: Path,
+    exe_path: Path,
+    job: Job,
+    language: str,
+    gesture_exaggeration: str,
+    stop_event: threading.Event,
+    pause_event: threading.Event,
+    problems: list[str] | None = None,
+    output_limit: int = GENERATOR_OUTPUT_LIMIT,
+    spill_path: Path | None = None,
+    registry: ProcessRegistry | None = None,
+    limits: ChildLimits | None = None,
+    usage: list[ChildUsage] | None = None,
+) -> tuple[subprocess.CompletedProcess[str], bool]:
+    """Run LipGenerator without popping up a console window (Windows) and allow canceling mid-file.
+
+    LipGenerator writes to staging_lip_path(job.lip_path), which is renamed to job.lip_path only
+    on success, so a canceled or crashed run never leaves a truncated .lip behind. The output
+    folder must exist (see prepare_output_dirs).
+
+    stdout/stderr are read while the process runs and kept up to `output_limit` bytes each (see
+    StreamCapture); lines that look like errors or warnings are appended to `problems`, and
+    `spill_path` receives the complete raw output.
+
+    The process is registered in `registry` while it runs, so Pause can suspend it. `limits`
+    are applied to it, and its CPU time and peak memory are appended to `usage` when it exits.
+
+    Returns (CompletedProcess, was_killed).
+    """
+    staged = staging_lip_path(job.lip_path)
+    staged.unlink(missing_ok=True)
+    args = _lipgenerator_args(exe_path, job, staged, language, gesture_exaggeration)
+
+    spill = spill_path.open("wb") if spill_path is not None else None
+    try:
+        proc = subprocess.Popen(
+            limits.command(args) if limits is not None else args,
+            cwd=str(lipgenerator_dir),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **(limits.popen_kwargs() if limits is not None else _hidden_window_kwargs()),
+        )
+    except BaseException:
+        if spill is not None:
+            spill.close()
+        raise
+    if limits is not None:
+        for failure in limits.apply(proc):
+            if problems is not None:
+                problems.append(f"WARN: {failure}")
+    if registry is not None:
+        registry.add(proc)
+    spill_lock = threading.Lock()
+    out = StreamCapture(proc.stdout, output_limit, spill, spill_lock)
+    err = StreamCapture(proc.stderr, output_limit, spill, spill_lock)
+
+    was_killed = False
+    cp: subprocess.CompletedProcess[str] | None = None
+    try:
+        # Poll loop so we can pause/stop responsively.
+        while True:
+            if stop_event.is_set():
+                was_killed = True
+                if registry is not None:
+                    registry.resume(proc)
+                try:
+                    proc.terminate()
+                except Exception:
+                    pass
+                break
+
+            # If paused, wait here but still allow stopping.
+            if not pause_event.is_set():
+                if stop_event.wait(timeout=0.2):
+                    continue
+                continue
+
+            rc = _poll_child(proc, usage)
+            if rc is not None:
+                break
+            stop_event.wait(timeout=0.2)
+
+        try:
+            proc.wait(timeout=5)
+        except Exception:
+            was_killed = True
+            try:
+                proc.kill()
+            except Exception:
+                pass
+            proc.wait()
+        # The pipes close with the process; a grandchild holding them open must not block us.
+        out.join(timeout=5)
+        err.join(timeout=5)
+
+        cp = subprocess.CompletedProcess(
+            args=args,
+            returncode=proc.returncode or (1 if was_killed else 0),
+            stdout=out.text(),
+            stderr=err.text(),
+        )
+        if problems is not None:
+            problems.extend(out.problem_lines() + err.problem_lines())
+        return cp, was_killed
+    finally:
+        try:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait(timeout=5)
+        except Exception:
+            pass
+        if registry is not None:
+            registry.discard(proc)
+        for pipe in (proc.stdout, proc.stderr):
+            try:
+                pipe.close()
+            except Exception:
+                pass
+        if spill is not None:
+            with spill_lock:
+                spill.close()
+        _commit_staged(staged, job.lip_path, ok=cp is not None and cp.returncode == 0 and not was_killed)
+
+
+class GeneratorBackendMode:
+    SPAWN = "spawn"
+    SERVER = "server"
+
+
+class GeneratorBackend(ABC):
+    """How BatchRunner gets one .lip generated. run() is called from all slot threads at once.
+
+    run() has the contract of run_lipgenerator_background: write the .lip for `job` (via its
+    staging path), honour stop/pause, append problem lines to `problems`, write the raw output
+    to `spill_path` if given, and return (CompletedProcess, was_killed). `slot` is the calling
+    worker slot (for CPU pinning); backends that can measure it append the job's ChildUsage.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def run(
+        self,
+        job: Job,
+        language: str,
+        stop_event: threading.Event,
+        pause_event: threading.Event,
+        problems: list[str] | None = None,
+        spill_path: Path | None = None,
+        slot: int = 0,
+        usage: list[ChildUsage] | None = None,
+    ) -> tuple[subprocess.CompletedProcess[str], bool]:
+        """Generate the .lip for job; see the class docstring."""
+
+    def close(self) -> None:
+        """Release long-lived resources; called once the batch is finished or stopped."""
+
+
+class SpawnBackend(GeneratorBackend):
+    """One LipGenerator.exe process per job (the default)."""
+
+    name = GeneratorBackendMode.SPAWN
+
+    def __init__(
+        self,
+        lipgenerator_dir: Path,
+        exe_path: Path,
+        gesture: str,
+        output_limit: int = GENERATOR_OUTPUT_LIMIT,
+        registry: ProcessRegistry | None = None,
+        limits: ChildLimits | None = None,
+    ) -> None:
+        self.lipgenerator_dir = lipgenerator_dir
+        self.exe_path = exe_path
+        self.gesture = gesture
+        self.output_limit = output_limit
+        self.registry = registry
+        self.limits = limits
+
+    def run(
+        self,
+        job: Job,
+        language: str,
+        stop_event: threading.Event,
+        pause_event: threading.Event,
+        problems: list[str] | None = None,
+        spill_path: Path | None = None,
+        slot: int = 0,
+        usage: list[ChildUsage] | None = None,
+    ) -> tuple[subprocess.CompletedProcess[str], bool]:
+        return run_lipgenerator_background(
+            lipgenerator_dir=self.lipgenerator_dir,
+            exe_path=self.exe_path,
+            job=job,
+            language=language,
+            gesture_exaggeration=self.gesture,
+            stop_event=stop_event,
+            pause_event=pause_event,
+            problems=problems,
+            output_limit=self.output_limit,
+            spill_path=spill_path,
+            registry=self.registry,
+            limits=self.limits.for_slot(slot) if self.limits is not None else None,
+            usage=usage,
+        )
+
+
+class _GeneratorServer:
+    """One running server process; stdout lines are collected by a reader thread."""
+
+    def __init__(
+        self,
+        args: list[str],
+        cwd: Path,
+        output_limit: int,
+        registry: ProcessRegistry | None = None,
+        limits: ChildLimits | None = None,
+    ) -> None:
+        self.args = args
+        self.registry = registry
+        self.proc = subprocess.Popen(
+            limits.command(args) if limits is not None else args,
+            cwd=str(cwd),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **(limits.popen_kwargs() if limits is not None else _hidden_window_kwargs()),
+        )
+        # Reported with the first job the server handles.
+        self.limit_failures = limits.apply(self.proc) if limits is not None else []
+        if registry is not None:
+            registry.add(self.proc)
+        self.lines: queue.Queue[bytes | None] = queue.Queue()
+        self.stderr = StreamCapture(self.proc.stderr, output_limit)
+        self._next_id = 0
+        threading.Thread(target=self._read, name="lipgen-server", daemon=True).start()
+
+    def _read(self) -> None:
+        try:
+            for line in self.proc.stdout:
+                self.lines.put(line)
+        except (OSError, ValueError):
+            pass
+        self.lines.put(None)
+
+    def send(self, request: dict[str, object]) -> int:
+        self._next_id += 1
+        request["id"] = self._next_id
+        self.proc.stdin.write(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.proc.stdin.flush()
+        return self._next_id
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def close(self, kill: bool = False) -> None:
+        if self.registry is not None:
+            # A suspended server could neither exit nor handle SIGTERM.
+            self.registry.discard(self.proc)
+        try:
+            if not kill:
+                # Closing stdin is the request to exit.
+                self.proc.stdin.close()
+                self.proc.wait(timeout=2)
+        except Exception:
+            pass
+        try:
+            if self.proc.poll() is None:
+                self.proc.kill()
+                self.proc.wait(timeout=5)
+        except Exception:
+            pass
+        for pipe in (self.proc.stdin, self.proc.stdout, self.proc.stderr):
+            try:
+                pipe.close()
+            except Exception:
+                pass
+
+
+class ServerBackend(GeneratorBackend):
+    """Long-lived generator processes that each handle many jobs (settings: generator_server_command).
+
+    Protocol, one UTF-8 JSON object per line:
+        request  (stdin):  {"id": 1, "wav": "...", "text": "...", "language": "...",
+                            "output": "<.lip to write>", "gesture": "..."}
+        response (stdout): {"id": 1, "ok": true, "returncode": 0, "output": "<log text>"}
+    Other stdout lines count as output of the current job. Closing stdin asks the server to exit.
+
+    Each slot thread borrows an idle server or starts a new one, so at most `workers` servers
+    run. A server that dies, or is killed because of Stop, is not reused. `limits` apply per
+    server, without the CPU time limit (it would add up over all jobs of a server); there is
+    no per-job ChildUsage.
+    """
+
+    name = GeneratorBackendMode.SERVER
+
+    def __init__(
+        self,
+        command: list[str],
+        cwd: Path,
+        gesture: str,
+        output_limit: int = GENERATOR_OUTPUT_LIMIT,
+        registry: ProcessRegistry | None = None,
+        limits: ChildLimits | None = None,
+    ) -> None:
+        if not command:
+            raise ValueError("Kein Server-Befehl angegeben (generator_server_command).")
+        self.command = command
+        self.cwd = cwd
+        self.gesture = gesture
+        self.output_limit = output_limit
+        self.registry = registry
+        self.limits = limits
+        if limits is not None and limits.cpu_seconds:
+            self.limits = ChildLimits(limits.priority, limits.cpus, limits.memory_mb, 0)
+        self.started = 0
+        self._lock = threading.Lock()
+        self._idle: list[_GeneratorServer] = []
+        self._all: list[_GeneratorServer] = []
+
+    def _acquire(self, slot: int) -> _GeneratorServer:
+        with self._lock:
+            while self._idle:
+                server = self._idle.pop()
+                if server.alive():
+                    return server
+                server.close(kill=True)
+        limits = self.limits.for_slot(slot) if self.limits is not None else None
+        server = _GeneratorServer(self.command, self.cwd, self.output_limit, self.registry, limits)
+        with self._lock:
+            self._all.append(server)
+            self.started += 1
+        return server
+
+    def _release(self, server: _GeneratorServer, reuse: bool) -> None:
+        if reuse and server.alive():
+            with self._lock:
+                self._idle.append(server)
+            return
+        server.close(kill=True)
+        with self._lock:
+            if server in self._all:
+                self._all.remove(server)
+
+    def run(
+        self,
+        job: Job,
+        language: str,
+        stop_event: threading.Event,
+        pause_event: threading.Event,
+        problems: list[str] | None = None,
+        spill_path: Path | None = None,
+        slot: int = 0,
+        usage: list[ChildUsage] | None = None,
+    ) -> tuple[subprocess.CompletedProcess[str], bool]:
+        staged = staging_lip_path(job.lip_path)
+        staged.unlink(missing_ok=True)
+        request: dict[str, object] = {
+            "wav": str(job.wav_path),
+            "text": job.text,
+            "language": language,
+            "output": str(staged),
+            "gesture": self.gesture.strip(),
+        }
+        server = self._acquire(slot)
+        if server.limit_failures:
+            if problems is not None:
+                problems.extend(f"WARN: {failure}" for failure in server.limit_failures)
+            server.limit_failures = []
+        response: dict[str, object] | None = None
+        output = bytearray()
+        was_killed = False
+        cp: subprocess.CompletedProcess[str] | None = None
+        try:
+            try:
+                request_id = server.send(request)
+            except OSError:
+                request_id = -1
+            while request_id >= 0:
+                if stop_event.is_set():
+                    was_killed = True
+                    break
+                if not pause_event.is_set():
+                    stop_event.wait(timeout=0.2)
+                    continue
+                try:
+                    line = server.lines.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                if line is None:
+                    break
+                if line.startswith(b"{"):
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        message = None
+                    if isinstance(message, dict) and message.get("id") == request_id:
+                        response = message
+                        break
+                if len(output) < self.output_limit:
+                    output += line
+
+            if response is not None:
+                output += str(response.get("output") or "").encode("utf-8")
+                returncode = int(response.get("returncode", 0 if response.get("ok") else 1) or 0)
+                if not response.get("ok", returncode == 0) and returncode == 0:
+                    returncode = 1
+                stderr = ""
+            else:
+                # Server gone (or killed): its stderr tells why.
+                server.close(kill=True)
+                server.stderr.join(timeout=5)
+                returncode = server.proc.returncode or 1
+                stderr = server.stderr.text()
+            stdout = bytes(output[: self.output_limit]).decode("utf-8", errors="replace")
+            if spill_path is not None:
+                try:
+                    spill_path.write_bytes(bytes(output) + stderr.encode("utf-8"))
+                except OSError:
+                    pass
+            if problems is not None:
+                found = [
+                    line.strip()[:500]
+                    for line in (stdout + "\n" + stderr).splitlines()
+                    if GENERATOR_PROBLEM_RE.search(line.encode("utf-8"))
+                ]
+                problems.extend(found[:20])
+            cp = subprocess.CompletedProcess(args=server.args, returncode=returncode, stdout=stdout, stderr=stderr)
+            return cp, was_killed
+        finally:
+            self._release(server, reuse=response is not None and not was_killed)
+            _commit_staged(staged, job.lip_path, ok=cp is not None and cp.returncode == 0 and not was_killed)
+
+    def close(self) -> None:
+        with self._lock:
+            servers, self._all, self._idle = self._all, [], []
+        for server in servers:
+            server.close()
+
+
+class PrewarmMode:
+    OFF = "off"
+    READ = "read"
+    COPY = "copy"
+
+
+@dataclass(frozen=True)
+class PrewarmResult:
+    mode: str
+    files: int
+    bytes: int
+    seconds: float
+    lipgenerator_dir: Path
+    exe_path: Path
+
+    def describe(self) -> str:
+        mb = self.bytes / (1024 * 1024)
+        rate = mb / self.seconds if self.seconds > 0 else 0.0
+        return f"Vorwärmen ({self.mode}): {self.files} Dateien, {mb:.1f} MB in {self.seconds:.2f}s ({rate:.0f} MB/s)"
+
+
+def prewarm_lipgenerator(
+    lipgenerator_dir: Path,
+    exe_path: Path,
+    mode: str = PrewarmMode.READ,
+    temp_root: Path | None = None,
+) -> PrewarmResult:
+    """Get LipGenerator's files into the OS page cache before the first job needs them.
+
+    READ streams FonixData.cdf and the executable once so every following process hits the
+    page cache. COPY mirrors the LipGenerator folder to a local temp folder (unchanged files
+    are kept) and returns that folder, which the batch then uses as cwd and exe location.
+    """
+    started = time.perf_counter()
+    if mode == PrewarmMode.COPY:
+        import shutil
+        import tempfile
+
+        src_root = lipgenerator_dir.resolve()
+        temp_root = temp_root or Path(tempfile.gettempdir())
+        dest_root = temp_root / f"LipGUI-LipGenerator-{hashlib.sha1(str(src_root).encode('utf-8')).hexdigest()[:10]}"
+        files = 0
+        copied = 0
+        for src in src_root.rglob("*"):
+            if not src.is_file():
+                continue
+            dest = dest_root / src.relative_to(src_root)
+            st = src.stat()
+            files += 1
+            try:
+                dst = dest.stat()
+                if dst.st_size == st.st_size and dst.st_mtime_ns == st.st_mtime_ns:
+                    continue
+            except OSError:
+                pass
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dest)
+            copied += st.st_size
+        return PrewarmResult(
+            mode=mode,
+            files=files,
+            bytes=copied,
+            seconds=time.perf_counter() - started,
+            lipgenerator_dir=dest_root,
+            exe_path=dest_root / exe_path.resolve().relative_to(src_root),
+        )
+
+    total = 0
+    files = 0
+    buf = bytearray(1 << 20)
+    for path in (lipgenerator_dir / "FonixData.cdf", exe_path):
+        try:
+            with path.open("rb", buffering=0) as f:
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    total += n
+            files += 1
+        except OSError:
+            continue
+    return PrewarmResult(
+        mode=mode,
+        files=files,
+        bytes=total,
+        seconds=time.perf_counter() - started,
+        lipgenerator_dir=lipgenerator_dir,
+        exe_path=exe_path,
+    )
+
+
+# Uncompressed mono 16-bit 44.1 kHz, the usual Skyrim voice format; used when no header data is available.
+_FALLBACK_BYTES_PER_SECOND = 44100 * 2
+
+
+def estimate_job_cost(job: Job, info: WavInfo | None = None) -> float:
+    """Relative cost of a job: WAV duration × text length (LipGenerator aligns the text to the audio)."""
+    if info is not None and info.duration > 0:
+        duration = info.duration
+    else:
+        try:
+            size = info.size if info is not None else job.wav_path.stat().st_size
+        except OSError:
+            size = 0
+        duration = size / _FALLBACK_BYTES_PER_SECOND
+    return max(duration, 0.1) * max(len(job.text), 1)
+
+
+class SystemLoadSampler:
+    """Samples CPU busy fraction and available-memory fraction of the host.
+
+    Linux reads /proc/stat and /proc/meminfo, Windows uses GetSystemTimes/GlobalMemoryStatusEx.
+    Values that can't be measured on the current platform are None.
+    """
+
+    def __init__(self) -> None:
+        self._last_cpu: tuple[int, int] | None = self._cpu_times()
+
+    def sample(self) -> tuple[float | None, float | None]:
+        cpu_busy: float | None = None
+        now = self._cpu_times()
+        if now is not None and self._last_cpu is not None:
+            d_total = now[0] - self._last_cpu[0]
+            d_idle = now[1] - self._last_cpu[1]
+            if d_total > 0:
+                cpu_busy = max(0.0, min(1.0, 1.0 - d_idle / d_total))
+        self._last_cpu = now
+        return cpu_busy, self._mem_available()
+
+    @staticmethod
+    def _cpu_times() -> tuple[int, int] | None:
+        """Return (total, idle) CPU time counters."""
+        if sys.platform.startswith("linux"):
+            try:
+                with open("/proc/stat", "r", encoding="ascii") as f:
+                    fields = [int(v) for v in f.readline().split()[1:]]
+            except (OSError, ValueError):
+                return None
+            # idle + iowait
+            return sum(fields), fields[3] + (fields[4] if len(fields) > 4 else 0)
+        if os.name == "nt":
+            try:
+                import ctypes
+                from ctypes import wintypes
+
+                idle, kernel, user = wintypes.FILETIME(), wintypes.FILETIME(), wintypes.FILETIME()
+                if not ctypes.windll.kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+                    return None
+
+                def _ft(ft: wintypes.FILETIME) -> int:
+                    return (ft.dwHighDateTime << 32) | ft.dwLowDateTime
+
+                # Kernel time includes idle time.
+                return _ft(kernel) + _ft(user), _ft(idle)
+            except Exception:
+                return None
+        return None
+
+    @staticmethod
+    def _mem_available() -> float | None:
+        if sys.platform.startswith("linux"):
+            try:
+                info: dict[str, int] = {}
+                with open("/proc/meminfo", "r", encoding="ascii") as f:
+                    for line in f:
+                        name, _, rest = line.partition(":")
+                        info[name] = int(rest.split()[0])
+                return info["MemAvailable"] / info["MemTotal"]
+            except (OSError, KeyError, ValueError, IndexError, ZeroDivisionError):
+                return None
+        if os.name == "nt":
+            try:
+                import ctypes
+
+                class MEMORYSTATUSEX(ctypes.Structure):
+                    _fields_ = [
+                        ("dwLength", ctypes.c_ulong),
+                        ("dwMemoryLoad", ctypes.c_ulong),
+                        ("ullTotalPhys", ctypes.c_ulonglong),
+                        ("ullAvailPhys", ctypes.c_ulonglong),
+                        ("ullTotalPageFile", ctypes.c_ulonglong),
+                        ("ullAvailPageFile", ctypes.c_ulonglong),
+                        ("ullTotalVirtual", ctypes.c_ulonglong),
+                        ("ullAvailVirtual", ctypes.c_ulonglong),
+                        ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                    ]
+
+                stat = MEMORYSTATUSEX()
+                stat.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+                if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat)):
+                    return None
+                return stat.ullAvailPhys / stat.ullTotalPhys
+            except Exception:
+                return None
+        return None
+
+
+class ConcurrencyController:
+    """Hill-climbs the number of active LipGenerator processes towards the best throughput.
+
+    After each measurement window the throughput (estimated cost finished per second) is
+    compared with the previous window: keep moving in the same direction while it improves.
+    When it drops or stays flat, go back to the best limit seen (fewer processes on a tie) and
+    hold there for HOLD_WINDOWS windows before probing one step the other way. Low free memory
+    always steps down, a saturated CPU blocks steps up. The limit stays within
+    [min_workers, max_workers].
+    """
+
+    LOW_MEMORY = 0.10
+    CPU_SATURATED = 0.95
+    TOLERANCE = 0.05
+    HOLD_WINDOWS = 4
+
+    def __init__(
+        self,
+        min_workers: int,
+        max_workers: int,
+        start: int | None = None,
+        window: float = 15.0,
+        emit: Callable[[str, str], None] | None = None,
+        sampler: SystemLoadSampler | None = None,
+    ) -> None:
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.limit = max(self.min_workers, min(self.max_workers, start or self.min_workers))
+        self.window = window
+        self.emit = emit
+        self.sampler = sampler or SystemLoadSampler()
+
+        self._cond = threading.Condition()
+        self._active = 0
+        # Sign of the last step actually taken; the next probe goes this way.
+        self._direction = 1
+        self._hold = 0
+        self._best_limit: int | None = None
+        self._best_throughput = 0.0
+        self._window_start = time.monotonic()
+        self._window_cost = 0.0
+        self._window_jobs = 0
+        self._last_throughput: float | None = None
+
+    def acquire(self, cancel: Callable[[], bool]) -> bool:
+        """Block until a process slot is free. Returns False if `cancel()` became true first."""
+        with self._cond:
+            while self._active >= self.limit:
+                if cancel():
+                    return False
+                self._cond.wait(timeout=0.2)
+            if cancel():
+                return False
+            self._active += 1
+            return True
+
+    def release(self, cost: float = 0.0) -> None:
+        with self._cond:
+            self._active -= 1
+            if cost > 0:
+                self._window_cost += cost
+                self._window_jobs += 1
+                self._maybe_adjust()
+            self._cond.notify_all()
+
+    def _maybe_adjust(self) -> None:
+        elapsed = time.monotonic() - self._window_start
+        # Wait for enough completions that one slow job doesn't dominate the measurement.
+        if elapsed < self.window or self._window_jobs < self.limit:
+            return
+        throughput = self._window_cost / elapsed
+        cpu_busy, mem_available = self.sampler.sample()
+        previous = self._last_throughput
+
+        best = self._best_limit
+        if (
+            best is None
+            or self.limit == best
+            or throughput > self._best_throughput * (1 + self.TOLERANCE)
+            or (self.limit < best and throughput >= self._best_throughput * (1 - self.TOLERANCE))
+        ):
+            self._best_limit, self._best_throughput = self.limit, throughput
+
+        if mem_available is not None and mem_available < self.LOW_MEMORY:
+            step = -1
+            self._hold = 0
+            # The best limit was measured with memory to spare; learn it again.
+            self._best_limit = None
+        elif self._hold:
+            self._hold -= 1
+            step = 0 if self._hold else self._direction
+        elif previous is None or throughput > previous * (1 + self.TOLERANCE):
+            step = self._direction
+        else:
+            # Dropped or flat: return to the best limit and stay there for a while.
+            step = (self._best_limit or self.limit) - self.limit
+            self._hold = self.HOLD_WINDOWS
+            if step == 0:
+                self._direction = -self._direction
+        if step > 0 and cpu_busy is not None and cpu_busy >= self.CPU_SATURATED:
+            step = 0
+
+        new_limit = max(self.min_workers, min(self.max_workers, self.limit + step))
+        if new_limit != self.limit and self.emit is not None:
+            load = []
+            if cpu_busy is not None:
+                load.append(f"CPU {cpu_busy:.0%}")
+            if mem_available is not None:
+                load.append(f"RAM frei {mem_available:.0%}")
+            details = f", {', '.join(load)}" if load else ""
+            self.emit("log", f"Parallelität: {self.limit} → {new_limit} ({throughput:.1f} Kosten/s{details})")
+        if new_limit != self.limit:
+            self._direction = 1 if new_limit > self.limit else -1
+        elif step:
+            # Hit a bound: explore the other way next time.
+            self._direction = -1 if step > 0 else 1
+        self.limit = new_limit
+        self._last_throughput = throughput
+        self._window_start = time.monotonic()
+        self._window_cost = 0.0
+        self._window_jobs = 0
+
+
+def default_worker_count() -> int:
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+class GeneratorLogMode:
+    OFF = "off"
+    FAILED = "failed"
+    ALL = "all"
+
+
+class OutputStage:
+    """Work done on each generated .lip while the batch runs (see BatchRunner `stages`).
+
+    Inline stages run on the slot thread right after generation and can fail the job;
+    process() returns an error text or "". Other stages get the successful jobs through a
+    queue and run on `threads` threads of their own, so generation never waits for them.
+    """
+
+    name = ""
+    inline = False
+    threads = 1
+
+    def process(self, job: Job) -> str:
+        return ""
+
+    def finish(self, canceled: bool) -> list[str]:
+        """Called once after the last job has been processed; returns lines for the log."""
+        return []
+
+    def take_rejected(self) -> list[tuple[Job, str]]:
+        """Jobs an inline stage failed after process() had passed them, with the reason."""
+        return []
+
+
+class _StageWorker:
+    """Queue and threads of one non-inline OutputStage."""
+
+    def __init__(self, stage: OutputStage, emit: Callable[[str, str], None]) -> None:
+        self.stage = stage
+        self.emit = emit
+        self.queue: queue.Queue[Job | None] = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._loop, name=f"lipgen-stage-{stage.name}", daemon=True)
+            for _ in range(max(1, stage.threads))
+        ]
+        for t in self._threads:
+            t.start()
+
+    def _loop(self) -> None:
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            try:
+                error = self.stage.process(job)
+            except Exception as exc:  # noqa: BLE001
+                error = str(exc)
+            if error:
+                self.emit("log", f"WARN {self.stage.name}: {job.lip_path.name}: {error}")
+
+    def close(self) -> None:
+        for _ in self._threads:
+            self.queue.put(None)
+        for t in self._threads:
+            t.join()
+
+
+# Bytes of .lip per second of audio below this share of the batch median are suspicious.
+LIP_MIN_RATE_RATIO = 0.25
+
+
+class LipValidator(OutputStage):
+    """Checks every generated .lip before the job counts as OK.
+
+    LipGenerator's .lip format is not documented, so the animation is not parsed. A file is
+    reported if it is empty, only NUL bytes, shorter than a header, or if it does not match
+    the rest of the batch: every .lip of one generator starts with the same format header,
+    and a file with far fewer bytes per second of audio than the batch median is probably
+    truncated. The reference (median and most common header) comes from the first
+    `sample_size` files. Files checked before `min_samples` files were seen are held back
+    and checked again once the reference exists, or in finish() for small batches; such
+    late failures are handed to the runner through take_rejected().
+    """
+
+    name = "Prüfung"
+    inline = True
+    HEADER_SIZE = 8
+
+    def __init__(
+        self,
+        infos: Mapping[Path, WavInfo] | None = None,
+        min_ratio: float = LIP_MIN_RATE_RATIO,
+        min_samples: int = 20,
+        sample_size: int = 1001,
+    ) -> None:
+        self.infos = infos or {}
+        self.min_ratio = min_ratio
+        self.min_samples = min_samples
+        self.sample_size = sample_size
+        self.checked = 0
+        self.invalid = 0
+        self._rates = array("d")
+        self._headers: dict[bytes, int] = {}
+        self._median = 0.0
+        self._header = b""
+        # (job, size, duration, header) of files checked before the reference existed.
+        self._held: list[tuple[Job, int, float, bytes]] = []
+        self._rejected: list[tuple[Job, str]] = []
+        self._lock = threading.Lock()
+
+    def _duration(self, wav_path: Path) -> float:
+        info = self.infos.get(wav_path)
+        if info is None:
+            info = probe_wav(wav_path)
+        return info.duration
+
+    def process(self, job: Job) -> str:
+        error = self._check(job)
+        with self._lock:
+            self.checked += 1
+            if error:
+                self.invalid += 1
+        return error
+
+    def take_rejected(self) -> list[tuple[Job, str]]:
+        with self._lock:
+            rejected, self._rejected = self._rejected, []
+        return rejected
+
+    def _check(self, job: Job) -> str:
+        try:
+            with job.lip_path.open("rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                head = f.read(4096)
+        except OSError as exc:
+            return f".lip nicht lesbar ({exc})"
+        if size == 0:
+            return "leere .lip-Datei"
+        if not head.strip(b"\0"):
+            return ".lip enthält nur Nullbytes"
+        if size < self.HEADER_SIZE:
+            return f".lip zu kurz für einen Header ({size} Bytes)"
+
+        header = head[:4]
+        duration = self._duration(job.wav_path)
+        with self._lock:
+            if len(self._rates) < self.sample_size:
+                self._headers[header] = self._headers.get(header, 0) + 1
+                if duration > 0:
+                    self._rates.append(size / duration)
+                if not self._median and len(self._rates) >= self.min_samples:
+                    self._set_reference()
+            if not self._median:
+                self._held.append((job, size, duration, header))
+                return ""
+            return self._compare(size, duration, header)
+
+    def _set_reference(self) -> None:
+        """Fix median and header from the samples and check the held files against them (lock held)."""
+        ordered = sorted(self._rates)
+        self._median = ordered[len(ordered) // 2]
+        header, count = max(self._headers.items(), key=lambda item: item[1])
+        # Only a clear majority is a format header; otherwise the first bytes are data.
+        self._header = header if count * 2 > sum(self._headers.values()) else b""
+        for job, size, duration, head in self._held:
+            error = self._compare(size, duration, head)
+            if error:
+                self.invalid += 1
+                self._rejected.append((job, error))
+        self._held = []
+
+    def _compare(self, size: int, duration: float, header: bytes) -> str:
+        if self._header and header != self._header:
+            return f"unerwarteter .lip-Header {header.hex(' ')} (sonst {self._header.hex(' ')})"
+        median = self._median
+        if duration > 0 and median and size / duration < median * self.min_ratio:
+            return f"vermutlich abgeschnitten: {size} Bytes für {duration:.1f}s Audio (Median {median:.0f} Bytes/s)"
+        return ""
+
+    def finish(self, canceled: bool) -> list[str]:
+        with self._lock:
+            # Small batches: check what was held against the reference of what is there.
+            if self._held and len(self._rates) >= 3:
+                self._set_reference()
+            checked, invalid = self.checked, self.invalid
+        return [f"Prüfung: {checked} .lip geprüft, {invalid} ungültig"]
+
+
+class ZipPackager(OutputStage):
+    """Streams each generated .lip into <output folder>/lipgui_lips.zip while the batch runs.
+
+    Entries keep their path below the output folder (so the preserve_structure layout). An
+    existing archive is updated: entries of this run replace their old versions, the others
+    are copied over from it when the run ends. A sha256sum-style manifest of the whole
+    archive is written next to it.
+    """
+
+    name = "Zip"
+    threads = 1
+    ARCHIVE_NAME = "lipgui_lips.zip"
+
+    def __init__(self, roots: Iterable[Path]) -> None:
+        # Deepest folder first, so nested output folders get their own archive.
+        self.roots = sorted({Path(r) for r in roots}, key=lambda p: len(p.parts), reverse=True)
+        self.added = 0
+        # root -> (part archive being written (zipfile.ZipFile, imported on first use),
+        #          sha256 per entry name, names generated again later)
+        self._archives: dict[Path, tuple[object, dict[str, str], dict[str, Path]]] = {}
+
+    def _root_for(self, lip_path: Path) -> Path | None:
+        for root in self.roots:
+            if lip_path.is_relative_to(root):
+                return root
+        return None
+
+    @staticmethod
+    def _zip_info(arcname: str, mtime: float) -> object:
+        import zipfile
+
+        info = zipfile.ZipInfo(arcname, date_time=time.localtime(max(mtime, 315532800))[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        return info
+
+    def process(self, job: Job) -> str:
+        import zipfile
+
+        root = self._root_for(job.lip_path)
+        if root is None:
+            return "liegt in keinem Output-Ordner"
+        entry = self._archives.get(root)
+        if entry is None:
+            part = root / (self.ARCHIVE_NAME + ".part")
+            entry = (zipfile.ZipFile(part, "w", compression=zipfile.ZIP_DEFLATED), {}, {})
+            self._archives[root] = entry
+        archive, digests, regenerated = entry
+        arcname = job.lip_path.relative_to(root).as_posix()
+        if arcname in digests:
+            # Generated twice (watch mode): a zip can't replace an entry, so add the latest at the end.
+            regenerated[arcname] = job.lip_path
+            return ""
+        data = job.lip_path.read_bytes()
+        archive.writestr(self._zip_info(arcname, job.lip_path.stat().st_mtime), data)  # type: ignore[attr-defined]
+        digests[arcname] = hashlib.sha256(data).hexdigest()
+        self.added += 1
+        return ""
+
+    def finish(self, canceled: bool) -> list[str]:
+        lines: list[str] = []
+        for root, (archive, digests, regenerated) in self._archives.items():
+            archive.close()  # type: ignore[attr-defined]
+            target = root / self.ARCHIVE_NAME
+            # Regenerated entries are already among the digests; _complete adds the old ones.
+            new = len(digests)
+            try:
+                total = self._complete(root / (self.ARCHIVE_NAME + ".part"), target, digests, regenerated)
+            except (OSError, ValueError) as exc:
+                lines.append(f"WARN: Archiv {target} konnte nicht geschrieben werden: {exc}")
+                continue
+            again = f", {len(regenerated)} davon mehrfach erzeugt" if regenerated else ""
+            lines.append(f"Archiv: {target} ({new} neu{again}, {total} insgesamt)")
+        return lines
+
+    def _complete(self, part: Path, target: Path, digests: dict[str, str], regenerated: dict[str, Path]) -> int:
+        """Merge the part archive with regenerated and old entries into `target`; returns the entry count."""
+        import zipfile
+
+        if not regenerated and not target.exists():
+            os.replace(part, target)
+        else:
+            merged = target.with_name(target.name + ".tmp")
+            with zipfile.ZipFile(merged, "w", compression=zipfile.ZIP_DEFLATED) as dst:
+                with zipfile.ZipFile(part) as src:
+                    for info in src.infolist():
+                        if info.filename not in regenerated:
+                            dst.writestr(info, src.read(info))
+                for arcname, lip_path in regenerated.items():
+                    data = lip_path.read_bytes()
+                    dst.writestr(self._zip_info(arcname, lip_path.stat().st_mtime), data)
+                    digests[arcname] = hashlib.sha256(data).hexdigest()
+                if target.exists():
+                    with zipfile.ZipFile(target) as old:
+                        for info in old.infolist():
+                            if info.filename not in digests:
+                                data = old.read(info)
+                                dst.writestr(info, data)
+                                digests[info.filename] = hashlib.sha256(data).hexdigest()
+            os.replace(merged, target)
+            part.unlink(missing_ok=True)
+        manifest = target.with_name(target.name + ".sha256")
+        manifest.write_text("".join(f"{digests[name]}  {name}\n" for name in sorted(digests)), encoding="utf-8")
+        return len(digests)
+
+
+FUZ_MAGIC = b"FUZE"
+FUZ_VERSION = 1
+
+
+def _copy_file_into(dst: io.BufferedIOBase, src_path: Path) -> None:
+    """Append src_path to dst: os.sendfile where available (no copy through Python), else 1 MB chunks."""
+    with src_path.open("rb") as src:
+        size = os.fstat(src.fileno()).st_size
+        if hasattr(os, "sendfile") and os.name != "nt":
+            dst.flush()
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                # sendfile writes at the fd position and does not move the Python file object.
+                dst.seek(0, os.SEEK_END)
+                if offset == size:
+                    return
+            except OSError:
+                pass
+            src.seek(offset)
+        import shutil
+
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def write_fuz(fuz_path: Path, lip_path: Path, xwm_path: Path) -> None:
+    """Write a Skyrim .fuz: b"FUZE", uint32 version, uint32 .lip size, the .lip, the .xwm audio."""
+    lip = lip_path.read_bytes()
+    staged = fuz_path.with_name(fuz_path.name + ".part")
+    try:
+        with staged.open("wb") as f:
+            f.write(FUZ_MAGIC + struct.pack("<II", FUZ_VERSION, len(lip)))
+            f.write(lip)
+            _copy_file_into(f, xwm_path)
+        os.replace(staged, fuz_path)
+    except BaseException:
+        staged.unlink(missing_ok=True)
+        raise
+
+
+class FuzPacker(OutputStage):
+    """Packs each generated .lip with the .xwm next to its WAV into a .fuz next to the .lip.
+
+    Jobs without an .xwm are left alone. The stage runs right after the .lip was written, so
+    a .fuz is kept only if it already holds the same .lip bytes and is newer than the .xwm
+    (with the matching total size); regenerating a lip usually yields the same bytes.
+    """
+
+    name = "FUZ"
+    threads = 2
+
+    def __init__(self) -> None:
+        self.packed = 0
+        self.unchanged = 0
+        self.no_xwm = 0
+        self._lock = threading.Lock()
+
+    def process(self, job: Job) -> str:
+        xwm_path = job.wav_path.with_suffix(".xwm")
+        fuz_path = job.lip_path.with_suffix(".fuz")
+        try:
+            xwm = xwm_path.stat()
+        except OSError:
+            with self._lock:
+                self.no_xwm += 1
+            return ""
+        lip = job.lip_path.read_bytes()
+        unchanged = self._holds(fuz_path, lip, xwm)
+        if not unchanged:
+            write_fuz(fuz_path, job.lip_path, xwm_path)
+        with self._lock:
+            if unchanged:
+                self.unchanged += 1
+            else:
+                self.packed += 1
+        return ""
+
+    @staticmethod
+    def _holds(fuz_path: Path, lip: bytes, xwm: os.stat_result) -> bool:
+        """Whether fuz_path already is the .fuz of these lip bytes and this .xwm."""
+        try:
+            fuz = fuz_path.stat()
+            if fuz.st_size != 12 + len(lip) + xwm.st_size or fuz.st_mtime_ns < xwm.st_mtime_ns:
+                return False
+            with fuz_path.open("rb") as f:
+                return f.read(12) == FUZ_MAGIC + struct.pack("<II", FUZ_VERSION, len(lip)) and f.read(len(lip)) == lip
+        except OSError:
+            return False
+
+    def finish(self, canceled: bool) -> list[str]:
+        return [f"FUZ: {self.packed} geschrieben, {self.unchanged} unverändert, {self.no_xwm} ohne .xwm"]
+
+
+class BatchRunner:
+    """Runs jobs through a pool of LipGenerator processes, most expensive job first.
+
+    How a job becomes a .lip is up to `backend` (default: SpawnBackend, one process per job);
+    `stages` check or package the results (see OutputStage).
+
+    Pending jobs are ordered by estimated cost, so idle slots always take the most
+    expensive one (longest-processing-time-first, which minimizes the makespan). Jobs can be
+    submitted while the batch runs, e.g. by watch mode.
+
+    Progress is reported through `emit(kind, payload)` using the same message kinds as the
+    GUI queue ("log", "total", "progress_cost"), so the runner itself has no Tk dependency.
+    """
+
+    def __init__(
+        self,
+        lipgenerator_dir: Path,
+        exe_path: Path,
+        language: str,
+        gesture: str,
+        workers: int,
+        emit: Callable[[str, str], None],
+        stop_event: threading.Event,
+        pause_event: threading.Event,
+        controller: ConcurrencyController | None = None,
+        output_limit: int = GENERATOR_OUTPUT_LIMIT,
+        log_dir: Path | None = None,
+        log_mode: str = GeneratorLogMode.OFF,
+        profiler: PhaseProfiler | None = None,
+        backend: GeneratorBackend | None = None,
+        accounting_path: Path | None = None,
+        stages: Sequence[OutputStage] = (),
+    ) -> None:
+        self.lipgenerator_dir = lipgenerator_dir
+        self.exe_path = exe_path
+        self.language = language
+        self.gesture = gesture
+        self.workers = max(1, workers)
+        self.emit = emit
+        self.stop_event = stop_event
+        self.pause_event = pause_event
+        self.output_limit = output_limit
+        # Complete generator output per job goes to log_dir (GeneratorLogMode.FAILED keeps only failures).
+        self.log_dir = log_dir if log_mode != GeneratorLogMode.OFF else None
+        self.log_mode = log_mode
+        self.profiler = profiler or PhaseProfiler()
+        self.backend = backend or SpawnBackend(lipgenerator_dir, exe_path, gesture, output_limit)
+        # One TSV row per job with wall time, CPU time and peak memory of its process.
+        self.accounting_path = accounting_path
+        self._accounting: io.TextIOBase | None = None
+        self.usage: list[tuple[str, ChildUsage]] = []
+        self.stages = list(stages)
+        self._stage_workers: list[_StageWorker] = []
+        # With a controller, `workers` threads exist but only `controller.limit` of them run a process.
+        self.controller = controller
+        if controller is not None:
+            self.workers = controller.max_workers
+
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        # Each submit() adds a batch: its jobs, their costs and the job indices by falling cost.
+        # The heap holds one entry per batch with pending jobs, (-cost of its next job, batch no.),
+        # so queued jobs cost 12 bytes each and stay unmaterialized in their (JobTable) batch.
+        self._batches: list[tuple[Sequence[Job], array[float], array[int]]] = []
+        self._cursors: list[int] = []
+        self._heap: list[tuple[float, int]] = []
+        self._submitted = 0
+        self._closed = False
+        self._next = 0
+        self._done = 0
+        self._cost_done = 0.0
+        self._cost_total = 0.0
+        # Output folders already created by submit(); see prepare_output_dirs.
+        self._output_dirs: set[Path] = set()
+        self.ok = 0
+        self.failed = 0
+        # Wall-clock seconds per finished job, in completion order.
+        self.job_seconds: list[float] = []
+        # Jobs that failed (not canceled) with the reason, e.g. to run them again.
+        self.failed_jobs: list[tuple[Job, str]] = []
+
+    def submit(self, jobs: Sequence[Job], costs: Sequence[float] | None = None) -> None:
+        """Queue jobs; idle slots pick them up right away."""
+        if not jobs:
+            return
+        cost_array = array("d", costs if costs is not None else (estimate_job_cost(j) for j in jobs))
+        # Stable sort: jobs of equal cost keep their (path) order.
+        order = array("I", sorted(range(len(jobs)), key=cost_array.__getitem__, reverse=True))
+        for folder, exc in prepare_output_dirs(jobs, self._output_dirs):
+            self.emit("log", f"WARN: Output-Ordner konnte nicht angelegt werden: {folder} ({exc})")
+        with self._cond:
+            batch_no = len(self._batches)
+            self._batches.append((jobs, cost_array, order))
+            self._cursors.append(0)
+            heapq.heappush(self._heap, (-cost_array[order[0]], batch_no))
+            self._submitted += len(jobs)
+            self._cost_total += sum(cost_array)
+            total = self._submitted
+            self._cond.notify_all()
+        self.emit("total", str(total))
+
+    def close(self) -> None:
+        """No more jobs will be submitted; run() returns once the queue is drained."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def run(self, jobs: Sequence[Job], costs: Sequence[float] | None = None, keep_open: bool = False) -> tuple[int, int]:
+        """Run the jobs (and, with keep_open, everything submitted until close()). Returns (ok, failed)."""
+        if self.log_dir is not None:
+            try:
+                self.log_dir.mkdir(parents=True, exist_ok=True)
+                self.emit("log", f"Generator-Ausgaben: {self.log_dir}")
+            except OSError as exc:
+                self.emit("log", f"WARN: Log-Ordner nicht verfügbar ({exc}), Ausgaben werden nicht gespeichert.")
+                self.log_dir = None
+        if self.accounting_path is not None:
+            try:
+                self.accounting_path.parent.mkdir(parents=True, exist_ok=True)
+                self._accounting = self.accounting_path.open("w", encoding="utf-8", newline="")
+                self._accounting.write("index\twav\tlanguage\tok\twall_s\tcpu_user_s\tcpu_system_s\tpeak_rss_mb\tcost\n")
+            except OSError as exc:
+                self.emit("log", f"WARN: Ressourcen-Protokoll nicht möglich ({exc}).")
+        self.submit(jobs, costs)
+        if not keep_open:
+            self.close()
+        started = time.perf_counter()
+
+        self._stage_workers = [_StageWorker(stage, self.emit) for stage in self.stages if not stage.inline]
+        slots = self.workers if keep_open else min(self.workers, self._submitted)
+        threads = [
+            threading.Thread(target=self._slot_loop, args=(n,), name=f"lipgen-{n}", daemon=True) for n in range(slots)
+        ]
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            self.backend.close()
+            for worker in self._stage_workers:
+                worker.close()
+            for stage in self.stages:
+                lines = stage.finish(canceled=self.stop_event.is_set())
+                self._reject_late(stage)
+                for line in lines:
+                    self.emit("log", line)
+            if self._accounting is not None:
+                self._accounting.close()
+                self.emit("log", f"Ressourcen je Datei: {self.accounting_path}")
+
+        if self.stop_event.is_set():
+            self.emit("log", f"Abgebrochen. Fertig: {self._done}/{self._submitted}")
+        if self.job_seconds:
+            ordered = sorted(self.job_seconds)
+            self.emit(
+                "log",
+                f"Laufzeit: {time.perf_counter() - started:.1f}s, erster Job {self.job_seconds[0]:.2f}s, "
+                f"Median {ordered[len(ordered) // 2]:.2f}s, langsamster {ordered[-1]:.2f}s",
+            )
+        if self.usage:
+            name, heaviest = max(self.usage, key=lambda item: item[1].peak_rss_mb)
+            cpu = sorted(u.cpu_user + u.cpu_system for _, u in self.usage)
+            self.emit(
+                "log",
+                f"Speicher je Prozess: max {heaviest.peak_rss_mb:.0f} MB ({name}), "
+                f"CPU-Zeit Median {cpu[len(cpu) // 2]:.2f}s, max {cpu[-1]:.2f}s",
+            )
+        return self.ok, self.failed
+
+    def _take(self) -> tuple[int, Job, float] | None:
+        with self._cond:
+            while not self._heap:
+                if self._closed or self.stop_event.is_set():
+                    return None
+                self._cond.wait(timeout=0.2)
+            _, batch_no = self._heap[0]
+            jobs, costs, order = self._batches[batch_no]
+            cursor = self._cursors[batch_no]
+            index = order[cursor]
+            cursor += 1
+            self._cursors[batch_no] = cursor
+            if cursor < len(order):
+                heapq.heapreplace(self._heap, (-costs[order[cursor]], batch_no))
+            else:
+                heapq.heappop(self._heap)
+                # Let a finished batch (and its table) go.
+                self._batches[batch_no] = ((), array("d"), array("I"))
+            self._next += 1
+            return self._next, jobs[index], costs[index]
+
+    def _drained(self) -> bool:
+        return self.stop_event.is_set() or (self._closed and not self._heap)
+
+    def _slot_loop(self, slot: int) -> None:
+        with self.profiler.phase("worker"):
+            self._slot_jobs(slot)
+
+    def _slot_jobs(self, slot: int) -> None:
+        while not self.stop_event.is_set():
+            # Pause point between files
+            while not self.pause_event.is_set() and not self.stop_event.is_set():
+                self.stop_event.wait(timeout=0.2)
+            if self.stop_event.is_set():
+                break
+
+            controller = self.controller
+            if controller is not None and not controller.acquire(self._drained):
+                break
+            item = self._take()
+            try:
+                if item is None:
                     break
-            if not text:
-                # Fallback: still produce something usable, but warn.
-                text = text_from_filename(wav_path)
-                note = "WARN: Kein Mapping-Eintrag gefunden, nutze Dateiname als Text."
-        else:
-            raise ValueError("Unbekannte Textquelle.")
+                self._run_job(*item, slot=slot)
+            finally:
+                if controller is not None:
+                    controller.release(item[2] if item is not None else 0.0)
+
+    def _run_job(self, idx: int, job: Job, cost: float, slot: int = 0) -> None:
+        lines = [f"[{idx}/{self._submitted}] {job.wav_path.name} → {job.lip_path.name}"]
+        if job.language and job.language != self.language:
+            lines[0] += f" ({job.language})"
+        if job.note:
+            lines.append(f"  {job.note}")
+
+        spill_path: Path | None = None
+        if self.log_dir is not None:
+            spill_path = self.log_dir / f"{idx:06d}_{job.wav_path.stem}.log"
+        problems: list[str] = []
+        usage: list[ChildUsage] = []
+        started = time.perf_counter()
+        try:
+            cp, was_killed = self.backend.run(
+                job=job,
+                language=job.language or self.language,
+                stop_event=self.stop_event,
+                pause_event=self.pause_event,
+                problems=problems,
+                spill_path=spill_path,
+                slot=slot,
+                usage=usage,
+            )
+        except Exception as exc:  # noqa: BLE001
+            lines.append(f"  FEHLER: {exc}")
+            self._finish(lines, cost, ok=False, job=job, reason=str(exc))
+            return
 
-        jobs.append(Job(wav_path=wav_path, lip_path=lip_path, text=text, note=note))
+        if was_killed and self.stop_event.is_set():
+            lines.append("  Abgebrochen (Prozess beendet).")
+            self._finish(lines, cost, ok=False)
+            return
 
-    return jobs
+        wall = time.perf_counter() - started
+        ok = cp.returncode == 0 and job.lip_path.exists()
+        reason = "" if ok else (f"Exit-Code {cp.returncode}" if cp.returncode else ".lip fehlt")
+        for stage in self.stages:
+            if ok and stage.inline:
+                try:
+                    reason = stage.process(job)
+                except Exception as exc:  # noqa: BLE001
+                    reason = str(exc)
+                if reason:
+                    ok = False
+                    lines.append(f"  UNGÜLTIG: {reason}")
+                self._reject_late(stage)
+        with self._lock:
+            self.job_seconds.append(wall)
+            if usage:
+                self.usage.append((job.wav_path.name, usage[0]))
+            if self._accounting is not None:
+                u = usage[0] if usage else None
+                self._accounting.write(
+                    f"{idx}\t{job.wav_path}\t{job.language or self.language}\t{int(ok)}\t{wall:.3f}\t"
+                    + (f"{u.cpu_user:.3f}\t{u.cpu_system:.3f}\t{u.peak_rss_mb:.1f}" if u else "\t\t")
+                    + f"\t{cost:.3f}\n"
+                )
+        lines.extend(f"  {line}" for line in relevant_output_lines(cp, problems, ok))
+        if not ok and cp.returncode:
+            lines.append(f"  Exit-Code: {cp.returncode}")
+        if spill_path is not None:
+            if ok and self.log_mode == GeneratorLogMode.FAILED:
+                spill_path.unlink(missing_ok=True)
+            elif not ok:
+                lines.append(f"  Vollständige Ausgabe: {spill_path}")
+        if ok:
+            for worker in self._stage_workers:
+                worker.queue.put(job)
+        self._finish(lines, cost, ok=ok, job=job, reason=reason)
+
+    def _reject_late(self, stage: OutputStage) -> None:
+        """Count jobs a stage failed after the fact as failed instead of OK."""
+        for job, reason in stage.take_rejected():
+            with self._lock:
+                self.ok -= 1
+                self.failed += 1
+                self.failed_jobs.append((job, reason))
+            self.emit("log", f"UNGÜLTIG (nachgeprüft) {job.lip_path.name}: {reason}")
+
+    def _finish(self, lines: list[str], cost: float, ok: bool, job: Job | None = None, reason: str = "") -> None:
+        with self._lock:
+            if ok:
+                self.ok += 1
+            else:
+                self.failed += 1
+                if job is not None:
+                    self.failed_jobs.append((job, reason))
+            self._done += 1
+            self._cost_done += cost
+            done, fraction = self._done, min(1.0, self._cost_done / self._cost_total)
+        # One message per job keeps output of parallel jobs from interleaving.
+        self.emit("log", "\n".join(lines))
+        self.emit("progress_cost", f"{done}\t{fraction:.6f}")
+
+
+class _InotifyBackend:
+    """Linux inotify on the input tree via ctypes (no extra dependency)."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    _MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, root: Path, recursive: bool) -> None:
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 fehlgeschlagen")
+        self._recursive = recursive
+        self._dirs: dict[int, Path] = {}
+        self._root = root
+        self._watch_tree(root)
+
+    def _watch(self, folder: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), self._MASK)
+        if wd >= 0:
+            self._dirs[wd] = folder
+
+    def _watch_tree(self, folder: Path) -> list[Path]:
+        """Watch folder (and subfolders if recursive); returns files already in it."""
+        found: list[Path] = []
+        self._watch(folder)
+        if not self._recursive:
+            return [folder / n for n in os.listdir(folder)] if folder.is_dir() else []
+        for dirpath, dirnames, filenames in os.walk(folder):
+            for d in dirnames:
+                self._watch(Path(dirpath) / d)
+            found.extend(Path(dirpath) / f for f in filenames)
+        return found
+
+    def poll(self, timeout: float) -> list[Path] | None:
+        """Changed paths, or None if the kernel queue overflowed (caller must rescan)."""
+        import select
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            buf = os.read(self._fd, 256 * 1024)
+        except BlockingIOError:
+            return []
+        changed: list[Path] = []
+        pos = 0
+        while pos + self._EVENT.size <= len(buf):
+            wd, mask, _, name_len = self._EVENT.unpack_from(buf, pos)
+            name = buf[pos + self._EVENT.size:pos + self._EVENT.size + name_len].rstrip(b"\0")
+            pos += self._EVENT.size + name_len
+            if mask & self.IN_Q_OVERFLOW:
+                return None
+            if mask & self.IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            folder = self._dirs.get(wd)
+            if folder is None or not name:
+                continue
+            path = folder / os.fsdecode(name)
+            if mask & self.IN_ISDIR:
+                if self._recursive and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    # Files may land in the new folder before its watch exists.
+                    changed.extend(self._watch_tree(path))
+                continue
+            changed.append(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _PollingBackend:
+    """Portable fallback: compares (size, mtime) snapshots of the tree every interval."""
+
+    def __init__(self, root: Path, recursive: bool, interval: float = 2.0) -> None:
+        self._root = root
+        self._recursive = recursive
+        self._interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for dirpath, dirnames, filenames in os.walk(self._root):
+            if not self._recursive:
+                dirnames.clear()
+            for name in filenames:
+                if name.lower().endswith(WATCHED_SUFFIXES):
+                    p = Path(dirpath) / name
+                    try:
+                        st = p.stat()
+                    except OSError:
+                        continue
+                    snapshot[p] = (st.st_size, st.st_mtime_ns)
+        return snapshot
 
+    def poll(self, timeout: float) -> list[Path] | None:
+        time.sleep(max(timeout, self._interval))
+        current = self._scan()
+        changed = [p for p, sig in current.items() if self._snapshot.get(p) != sig]
+        self._snapshot = current
+        return changed
 
-def run_lipgenerator(
-    lipgenerator_dir: Path,
-    exe_path: Path,
-    job: Job,
-    language: str,
-    gesture_exaggeration: str,
-) -> subprocess.CompletedProcess[str]:
-    job.lip_path.parent.mkdir(parents=True, exist_ok=True)
+    def close(self) -> None:
+        pass
 
-    args: list[str] = [
-        str(exe_path),
-        str(job.wav_path),
-        job.text,
-        f"-Language:{language}",
-        f"-OutputFileName:{job.lip_path}",
-    ]
-    gesture_exaggeration = gesture_exaggeration.strip()
-    if gesture_exaggeration:
-        args.append(f"-GestureExaggeration:{gesture_exaggeration}")
 
-    return subprocess.run(
-        args,
-        cwd=str(lipgenerator_dir),
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+WATCHED_SUFFIXES = (".wav", ".txt")
 
 
-def run_lipgenerator_background(
-    lipgenerator_dir: Path,
-    exe_path: Path,
-    job: Job,
-    language: str,
-    gesture_exaggeration: str,
-    stop_event: threading.Event,
-    pause_event: threading.Event,
-) -> tuple[subprocess.CompletedProcess[str], bool]:
-    """Run LipGenerator without popping up a console window (Windows) and allow canceling mid-file.
+class WatchSession:
+    """Watch mode: feeds new or changed WAVs of the input folder into a running BatchRunner.
 
-    Returns (CompletedProcess, was_killed).
+    File events (inotify on Linux, polling elsewhere) are debounced until a file's size and
+    mtime stay unchanged for `debounce` seconds, so half-written recordings aren't picked up.
+    A WAV is queued when it is new, its content changed, or its text changed (edited sidecar
+    .txt or a reloaded mapping file).
     """
-    job.lip_path.parent.mkdir(parents=True, exist_ok=True)
-
-    args: list[str] = [
-        str(exe_path),
-        str(job.wav_path),
-        job.text,
-        f"-Language:{language}",
-        f"-OutputFileName:{job.lip_path}",
-    ]
-    gesture_exaggeration = gesture_exaggeration.strip()
-    if gesture_exaggeration:
-        args.append(f"-GestureExaggeration:{gesture_exaggeration}")
 
-    creationflags = 0
-    startupinfo = None
-    if os.name == "nt":
-        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    def __init__(
+        self,
+        runner: BatchRunner,
+        input_folder: Path,
+        output_folder: Path,
+        recursive: bool,
+        preserve_structure: bool,
+        text_source: str,
+        fixed_text: str,
+        mapping_files: list[Path],
+        load_mapping: Callable[[list[Path]], Mapping[str, str]] | None,
+        mapping: Mapping[str, str] | None,
+        known_jobs: Sequence[Job],
+        emit: Callable[[str, str], None],
+        stop_event: threading.Event,
+        probe_cache: WavProbeCache | None = None,
+        debounce: float = 2.0,
+    ) -> None:
+        self.runner = runner
+        self.input_folder = input_folder
+        self.output_folder = output_folder
+        self.recursive = recursive
+        self.preserve_structure = preserve_structure
+        self.text_source = text_source
+        self.fixed_text = fixed_text
+        self.mapping_files = mapping_files
+        self.load_mapping = load_mapping
+        self.mapping = mapping
+        self.emit = emit
+        self.stop_event = stop_event
+        self.probe_cache = probe_cache
+        self.debounce = debounce
+
+        self._texts: dict[Path, str] = {j.wav_path: j.text for j in known_jobs}
+        self._signatures: dict[Path, tuple[int, int]] = {}
+        for wav_path in self._texts:
+            sig = self._signature(wav_path)
+            if sig is not None:
+                self._signatures[wav_path] = sig
+        self._mapping_sigs = [self._signature(p) for p in mapping_files]
+        # path -> (time of last change, signature seen then)
+        self._pending: dict[Path, tuple[float, tuple[int, int] | None]] = {}
+
+    @staticmethod
+    def _signature(path: Path) -> tuple[int, int] | None:
         try:
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = 0  # SW_HIDE
-        except Exception:
-            startupinfo = None
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
 
-    proc = subprocess.Popen(
-        args,
-        cwd=str(lipgenerator_dir),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        creationflags=creationflags,
-        startupinfo=startupinfo,
-    )
+    def _make_backend(self) -> _InotifyBackend | _PollingBackend:
+        if sys.platform.startswith("linux"):
+            try:
+                return _InotifyBackend(self.input_folder, self.recursive)
+            except (OSError, AttributeError):
+                pass
+        return _PollingBackend(self.input_folder, self.recursive)
 
-    was_killed = False
-    try:
-        # Poll loop so we can pause/stop responsively.
-        while True:
-            if stop_event.is_set():
-                was_killed = True
-                try:
-                    proc.terminate()
-                except Exception:
-                    pass
-                break
+    def run(self) -> None:
+        backend = self._make_backend()
+        mode = "inotify" if isinstance(backend, _InotifyBackend) else "Polling"
+        self.emit("log", f"Überwache {self.input_folder} ({mode}) – Stop beendet die Überwachung.")
+        try:
+            while not self.stop_event.is_set():
+                changed = backend.poll(timeout=0.5)
+                if changed is None:
+                    # Event queue overflowed: treat everything as possibly changed.
+                    changed = find_wav_files(self.input_folder, self.recursive)
+                now = time.monotonic()
+                for path in changed:
+                    if path.suffix.lower() in WATCHED_SUFFIXES:
+                        self._pending[path] = (now, self._signature(path))
+                self._check_mapping()
+                self._flush_stable(now)
+        finally:
+            backend.close()
+
+    def _check_mapping(self) -> None:
+        if self.text_source != TextSource.MAPPING_FILE or self.load_mapping is None:
+            return
+        sigs = [self._signature(p) for p in self.mapping_files]
+        if sigs == self._mapping_sigs:
+            return
+        self._mapping_sigs = sigs
+        try:
+            mapping = self.load_mapping(self.mapping_files)
+        except Exception as exc:  # noqa: BLE001
+            # Probably still being written; try again on the next change.
+            self.emit("log", f"WARN: Mapping konnte nicht neu geladen werden: {exc}")
+            return
+        close_text_mapping(self.mapping)
+        self.mapping = mapping
+        self.emit("log", "Mapping geändert, prüfe Texte…")
+        self._enqueue(list(self._texts), reason="Text geändert", text_only=True)
+
+    def _flush_stable(self, now: float) -> None:
+        ready: list[Path] = []
+        for path, (changed_at, sig) in list(self._pending.items()):
+            if now - changed_at < self.debounce:
+                continue
+            current = self._signature(path)
+            if current != sig:
+                # Still being written.
+                self._pending[path] = (now, current)
+                continue
+            del self._pending[path]
+            if current is None:
+                continue
+            if path.suffix.lower() == ".txt":
+                for sibling in (path.with_suffix(".wav"), path.with_suffix(".WAV")):
+                    if sibling in self._texts or sibling.exists():
+                        ready.append(sibling)
+                        break
+            else:
+                ready.append(path)
+        if ready:
+            self._enqueue(ready, reason="neu/geändert")
+
+    def _enqueue(self, wav_paths: list[Path], reason: str, text_only: bool = False) -> None:
+        jobs: list[Job] = []
+        for wav_path in dict.fromkeys(wav_paths):
+            sig = self._signature(wav_path)
+            if sig is None:
+                continue
+            try:
+                job = build_job(
+                    wav_path,
+                    self.input_folder,
+                    self.output_folder,
+                    self.preserve_structure,
+                    self.text_source,
+                    self.fixed_text,
+                    self.mapping,
+                )
+            except Exception as exc:  # noqa: BLE001
+                self.emit("log", f"  ÜBERSPRUNGEN {wav_path.name}: {exc}")
+                continue
+            unchanged_audio = self._signatures.get(wav_path) == sig
+            unchanged_text = self._texts.get(wav_path) == job.text
+            if unchanged_text and (unchanged_audio or text_only):
+                continue
+            jobs.append(job)
 
-            # If paused, wait here but still allow stopping.
-            if not pause_event.is_set():
-                if stop_event.wait(timeout=0.2):
-                    continue
+        if not jobs:
+            return
+        infos = probe_wav_files([j.wav_path for j in jobs], cache=self.probe_cache, stop_event=self.stop_event)
+        accepted: list[Job] = []
+        for job in jobs:
+            info = infos.get(job.wav_path)
+            if info is not None and not info.ok:
+                self.emit("log", f"  ÜBERSPRUNGEN {job.wav_path.name}: {info.error}")
                 continue
+            self._texts[job.wav_path] = job.text
+            sig = self._signature(job.wav_path)
+            if sig is not None:
+                self._signatures[job.wav_path] = sig
+            accepted.append(job)
+        if accepted:
+            self.emit("log", f"{len(accepted)} Datei(en) {reason}, in Warteschlange.")
+            if self.probe_cache is not None:
+                self.probe_cache.save()
+            self.runner.submit(accepted, [estimate_job_cost(j, infos.get(j.wav_path)) for j in accepted])
+
+
+class ProfileMode:
+    OFF = "off"
+    TIMERS = "timers"
+    FULL = "full"
+
+
+class _Phase:
+    __slots__ = ("_profiler", "_name", "_memory", "_started", "_profile", "_outer")
+
+    def __init__(self, profiler: PhaseProfiler, name: str, memory: bool) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._memory = memory
+        self._profile: object = None  # cProfile.Profile, imported on first use
+        self._outer = False
+
+    def __enter__(self) -> None:
+        profiler = self._profiler
+        if not profiler.enabled:
+            return
+        local = profiler._local
+        depth = getattr(local, "depth", 0)
+        local.depth = depth + 1
+        # cProfile only for the outermost phase of a thread; nested profilers would
+        # replace each other.
+        self._outer = depth == 0
+        if profiler.full and self._outer:
+            self._profile = profiler._thread_profile(self._name)
+            try:
+                self._profile.enable()  # type: ignore[attr-defined]
+            except ValueError:
+                # Python 3.12+ allows one active profiler per process, e.g. a second worker slot.
+                self._profile = None
+                profiler._skipped_profile(self._name)
+            if self._memory:
+                import tracemalloc
+
+                # Process-wide: only phases that never overlap with another one reset it.
+                tracemalloc.reset_peak()
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        profiler = self._profiler
+        if not profiler.enabled:
+            return
+        elapsed = time.perf_counter() - self._started
+        if self._profile is not None:
+            self._profile.disable()  # type: ignore[attr-defined]
+        peak = 0
+        if profiler.full and self._outer and self._memory:
+            import tracemalloc
+
+            peak = tracemalloc.get_traced_memory()[1]
+        profiler._local.depth -= 1
+        profiler._record(self._name, elapsed, peak)
+
+
+class PhaseProfiler:
+    """High-resolution timers for the phases of a run (scan, mapping, build_jobs, worker, …).
+
+    ProfileMode.FULL additionally runs cProfile per phase and thread and, for phases
+    opened with memory=True, the tracemalloc peak of the whole process while the phase ran.
+    The peak counter is global, so only phases that never overlap with another one may ask
+    for it. write() puts the report and dumps into a folder. A profiler in ProfileMode.OFF
+    only costs an attribute check per phase.
+    """
 
-            rc = proc.poll()
-            if rc is not None:
-                break
-            stop_event.wait(timeout=0.2)
+    def __init__(self, mode: str = ProfileMode.OFF) -> None:
+        self.mode = mode
+        self.enabled = mode in (ProfileMode.TIMERS, ProfileMode.FULL)
+        self.full = mode == ProfileMode.FULL
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # name -> [calls, total seconds, longest call, memory peak]
+        self._stats: dict[str, list[float]] = {}
+        self._profiles: dict[str, list[object]] = {}
+        # name -> phases that ran without cProfile (another profiler was active)
+        self._unprofiled: dict[str, int] = {}
+        self._started_tracing = False
+        if self.full:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+
+    def phase(self, name: str, memory: bool = False) -> _Phase:
+        return _Phase(self, name, memory)
+
+    def add(self, name: str, elapsed: float) -> None:
+        """Count elapsed seconds as one call of name, for code too hot for a phase."""
+        if self.enabled:
+            self._record(name, elapsed, 0)
+
+    def _thread_profile(self, name: str) -> object:
+        profiles = getattr(self._local, "profiles", None)
+        if profiles is None:
+            profiles = self._local.profiles = {}
+        profile = profiles.get(name)
+        if profile is None:
+            import cProfile
+
+            profile = profiles[name] = cProfile.Profile()
+            with self._lock:
+                self._profiles.setdefault(name, []).append(profile)
+        return profile
+
+    def _skipped_profile(self, name: str) -> None:
+        with self._lock:
+            self._unprofiled[name] = self._unprofiled.get(name, 0) + 1
+
+    def _record(self, name: str, elapsed: float, peak: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(name, [0, 0.0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+            stats[3] = max(stats[3], peak)
+
+    def summary(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda item: -item[1][1])
+            unprofiled = dict(self._unprofiled)
+        lines = []
+        for name, (calls, total, longest, peak) in items:
+            line = f"{name:<12} {int(calls):>7}× {total:10.3f}s  (längster {longest:.3f}s)"
+            if peak:
+                line += f"  Prozess-Speicherspitze {peak / 1048576:.1f} MB"
+            lines.append(line)
+        for name, count in sorted(unprofiled.items()):
+            lines.append(
+                f"{name:<12} {count:>7}× ohne cProfile (nur ein aktiver Profiler je Prozess), "
+                f"lipgui_profile_{name}.pstats ist unvollständig"
+            )
+        return lines
 
-        try:
-            stdout, stderr = proc.communicate(timeout=5)
-        except Exception:
-            was_killed = True
-            try:
-                proc.kill()
-            except Exception:
-                pass
-            stdout, stderr = proc.communicate()
+    def write(self, folder: Path) -> Path:
+        """Write lipgui_profile.txt (plus .pstats / .tracemalloc dumps in FULL mode) to folder."""
+        import pstats
 
-        cp = subprocess.CompletedProcess(args=args, returncode=proc.returncode or (1 if was_killed else 0), stdout=stdout or "", stderr=stderr or "")
-        return cp, was_killed
-    finally:
-        try:
-            if proc.poll() is None:
-                proc.kill()
-        except Exception:
-            pass
+        folder.mkdir(parents=True, exist_ok=True)
+        report = ["Phase          Aufrufe      Summe", *self.summary()]
+        with self._lock:
+            profiles = {name: list(items) for name, items in self._profiles.items()}
+        for name, items in sorted(profiles.items()):
+            try:
+                stats = pstats.Stats(items[0])
+                if len(items) > 1:
+                    stats.add(*items[1:])
+            except (TypeError, ValueError):
+                # No call was recorded (profiler never enabled for this phase).
+                continue
+            stats.dump_stats(str(folder / f"lipgui_profile_{name}.pstats"))
+            out = io.StringIO()
+            stats.stream = out  # type: ignore[attr-defined]
+            stats.sort_stats("cumulative").print_stats(25)
+            report += ["", f"=== cProfile: {name} ===", out.getvalue().strip()]
+        if self.full:
+            import tracemalloc
+
+            if tracemalloc.is_tracing():
+                snapshot = tracemalloc.take_snapshot()
+                snapshot.dump(str(folder / "lipgui_profile.tracemalloc"))
+                report += ["", "=== tracemalloc: größte Belegungen ==="]
+                report += [str(stat) for stat in snapshot.statistics("lineno")[:20]]
+                if self._started_tracing:
+                    tracemalloc.stop()
+        path = folder / "lipgui_profile.txt"
+        path.write_text("\n".join(report) + "\n", encoding="utf-8")
+        # The report is out; anything recorded later (UI ticks after the run) would be lost.
+        self.enabled = False
+        return path
 
 
-class App(tk.Tk):
-    def __init__(self) -> None:
+@dataclass(frozen=True)
+class RunOptions:
+    """Snapshot of the UI state for one Start, handed to the worker thread."""
+
+    input_folder: Path
+    output_folder: Path
+    recursive: bool
+    preserve_structure: bool
+    text_source: str
+    fixed_text: str
+    mapping_files: tuple[Path, ...]
+    language: str
+    gesture: str
+    workers: int
+    adaptive: bool
+    prewarm: str
+    watch: bool
+    priority: str = ProcessPriority.NORMAL
+    # Jobs of an earlier run to generate again instead of scanning input_folder.
+    retry_jobs: tuple[Job, ...] = ()
+    # Languages generated in the same pass, in addition to `language` (see LanguageTarget).
+    extra_targets: tuple[LanguageTarget, ...] = ()
+
+
+class App(tk.Tk if tk is not None else object):  # type: ignore[misc]
+    def __init__(self, profile: str | None = None) -> None:
         super().__init__()
         self._base_dir = self._compute_base_dir()
         self._settings_path = self._base_dir / "settings.json"
+        self._cache_dir = self._base_dir / "cache"
         self._settings = self._load_settings()
+        # Trigram index of the last tested mapping, keyed by the mapping files' size and mtime.
+        self._key_index: tuple[tuple[tuple[str, int, int], ...], KeyIndex] | None = None
 
         self.ui_language_var = tk.StringVar(value=self._settings.get("ui_language", UiLanguage.DE))
         self.ui_theme_var = tk.StringVar(value=self._settings.get("ui_theme", UiTheme.LIGHT))
 
         self.title(self._t("title"))
         self.minsize(780, 520)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self._queue: queue.Queue[tuple[str, str]] = queue.Queue()
         self._worker: threading.Thread | None = None
         self._stop_requested = threading.Event()
         self._pause_event = threading.Event()
         self._pause_event.set()  # set = running, clear = paused
+        # Generator processes of the current run; Pause suspends them (see ProcessRegistry).
+        self._processes = ProcessRegistry()
+        # Failed jobs of the last run, for "Retry failed".
+        self._retry_jobs: tuple[Job, ...] = ()
 
         default_root = self._base_dir
         self.lipgenerator_dir = default_root / "LipGenerator"
@@ -602,6 +4107,18 @@ class App(tk.Tk):
 
         self.language_var = tk.StringVar(value="German")
         self.gesture_var = tk.StringVar(value="")
+        self.workers_var = tk.IntVar(value=int(self._settings.get("workers", default_worker_count()) or 1))
+        self.adaptive_workers_var = tk.BooleanVar(value=bool(self._settings.get("adaptive_workers", False)))
+        self.prewarm_var = tk.StringVar(value=str(self._settings.get("prewarm", PrewarmMode.OFF)))
+        self.watch_var = tk.BooleanVar(value=False)
+        self._run_started = 0.0
+        self._faq_window: tk.Toplevel | None = None
+        self._languages_window: tk.Toplevel | None = None
+        # --profile on the command line wins over the menu setting for this session.
+        self._profile_override = profile
+        self.profile_var = tk.StringVar(value=str(self._settings.get("profile", ProfileMode.OFF)))
+        self.priority_var = tk.StringVar(value=str(self._settings.get("generator_priority", ProcessPriority.NORMAL)))
+        self._profiler = PhaseProfiler()
 
         self._build_menu()
         self._build_ui()
@@ -628,16 +4145,58 @@ class App(tk.Tk):
 
     def _save_settings(self) -> None:
         try:
-            data = {
-                "ui_language": self.ui_language_var.get(),
-                "ui_theme": self.ui_theme_var.get(),
-                "donate_url": str(self._settings.get("donate_url", DEFAULT_DONATE_URL)),
-            }
+            # Keep keys we don't manage from the UI (e.g. hand-edited advanced options).
+            data = dict(self._settings)
+            data.update(
+                {
+                    "ui_language": self.ui_language_var.get(),
+                    "ui_theme": self.ui_theme_var.get(),
+                    "donate_url": str(self._settings.get("donate_url", DEFAULT_DONATE_URL)),
+                    "workers": self._worker_count(),
+                    "adaptive_workers": bool(self.adaptive_workers_var.get()),
+                    "prewarm": self.prewarm_var.get(),
+                    "profile": self.profile_var.get(),
+                    "generator_priority": self.priority_var.get(),
+                }
+            )
             self._settings_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
         except Exception:
             # Non-fatal
             pass
 
+    def _worker_count(self) -> int:
+        try:
+            return max(1, int(self.workers_var.get()))
+        except (tk.TclError, ValueError):
+            return 1
+
+    def _open_mapping(self, files: list[Path]) -> Mapping[str, str]:
+        """Load the selected mapping files, keeping very large ones on disk (settings: mapping_backend)."""
+        backend = str(self._settings.get("mapping_backend", "auto")).strip().lower()
+        if backend == "auto":
+            try:
+                # Only a small part of a plugin is dialogue text, so plugins don't count here.
+                total = sum(p.stat().st_size for p in files if not _is_plugin_source(p))
+            except OSError:
+                total = 0
+            backend = "mmap" if total >= MAPPED_MAPPING_THRESHOLD else "memory"
+        if backend == "mmap":
+            return open_mapped_text_mapping(files, self._cache_dir)
+        return load_text_mappings(files)
+
+    def _scan_wavs(self, folder: Path, recursive: bool) -> list[Path]:
+        """find_wav_files with the persisted scan snapshot of `folder` (cache/scan-*.json)."""
+        snapshot = ScanSnapshot(ScanSnapshot.path_for(self._cache_dir, folder))
+        started = time.perf_counter()
+        wav_files = find_wav_files(folder, recursive, snapshot)
+        snapshot.save()
+        self._queue.put((
+            "log",
+            f"Scan: {len(wav_files)} WAVs, {snapshot.listed}/{snapshot.visited} Ordner neu gelesen "
+            f"({time.perf_counter() - started:.2f}s)",
+        ))
+        return wav_files
+
     def _rebuild_ui(self) -> None:
         if self._worker and self._worker.is_alive():
             messagebox.showinfo(APP_NAME, "Bitte zuerst Stop drücken (oder warten, bis der Lauf fertig ist).")
@@ -685,6 +4244,48 @@ class App(tk.Tk):
         )
         settings_menu.add_cascade(label=self._t("menu_lang"), menu=lang_menu)
 
+        prewarm_menu = tk.Menu(settings_menu, tearoff=False)
+        for mode, label_key in (
+            (PrewarmMode.OFF, "menu_prewarm_off"),
+            (PrewarmMode.READ, "menu_prewarm_read"),
+            (PrewarmMode.COPY, "menu_prewarm_copy"),
+        ):
+            prewarm_menu.add_radiobutton(
+                label=self._t(label_key),
+                variable=self.prewarm_var,
+                value=mode,
+                command=self._save_settings,
+            )
+        settings_menu.add_cascade(label=self._t("menu_prewarm"), menu=prewarm_menu)
+
+        profile_menu = tk.Menu(settings_menu, tearoff=False)
+        for mode, label_key in (
+            (ProfileMode.OFF, "menu_profile_off"),
+            (ProfileMode.TIMERS, "menu_profile_timers"),
+            (ProfileMode.FULL, "menu_profile_full"),
+        ):
+            profile_menu.add_radiobutton(
+                label=self._t(label_key),
+                variable=self.profile_var,
+                value=mode,
+                command=self._save_settings,
+            )
+        settings_menu.add_cascade(label=self._t("menu_profile"), menu=profile_menu)
+
+        priority_menu = tk.Menu(settings_menu, tearoff=False)
+        for mode, label_key in (
+            (ProcessPriority.NORMAL, "menu_priority_normal"),
+            (ProcessPriority.BELOW_NORMAL, "menu_priority_below_normal"),
+            (ProcessPriority.IDLE, "menu_priority_idle"),
+        ):
+            priority_menu.add_radiobutton(
+                label=self._t(label_key),
+                variable=self.priority_var,
+                value=mode,
+                command=self._save_settings,
+            )
+        settings_menu.add_cascade(label=self._t("menu_priority"), menu=priority_menu)
+
         menubar.add_cascade(label=self._t("menu_settings"), menu=settings_menu)
 
         help_menu = tk.Menu(menubar, tearoff=False)
@@ -705,6 +4306,12 @@ class App(tk.Tk):
         self._rebuild_ui()
 
     def _open_faq(self) -> None:
+        # Built on first use and kept (hidden) afterwards, so reopening doesn't re-render the file.
+        if self._faq_window is not None and self._faq_window.winfo_exists():
+            self._faq_window.deiconify()
+            self._faq_window.lift()
+            return
+
         faq_path = self._base_dir / FAQ_FILENAME
         if not faq_path.exists():
             messagebox.showinfo(APP_NAME, f"Nicht gefunden: {faq_path}")
@@ -718,6 +4325,8 @@ class App(tk.Tk):
         win = tk.Toplevel(self)
         win.title("FAQ (English)")
         win.minsize(720, 520)
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
+        self._faq_window = win
 
         frame = ttk.Frame(win, padding=10)
         frame.pack(fill=BOTH, expand=True)
@@ -730,7 +4339,7 @@ class App(tk.Tk):
 
         btn_row = ttk.Frame(win, padding=(10, 0, 10, 10))
         btn_row.pack(fill=X)
-        ttk.Button(btn_row, text=self._t("close"), command=win.destroy).pack(side=RIGHT)
+        ttk.Button(btn_row, text=self._t("close"), command=win.withdraw).pack(side=RIGHT)
 
         # Basic Markdown-ish rendering: headings, bullets, fenced code blocks.
         text.tag_configure("h1", font=("Segoe UI", 14, "bold"))
@@ -773,6 +4382,8 @@ class App(tk.Tk):
             messagebox.showinfo(APP_NAME, self._t("donate_missing"))
             return
         try:
+            import webbrowser
+
             webbrowser.open(url)
         except Exception as exc:  # noqa: BLE001
             messagebox.showerror(APP_NAME, str(exc))
@@ -867,8 +4478,12 @@ class App(tk.Tk):
         lang_row.pack(fill=X)
         ttk.Label(lang_row, text=self._t("language")).pack(side=LEFT)
         ttk.OptionMenu(lang_row, self.language_var, self.language_var.get(), *SUPPORTED_LANGUAGES).pack(side=LEFT, padx=8)
+        ttk.Button(lang_row, text=self._t("more_languages"), command=self._open_languages).pack(side=LEFT)
         ttk.Label(lang_row, text=self._t("gesture")).pack(side=LEFT, padx=(16, 0))
         ttk.Entry(lang_row, textvariable=self.gesture_var, width=12).pack(side=LEFT, padx=8)
+        ttk.Label(lang_row, text=self._t("workers")).pack(side=LEFT, padx=(16, 0))
+        ttk.Spinbox(lang_row, from_=1, to=64, textvariable=self.workers_var, width=4).pack(side=LEFT, padx=8)
+        ttk.Checkbutton(lang_row, text=self._t("adaptive_workers"), variable=self.adaptive_workers_var).pack(side=LEFT)
 
         # Text source
         text_frame = ttk.LabelFrame(top, text=self._t("text_source"), padding=10)
@@ -925,10 +4540,14 @@ class App(tk.Tk):
         self.start_btn.pack(side=LEFT)
         self.test_btn = ttk.Button(actions, text=self._t("test_mapping"), command=self._test_mapping)
         self.test_btn.pack(side=LEFT, padx=8)
+        ttk.Checkbutton(actions, text=self._t("watch"), variable=self.watch_var).pack(side=LEFT, padx=(0, 8))
         self.pause_btn = ttk.Button(actions, text=self._t("pause"), command=self._toggle_pause, state=DISABLED)
         self.pause_btn.pack(side=LEFT)
         self.stop_btn = ttk.Button(actions, text=self._t("stop"), command=self._stop, state=DISABLED)
         self.stop_btn.pack(side=LEFT)
+        self.retry_btn = ttk.Button(actions, text=self._t("retry_failed"), command=self._retry_failed)
+        self.retry_btn.configure(state=NORMAL if self._retry_jobs else DISABLED)
+        self.retry_btn.pack(side=LEFT, padx=(8, 0))
 
         self.progress = ttk.Progressbar(actions, mode="determinate")
         self.progress.pack(side=RIGHT, fill=X, expand=True, padx=(12, 0))
@@ -967,23 +4586,22 @@ class App(tk.Tk):
     def _pick_mapping_file(self) -> None:
         file_paths = filedialog.askopenfilenames(
             title=self._t("mapping_file"),
-            filetypes=[
-                ("CSV/TSV", "*.csv *.tsv *.txt"),
-                ("Alle Dateien", "*.*"),
-            ],
+            filetypes=MAPPING_FILETYPES,
         )
         if not file_paths:
             return
 
         self._mapping_files = [Path(p) for p in file_paths]
-        if len(self._mapping_files) == 1:
-            self.mapping_file_var.set(str(self._mapping_files[0]))
-        else:
-            first = self._mapping_files[0]
-            if self.ui_language_var.get() == UiLanguage.EN:
-                self.mapping_file_var.set(f"{len(self._mapping_files)} files selected (e.g. {first.name})")
-            else:
-                self.mapping_file_var.set(f"{len(self._mapping_files)} Dateien ausgewählt (z.B. {first.name})")
+        self.mapping_file_var.set(self._describe_mapping_files(self._mapping_files))
+
+    def _describe_mapping_files(self, files: list[Path]) -> str:
+        if not files:
+            return self._t("lang_no_mapping")
+        if len(files) == 1:
+            return str(files[0])
+        if self.ui_language_var.get() == UiLanguage.EN:
+            return f"{len(files)} files selected (e.g. {files[0].name})"
+        return f"{len(files)} Dateien ausgewählt (z.B. {files[0].name})"
 
     def _append_log(self, text: str) -> None:
         self.log.insert(END, text + "\n")
@@ -1004,7 +4622,11 @@ class App(tk.Tk):
             return False
         return True
 
-    def _start(self) -> None:
+    def _retry_failed(self) -> None:
+        if self._retry_jobs:
+            self._start(retry_jobs=self._retry_jobs)
+
+    def _start(self, retry_jobs: tuple[Job, ...] = ()) -> None:
         if self._worker and self._worker.is_alive():
             return
         if not self._validate_prereqs():
@@ -1019,6 +4641,37 @@ class App(tk.Tk):
             messagebox.showerror("Fehler", self._t("err_need_out"))
             return
 
+        if self.text_source_var.get() == TextSource.MAPPING_FILE and not self._mapping_files:
+            messagebox.showerror("Fehler", self._t("err_need_mapping"))
+            return
+
+        language = self.language_var.get().strip() or "USEnglish"
+        try:
+            extra_targets = self._extra_targets(language, output_folder)
+        except ValueError as exc:
+            messagebox.showerror("Fehler", str(exc))
+            return
+
+        opts = RunOptions(
+            input_folder=input_folder,
+            output_folder=output_folder,
+            recursive=self.recursive_var.get(),
+            preserve_structure=self.preserve_structure_var.get(),
+            text_source=self.text_source_var.get(),
+            fixed_text=self.fixed_text_var.get(),
+            mapping_files=tuple(self._mapping_files),
+            language=language,
+            gesture=self.gesture_var.get().strip(),
+            workers=self._worker_count(),
+            adaptive=bool(self.adaptive_workers_var.get()),
+            prewarm=self.prewarm_var.get(),
+            watch=bool(self.watch_var.get()) and not retry_jobs,
+            priority=self.priority_var.get(),
+            retry_jobs=retry_jobs,
+            extra_targets=extra_targets,
+        )
+        self._save_settings()
+
         self.log.delete("1.0", END)
         self._stop_requested.clear()
         self._pause_event.set()
@@ -1026,71 +4679,116 @@ class App(tk.Tk):
         self.stop_btn.configure(state=NORMAL)
         self.pause_btn.configure(state=NORMAL, text="Pause")
         self.test_btn.configure(state=DISABLED)
+        self.retry_btn.configure(state=DISABLED)
+        self._retry_jobs = ()
+        self.progress.configure(maximum=0, value=0)
+        self.progress_label.configure(text="0/0")
+        self._run_started = time.monotonic()
+        self._profiler = PhaseProfiler(self._profile_override or self.profile_var.get())
+
+        # Scanning, mapping and job building can take a while on big trees, so they run
+        # on the worker thread too.
+        self._worker = threading.Thread(target=self._worker_run, args=(opts,), daemon=True)
+        self._worker.start()
 
-        # Build jobs (may raise for missing txt etc.)
-        try:
-            jobs = build_jobs(
-                input_folder=input_folder,
-                output_folder=output_folder,
-                recursive=self.recursive_var.get(),
-                preserve_structure=self.preserve_structure_var.get(),
-                text_source=self.text_source_var.get(),
-                fixed_text=self.fixed_text_var.get(),
-                mapping_file=self._mapping_files[0] if (self.text_source_var.get() == TextSource.MAPPING_FILE and len(self._mapping_files) == 1) else None,
-            )
-        except Exception as exc:  # noqa: BLE001
-            self.start_btn.configure(state=NORMAL)
-            self.stop_btn.configure(state=DISABLED)
-            messagebox.showerror("Fehler", str(exc))
+    def _extra_targets(self, language: str, output_folder: Path) -> tuple[LanguageTarget, ...]:
+        """The enabled rows of the "More languages" dialog (stored in settings.json)."""
+        targets: list[LanguageTarget] = []
+        used_outputs = {output_folder.resolve()}
+        for entry in self._settings.get("extra_languages", []):
+            if not isinstance(entry, dict) or not entry.get("enabled") or entry.get("language") == language:
+                continue
+            lang = str(entry.get("language", ""))
+            out_text = str(entry.get("output_folder", "")).strip()
+            out = Path(out_text) if out_text else None
+            if out is None or out.resolve() in used_outputs:
+                raise ValueError(self._t("err_lang_output").format(lang=lang))
+            used_outputs.add(out.resolve())
+            files = tuple(Path(p) for p in entry.get("mapping_files", []))
+            if self.text_source_var.get() == TextSource.MAPPING_FILE and not files:
+                raise ValueError(self._t("err_lang_mapping").format(lang=lang))
+            targets.append(LanguageTarget(lang, out, files))
+        return tuple(targets)
+
+    def _open_languages(self) -> None:
+        # Built on first use and kept (hidden) afterwards, like the FAQ window.
+        if self._languages_window is not None and self._languages_window.winfo_exists():
+            self._languages_window.deiconify()
+            self._languages_window.lift()
             return
 
-        # For mapping mode, support multiple mapping files by building a merged mapping and replacing job texts.
-        if self.text_source_var.get() == TextSource.MAPPING_FILE and len(self._mapping_files) > 1:
-            try:
-                mapping = load_text_mappings(self._mapping_files)
-            except Exception as exc:  # noqa: BLE001
-                self.start_btn.configure(state=NORMAL)
-                self.stop_btn.configure(state=DISABLED)
-                messagebox.showerror("Fehler", str(exc))
-                return
-
-            remapped: list[Job] = []
-            for j in jobs:
-                text = ""
-                for key in mapping_keys_from_wav(j.wav_path):
-                    text = mapping.get(key, "").strip()
-                    if text:
-                        break
-                if not text:
-                    text = text_from_filename(j.wav_path)
-                    note = "WARN: Kein Mapping-Eintrag gefunden, nutze Dateiname als Text."
-                else:
-                    note = ""
-                remapped.append(Job(wav_path=j.wav_path, lip_path=j.lip_path, text=text, note=note))
-            jobs = remapped
+        win = tk.Toplevel(self)
+        win.title(self._t("languages_title"))
+        win.transient(self)
+        self._languages_window = win
 
-        if not jobs:
-            self.start_btn.configure(state=NORMAL)
-            self.stop_btn.configure(state=DISABLED)
-            messagebox.showinfo("Info", self._t("info_no_wav"))
-            return
+        frame = ttk.Frame(win, padding=10)
+        frame.pack(fill=BOTH, expand=True)
+        frame.columnconfigure(1, weight=1)
+        ttk.Label(frame, text=self._t("languages_hint"), wraplength=620, justify=LEFT).grid(
+            row=0, column=0, columnspan=5, sticky="w", pady=(0, 8)
+        )
 
-        self.progress.configure(maximum=len(jobs), value=0)
-        self.progress_label.configure(text=f"0/{len(jobs)}")
+        saved = {
+            e.get("language"): e for e in self._settings.get("extra_languages", []) if isinstance(e, dict)
+        }
+        rows: list[tuple[str, tk.BooleanVar, tk.StringVar, list[Path]]] = []
 
-        language = self.language_var.get().strip() or "USEnglish"
-        gesture = self.gesture_var.get().strip()
+        def _pick_output(var: tk.StringVar) -> None:
+            folder = filedialog.askdirectory(title=self._t("output_folder"))
+            if folder:
+                var.set(folder)
 
-        self._worker = threading.Thread(
-            target=self._worker_run,
-            args=(jobs, language, gesture),
-            daemon=True,
-        )
-        self._worker.start()
+        def _pick_mapping(files: list[Path], label_var: tk.StringVar) -> None:
+            file_paths = filedialog.askopenfilenames(
+                title=self._t("mapping_file"),
+                filetypes=MAPPING_FILETYPES,
+            )
+            if file_paths:
+                files[:] = [Path(p) for p in file_paths]
+                label_var.set(self._describe_mapping_files(files))
+
+        for row_no, lang in enumerate(SUPPORTED_LANGUAGES, start=1):
+            entry = saved.get(lang, {})
+            enabled = tk.BooleanVar(value=bool(entry.get("enabled", False)))
+            out_var = tk.StringVar(value=str(entry.get("output_folder", "")))
+            files = [Path(p) for p in entry.get("mapping_files", [])]
+            files_var = tk.StringVar(value=self._describe_mapping_files(files))
+            rows.append((lang, enabled, out_var, files))
+
+            ttk.Checkbutton(frame, text=lang, variable=enabled).grid(row=row_no, column=0, sticky="w")
+            ttk.Entry(frame, textvariable=out_var, width=40).grid(row=row_no, column=1, sticky="ew", padx=8)
+            ttk.Button(frame, text=self._t("pick"), command=lambda v=out_var: _pick_output(v)).grid(row=row_no, column=2)
+            ttk.Button(
+                frame,
+                text=self._t("lang_mapping"),
+                command=lambda f=files, v=files_var: _pick_mapping(f, v),
+            ).grid(row=row_no, column=3, padx=(8, 0))
+            ttk.Label(frame, textvariable=files_var).grid(row=row_no, column=4, sticky="w", padx=8)
+
+        def _close() -> None:
+            self._settings["extra_languages"] = [
+                {
+                    "language": lang,
+                    "enabled": bool(enabled.get()),
+                    "output_folder": out_var.get().strip(),
+                    "mapping_files": [str(p) for p in files],
+                }
+                for lang, enabled, out_var, files in rows
+                if enabled.get() or out_var.get().strip() or files
+            ]
+            self._save_settings()
+            win.withdraw()
+
+        win.protocol("WM_DELETE_WINDOW", _close)
+        btn_row = ttk.Frame(win, padding=(10, 0, 10, 10))
+        btn_row.pack(fill=X)
+        ttk.Button(btn_row, text=self._t("close"), command=_close).pack(side=RIGHT)
 
     def _stop(self) -> None:
         self._stop_requested.set()
         self._pause_event.set()
+        self._processes.resume_all()
         self._append_log(self._t("stop_requested"))
 
     def _toggle_pause(self) -> None:
@@ -1098,13 +4796,21 @@ class App(tk.Tk):
             return
         if self._pause_event.is_set():
             self._pause_event.clear()
+            suspended = self._processes.suspend_all()
             self.pause_btn.configure(text=self._t("resume"))
-            self._append_log(self._t("paused"))
+            self._append_log(self._t("paused") + (self._t("processes_suspended").format(n=suspended) if suspended else ""))
         else:
+            self._processes.resume_all()
             self._pause_event.set()
             self.pause_btn.configure(text=self._t("pause"))
             self._append_log(self._t("resumed"))
 
+    def _on_close(self) -> None:
+        # Suspended generators would otherwise outlive the app, stopped forever.
+        self._processes.resume_all()
+        self._stop_requested.set()
+        self.destroy()
+
     def _test_mapping(self) -> None:
         if self._worker and self._worker.is_alive():
             return
@@ -1118,19 +4824,8 @@ class App(tk.Tk):
             messagebox.showerror("Fehler", "Bitte eine Mapping-Datei auswählen.")
             return
 
-        try:
-            mapping = load_text_mappings(self._mapping_files)
-        except Exception as exc:  # noqa: BLE001
-            messagebox.showerror("Fehler", str(exc))
-            return
-
-        wav_files = find_wav_files(input_folder, self.recursive_var.get())
-        if not wav_files:
-            messagebox.showinfo("Info", "Keine .wav Dateien gefunden.")
-            return
-
-        sample_n = 10 if len(wav_files) >= 10 else len(wav_files)
-        sample = random.sample(wav_files, k=sample_n)
+        output_text = self.output_folder_var.get().strip()
+        report_path = (Path(output_text) if output_text else input_folder) / "lipgui_mapping_report.txt"
 
         self.log.delete("1.0", END)
         self._stop_requested.clear()
@@ -1139,26 +4834,55 @@ class App(tk.Tk):
         self.test_btn.configure(state=DISABLED)
         self.stop_btn.configure(state=NORMAL)
         self.pause_btn.configure(state=DISABLED, text="Pause")
+        self.progress.configure(value=0)
+        self.progress_label.configure(text="")
 
-        self.progress.configure(maximum=sample_n, value=0)
-        self.progress_label.configure(text=f"0/{sample_n}")
-
+        # Loading a large mapping (index build, XML, plugins) and scanning run off the Tk thread.
         self._worker = threading.Thread(
             target=self._worker_test_mapping,
-            args=(mapping, wav_files, sample),
+            args=(list(self._mapping_files), input_folder, self.recursive_var.get(), report_path),
             daemon=True,
         )
         self._worker.start()
 
-    def _worker_test_mapping(self, mapping: dict[str, str], all_wavs: list[Path], sample: list[Path]) -> None:
+    def _worker_test_mapping(self, files: list[Path], input_folder: Path, recursive: bool, report_path: Path) -> None:
+        self._queue.put(("log", "Lade Mapping…"))
+        try:
+            mapping = self._open_mapping(files)
+        except Exception as exc:  # noqa: BLE001
+            self._queue.put(("error", str(exc)))
+            return
+        try:
+            wav_files = self._scan_wavs(input_folder, recursive)
+            if not wav_files:
+                self._queue.put(("info", "Keine .wav Dateien gefunden."))
+                return
+
+            import random
+
+            sample = random.sample(wav_files, k=min(10, len(wav_files)))
+            files_sig = tuple((str(p), p.stat().st_size, p.stat().st_mtime_ns) for p in files)
+            self._queue.put(("total", str(len(sample))))
+            self._queue.put(("progress", "0"))
+            self._test_mapping_report(mapping, wav_files, sample, files_sig, report_path)
+        except Exception as exc:  # noqa: BLE001
+            self._queue.put(("log", f"FEHLER: {exc}"))
+            self._queue.put(("error", str(exc)))
+        finally:
+            close_text_mapping(mapping)
+
+    def _test_mapping_report(
+        self,
+        mapping: Mapping[str, str],
+        all_wavs: list[Path],
+        sample: list[Path],
+        files_sig: tuple[tuple[str, int, int], ...],
+        report_path: Path,
+    ) -> None:
         total = len(all_wavs)
-        found_total = 0
-        missing_total = 0
-        for wav in all_wavs:
-            if any(mapping.get(k, "").strip() for k in mapping_keys_from_wav(wav)):
-                found_total += 1
-            else:
-                missing_total += 1
+        report = build_coverage_report(mapping, all_wavs)
+        missing_total = len(report.misses)
+        found_total = total - missing_total
 
         self._queue.put(("log", f"Mapping-Einträge: {len(mapping)}"))
         self._queue.put(("log", f"WAVs gefunden: {total} (Match: {found_total}, Kein Match: {missing_total})"))
@@ -1190,68 +4914,376 @@ class App(tk.Tk):
 
             self._queue.put(("progress", str(idx)))
 
-        self._queue.put(("done", "Mapping-Test fertig."))
+        if report.misses and not self._stop_requested.is_set():
+            self._report_coverage(mapping, report, files_sig, report_path)
 
-    def _worker_run(self, jobs: list[Job], language: str, gesture: str) -> None:
-        total = len(jobs)
-        ok = 0
-        failed = 0
+        self._queue.put(("done", "Mapping-Test fertig."))
 
-        for idx, job in enumerate(jobs, start=1):
+    def _report_coverage(
+        self,
+        mapping: Mapping[str, str],
+        report: CoverageReport,
+        files_sig: tuple[tuple[str, int, int], ...],
+        report_path: Path,
+    ) -> None:
+        """Suggest the closest mapping keys for every miss and write the coverage report."""
+        if self._key_index is not None and self._key_index[0] == files_sig:
+            index = self._key_index[1]
+        else:
+            self._queue.put(("log", "Erstelle Index für Vorschläge…"))
+            index = KeyIndex.build(mapping, self._stop_requested)
             if self._stop_requested.is_set():
-                self._queue.put(("log", f"Abgebrochen. Fertig: {idx-1}/{total}"))
-                break
-
-            # Pause point between files
-            while not self._pause_event.is_set() and not self._stop_requested.is_set():
-                self._stop_requested.wait(timeout=0.2)
+                return
+            self._key_index = (files_sig, index)
 
-            self._queue.put(("log", f"[{idx}/{total}] {job.wav_path.name} → {job.lip_path.name}"))
-            if job.note:
-                self._queue.put(("log", f"  {job.note}"))
+        self._queue.put(("total", str(len(report.misses))))
+        report.suggest(
+            index,
+            stop_event=self._stop_requested,
+            progress=lambda n: self._queue.put(("progress", str(n))),
+        )
 
-            try:
-                cp, was_killed = run_lipgenerator_background(
-                    lipgenerator_dir=self.lipgenerator_dir,
-                    exe_path=self.exe_path,
-                    job=job,
-                    language=language,
-                    gesture_exaggeration=gesture,
-                    stop_event=self._stop_requested,
-                    pause_event=self._pause_event,
-                )
-            except Exception as exc:  # noqa: BLE001
-                failed += 1
-                self._queue.put(("log", f"  FEHLER: {exc}"))
-                self._queue.put(("progress", str(idx)))
+        self._queue.put(("log", "--- Abdeckung je Voice Type (schlechteste zuerst) ---"))
+        voices = sorted(report.totals, key=lambda v: (report.hits.get(v, 0) / report.totals[v], v))
+        for voice in voices[:15]:
+            hit, count = report.hits.get(voice, 0), report.totals[voice]
+            self._queue.put(("log", f"{voice or '(ohne Ordner)'}: {hit}/{count} ({hit / count:.0%})"))
+        if len(voices) > 15:
+            self._queue.put(("log", f"… und {len(voices) - 15} weitere Voice Types"))
+        fixes = report.fixes()
+        if fixes:
+            self._queue.put(("log", "Häufigste Abweichungen (WAV-Name → Mapping-Key):"))
+            for rule, count in fixes:
+                self._queue.put(("log", f"  {count}×  {rule}"))
+        try:
+            write_coverage_report(report, report_path)
+            self._queue.put(("log", f"Bericht mit Vorschlägen: {report_path}"))
+        except OSError as exc:
+            self._queue.put(("log", f"WARN: Bericht konnte nicht geschrieben werden: {exc}"))
+
+    def _preflight(self, jobs: JobTable) -> tuple[JobTable, dict[Path, WavInfo]]:
+        """Probe all WAV headers up front so broken files never reach LipGenerator."""
+        if not self._settings.get("preflight", True):
+            return jobs, {}
+
+        started = time.perf_counter()
+        cache = WavProbeCache(self._cache_dir / "wav_probe.json")
+        infos = probe_wav_files(
+            # Several languages share one WAV; probe it once.
+            list(dict.fromkeys(jobs.wav_path(i) for i in range(len(jobs)))),
+            cache=cache,
+            max_workers=int(self._settings.get("preflight_threads", 8) or 8),
+            stop_event=self._stop_requested,
+        )
+        cache.save()
+
+        kept: list[int] = []
+        rejected: set[Path] = set()
+        warned: set[Path] = set()
+        for index in range(len(jobs)):
+            wav_path = jobs.wav_path(index)
+            info = infos.get(wav_path)
+            if info is None:
+                # Probing was cancelled (Stop); let the run loop handle it.
+                kept.append(index)
                 continue
+            if not info.ok:
+                if wav_path not in rejected:
+                    rejected.add(wav_path)
+                    self._queue.put(("log", f"  ÜBERSPRUNGEN {wav_path.name}: {info.error}"))
+                continue
+            if info.warning and wav_path not in warned:
+                warned.add(wav_path)
+                self._queue.put(("log", f"  WARN {wav_path.name}: {info.warning}"))
+            kept.append(index)
+
+        self._queue.put(
+            (
+                "log",
+                f"Vorabprüfung: {len(infos)} WAVs in {time.perf_counter() - started:.1f}s, "
+                f"{len(rejected)} übersprungen.",
+            )
+        )
+        return (jobs if len(kept) == len(jobs) else jobs.take(kept)), infos
+
+    def _build_run_jobs(self, opts: RunOptions) -> tuple[JobTable, Mapping[str, str] | None]:
+        """Build the jobs for a Start; raises with a user-facing message on problems."""
+        if opts.retry_jobs:
+            jobs = JobTable()
+            jobs.extend(opts.retry_jobs)
+            self._queue.put(("log", f"Wiederhole {len(jobs)} fehlgeschlagene Datei(en)."))
+            return jobs, None
+        targets = [LanguageTarget(opts.language, opts.output_folder, opts.mapping_files), *opts.extra_targets]
+        if opts.extra_targets:
+            self._queue.put(("log", "Sprachen: " + ", ".join(t.language for t in targets)))
+
+        profiler = self._profiler
+        mappings: dict[tuple[Path, ...], Mapping[str, str]] = {}
+        mapping: Mapping[str, str] | None = None
+        try:
+            if opts.text_source == TextSource.MAPPING_FILE:
+                with profiler.phase("mapping", memory=True):
+                    for target in targets:
+                        if target.mapping_files not in mappings:
+                            mappings[target.mapping_files] = self._open_mapping(list(target.mapping_files))
+
+            with profiler.phase("scan", memory=True):
+                wav_files = self._scan_wavs(opts.input_folder, opts.recursive)
+            problems: list[str] = []
+            with profiler.phase("build_jobs", memory=True):
+                jobs = build_language_jobs(
+                    input_folder=opts.input_folder,
+                    recursive=opts.recursive,
+                    preserve_structure=opts.preserve_structure,
+                    text_source=opts.text_source,
+                    fixed_text=opts.fixed_text,
+                    targets=targets,
+                    mappings=mappings,
+                    problems=problems,
+                    wav_files=wav_files,
+                )
+            if problems:
+                self._report_problems(problems, opts.output_folder / "lipgui_missing_text.txt")
+            # The jobs carry their texts; only watch mode keeps using the first target's mapping.
+            mapping = mappings.pop(opts.mapping_files, None)
+        finally:
+            # Everything not handed to the caller, i.e. all of them if anything above raised.
+            for other in mappings.values():
+                close_text_mapping(other)
+        return jobs, mapping
+
+    def _report_problems(self, problems: list[str], report_path: Path) -> None:
+        """Log the first few problems and write the full list to report_path."""
+        self._queue.put(("log", f"{len(problems)} Datei(en) übersprungen (Text fehlt oder ist leer):"))
+        for line in problems[:20]:
+            self._queue.put(("log", f"  {line}"))
+        try:
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text("\n".join(problems) + "\n", encoding="utf-8")
+            self._queue.put(("log", f"  Vollständige Liste: {report_path}"))
+        except OSError:
+            if len(problems) > 20:
+                self._queue.put(("log", f"  … und {len(problems) - 20} weitere"))
+
+    def _worker_run(self, opts: RunOptions) -> None:
+        try:
+            jobs, mapping = self._build_run_jobs(opts)
+        except Exception as exc:  # noqa: BLE001
+            self._queue.put(("error", str(exc)))
+            return
+        try:
+            self._run_jobs(opts, jobs, mapping)
+        except Exception as exc:  # noqa: BLE001
+            # Without this the buttons would stay disabled and nothing would say why.
+            self._queue.put(("log", f"FEHLER: Lauf abgebrochen: {exc}"))
+            self._queue.put(("error", str(exc)))
+        finally:
+            close_text_mapping(mapping)
+
+    def _run_jobs(self, opts: RunOptions, jobs: JobTable, mapping: Mapping[str, str] | None) -> None:
+        if not jobs and not opts.watch:
+            self._queue.put(("info", self._t("info_no_wav")))
+            return
 
-            if was_killed and self._stop_requested.is_set():
-                failed += 1
-                self._queue.put(("log", "  Abgebrochen (Prozess beendet)."))
-                self._queue.put(("progress", str(idx)))
-                break
+        with self._profiler.phase("preflight", memory=True):
+            jobs, infos = self._preflight(jobs)
+        self._queue.put(("total", str(len(jobs))))
 
-            if cp.returncode == 0 and job.lip_path.exists():
-                ok += 1
-            else:
-                failed += 1
+        lipgenerator_dir, exe_path = self.lipgenerator_dir, self.exe_path
+        if opts.prewarm in (PrewarmMode.READ, PrewarmMode.COPY):
+            try:
+                warmed = prewarm_lipgenerator(lipgenerator_dir, exe_path, opts.prewarm)
+                lipgenerator_dir, exe_path = warmed.lipgenerator_dir, warmed.exe_path
+                self._queue.put(("log", warmed.describe()))
+            except Exception as exc:  # noqa: BLE001
+                self._queue.put(("log", f"WARN: Vorwärmen fehlgeschlagen: {exc}"))
+
+        emit: Callable[[str, str], None] = lambda kind, payload: self._queue.put((kind, payload))
+        output_limit = int(self._settings.get("generator_output_limit_kb", 64) or 64) * 1024
+        limits = self._child_limits(opts.priority)
+        if limits != ChildLimits():
+            emit("log", limits.describe())
+        backend = self._generator_backend(lipgenerator_dir, exe_path, opts.gesture, output_limit, limits)
+        controller: ConcurrencyController | None = None
+        if opts.adaptive:
+            # The spin box value is the starting point, the bounds come from settings.json.
+            controller = ConcurrencyController(
+                min_workers=int(self._settings.get("workers_min", 1) or 1),
+                max_workers=int(self._settings.get("workers_max", os.cpu_count() or opts.workers) or opts.workers),
+                start=opts.workers,
+                emit=emit,
+            )
 
-            if cp.stdout.strip():
-                self._queue.put(("log", "  " + cp.stdout.strip().replace("\n", "\n  ")))
-            if cp.stderr.strip():
-                self._queue.put(("log", "  " + cp.stderr.strip().replace("\n", "\n  ")))
+        runner = BatchRunner(
+            lipgenerator_dir=lipgenerator_dir,
+            exe_path=exe_path,
+            language=opts.language,
+            gesture=opts.gesture,
+            workers=opts.workers,
+            emit=emit,
+            stop_event=self._stop_requested,
+            pause_event=self._pause_event,
+            controller=controller,
+            output_limit=output_limit,
+            log_dir=self._base_dir / "logs" / time.strftime("%Y%m%d-%H%M%S"),
+            log_mode=str(self._settings.get("generator_logs", GeneratorLogMode.OFF)),
+            profiler=self._profiler,
+            backend=backend,
+            stages=self._output_stages(opts, infos),
+            accounting_path=(
+                opts.output_folder / "lipgui_accounting.tsv" if self._settings.get("generator_accounting") else None
+            ),
+        )
+        costs = array("d", (estimate_job_cost(j, infos.get(j.wav_path)) for j in jobs))
+        if not opts.watch:
+            ok, failed = runner.run(jobs, costs)
+        else:
+            if opts.extra_targets:
+                emit("log", f"Ordnerüberwachung erzeugt neue Lips nur für {opts.language}.")
+            session = WatchSession(
+                runner=runner,
+                input_folder=opts.input_folder,
+                output_folder=opts.output_folder,
+                recursive=opts.recursive,
+                preserve_structure=opts.preserve_structure,
+                text_source=opts.text_source,
+                fixed_text=opts.fixed_text,
+                mapping_files=list(opts.mapping_files) if opts.text_source == TextSource.MAPPING_FILE else [],
+                load_mapping=self._open_mapping,
+                mapping=mapping,
+                known_jobs=jobs,
+                emit=emit,
+                stop_event=self._stop_requested,
+                probe_cache=WavProbeCache(self._cache_dir / "wav_probe.json"),
+                debounce=float(self._settings.get("watch_debounce", 2.0) or 2.0),
+            )
+            watcher = threading.Thread(target=session.run, name="lipgen-watch", daemon=True)
+            watcher.start()
+            # Runs until Stop; the watcher keeps submitting jobs meanwhile.
+            ok, failed = runner.run(jobs, costs, keep_open=True)
+            watcher.join()
+        if isinstance(backend, ServerBackend):
+            emit("log", f"Generator-Server gestartet: {backend.started}")
+        self._retry_jobs = tuple(job for job, _ in runner.failed_jobs)
+        if runner.failed_jobs:
+            self._report_failed(runner.failed_jobs, opts.output_folder / "lipgui_failed.txt")
+        self._write_profile(opts.output_folder)
+        self._queue.put(("done", f"Fertig. OK: {ok}, Fehler: {failed}"))
 
-            self._queue.put(("progress", str(idx)))
+    def _output_stages(self, opts: RunOptions, infos: Mapping[Path, WavInfo]) -> list[OutputStage]:
+        """Stages run on the generated .lips (settings: validate_lips, package_fuz, package_zip)."""
+        stages: list[OutputStage] = []
+        if self._settings.get("validate_lips", True):
+            stages.append(LipValidator(infos))
+        if self._settings.get("package_fuz", False):
+            stages.append(FuzPacker())
+        if self._settings.get("package_zip", False):
+            stages.append(ZipPackager([opts.output_folder, *(t.output_folder for t in opts.extra_targets)]))
+        return stages
+
+    def _report_failed(self, failed: list[tuple[Job, str]], report_path: Path) -> None:
+        try:
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text("".join(f"{job.wav_path}\t{reason}\n" for job, reason in failed), encoding="utf-8")
+            self._queue.put(("log", f"{len(failed)} Datei(en) fehlgeschlagen, Liste: {report_path}"))
+        except OSError:
+            self._queue.put(("log", f"{len(failed)} Datei(en) fehlgeschlagen."))
+
+    def _child_limits(self, priority: str) -> ChildLimits:
+        """Limits for generator processes: priority from the menu, the rest from settings.json
+        (generator_affinity, generator_memory_limit_mb, generator_cpu_limit_s)."""
+        cpus: tuple[int, ...] = ()
+        if self._settings.get("generator_affinity"):
+            try:
+                cpus = tuple(sorted(os.sched_getaffinity(0)))
+            except AttributeError:
+                cpus = tuple(range(os.cpu_count() or 1))
+        return ChildLimits(
+            priority=priority,
+            cpus=cpus,
+            memory_mb=int(self._settings.get("generator_memory_limit_mb", 0) or 0),
+            cpu_seconds=int(self._settings.get("generator_cpu_limit_s", 0) or 0),
+        )
 
-        self._queue.put(("done", f"Fertig. OK: {ok}, Fehler: {failed}"))
+    def _generator_backend(
+        self, lipgenerator_dir: Path, exe_path: Path, gesture: str, output_limit: int, limits: ChildLimits | None = None
+    ) -> GeneratorBackend:
+        """SpawnBackend, or ServerBackend with settings "generator_backend": "server".
+
+        generator_server_command is a list of arguments (or one string); {lipgenerator_dir} and
+        {exe} are replaced. The server runs in the LipGenerator folder.
+        """
+        mode = str(self._settings.get("generator_backend", GeneratorBackendMode.SPAWN)).strip().lower()
+        if mode == GeneratorBackendMode.SERVER:
+            command = self._settings.get("generator_server_command") or []
+            if isinstance(command, str):
+                import shlex
+
+                command = shlex.split(command, posix=os.name != "nt")
+            command = [
+                str(arg).replace("{lipgenerator_dir}", str(lipgenerator_dir)).replace("{exe}", str(exe_path))
+                for arg in command
+            ]
+            if command:
+                self._queue.put(("log", f"Generator-Server: {' '.join(command)}"))
+                return ServerBackend(command, lipgenerator_dir, gesture, output_limit, self._processes, limits)
+            self._queue.put(("log", "WARN: generator_server_command fehlt in settings.json, starte LipGenerator.exe je Datei."))
+        elif mode != GeneratorBackendMode.SPAWN:
+            self._queue.put(("log", f"WARN: Unbekanntes generator_backend '{mode}', starte LipGenerator.exe je Datei."))
+        return SpawnBackend(lipgenerator_dir, exe_path, gesture, output_limit, self._processes, limits)
+
+    def _write_profile(self, folder: Path) -> None:
+        profiler = self._profiler
+        if not profiler.enabled:
+            return
+        self._queue.put(("log", "--- Profil ---"))
+        for line in profiler.summary():
+            self._queue.put(("log", line))
+        try:
+            self._queue.put(("log", f"Profil gespeichert: {profiler.write(folder)}"))
+        except OSError as exc:
+            self._queue.put(("log", f"WARN: Profil konnte nicht gespeichert werden: {exc}"))
+
+    def _reset_buttons(self) -> None:
+        self.start_btn.configure(state=NORMAL)
+        self.test_btn.configure(state=NORMAL)
+        self.retry_btn.configure(state=NORMAL if self._retry_jobs else DISABLED)
+        self.pause_btn.configure(state=DISABLED, text="Pause")
+        self.stop_btn.configure(state=DISABLED)
 
     def _drain_queue(self) -> None:
+        profiler = self._profiler
+        if profiler.enabled and self._worker is not None and self._worker.is_alive():
+            # One accumulator instead of a phase: a phase per tick would run cProfile and
+            # (in FULL mode) interfere with the phases of the run thread.
+            started = time.perf_counter()
+            self._drain_queue_once()
+            profiler.add("drain_queue", time.perf_counter() - started)
+        else:
+            self._drain_queue_once()
+        self.after(120, self._drain_queue)
+
+    def _drain_queue_once(self) -> None:
         try:
             while True:
                 kind, payload = self._queue.get_nowait()
                 if kind == "log":
                     self._append_log(payload)
+                elif kind == "total":
+                    # May grow during the run (watch mode), so keep the current value.
+                    self.progress.configure(maximum=int(payload))
+                elif kind == "progress_cost":
+                    # Bar and ETA follow the estimated cost, the label counts files.
+                    done_s, fraction_s = payload.split("\t")
+                    fraction = float(fraction_s)
+                    maximum = int(self.progress.cget("maximum") or 0)
+                    self.progress.configure(value=fraction * maximum)
+                    label = f"{done_s}/{maximum}"
+                    elapsed = time.monotonic() - self._run_started
+                    if 0 < fraction < 1 and elapsed > 1:
+                        remaining = int(elapsed * (1 - fraction) / fraction)
+                        label += f"  ETA {remaining // 60}:{remaining % 60:02d}"
+                    self.progress_label.configure(text=label)
                 elif kind == "progress":
                     current = int(payload)
                     maximum = int(self.progress.cget("maximum") or 0)
@@ -1259,16 +5291,40 @@ class App(tk.Tk):
                     self.progress_label.configure(text=f"{current}/{maximum}")
                 elif kind == "done":
                     self._append_log(payload)
-                    self.start_btn.configure(state=NORMAL)
-                    self.test_btn.configure(state=NORMAL)
-                    self.pause_btn.configure(state=DISABLED, text="Pause")
-                    self.stop_btn.configure(state=DISABLED)
+                    self._reset_buttons()
+                elif kind == "error":
+                    self._reset_buttons()
+                    messagebox.showerror("Fehler", payload)
+                elif kind == "info":
+                    self._reset_buttons()
+                    messagebox.showinfo("Info", payload)
         except queue.Empty:
             pass
-        self.after(120, self._drain_queue)
+
+
+def _report_startup(app: App, probe_path: Path, import_seconds: float, init_seconds: float) -> None:
+    """Benchmark hook for tools/bench_startup.py: record timings once the window is painted, then quit."""
+    app.wait_visibility(app)
+    app.update_idletasks()
+    data = {
+        "import_s": import_seconds,
+        "init_s": init_seconds,
+        "first_paint_s": time.perf_counter() - _IMPORT_STARTED,
+        # Wall clock, so the caller can include interpreter/bootloader start-up.
+        "painted_at": time.time(),
+        "frozen": bool(getattr(sys, "frozen", False)),
+    }
+    try:
+        probe_path.write_text(json.dumps(data), encoding="utf-8")
+    finally:
+        app.destroy()
 
 
 def main() -> None:
+    import_seconds = time.perf_counter() - _IMPORT_STARTED
+    if tk is None:
+        raise SystemExit("Tkinter ist nicht installiert; die GUI kann nicht starten (lip_queue.py läuft ohne).")
+
     # Helps Tk look correct on Windows high DPI
     try:
         from ctypes import windll  # type: ignore
@@ -1277,7 +5333,27 @@ def main() -> None:
     except Exception:
         pass
 
-    app = App()
+    profile: str | None = None
+    if len(sys.argv) > 1:
+        # argparse only when there is something to parse; it is not needed for a plain start.
+        import argparse
+
+        parser = argparse.ArgumentParser(prog=APP_NAME, description="Batch-GUI für LipGenerator.exe")
+        parser.add_argument(
+            "--profile",
+            nargs="?",
+            const=ProfileMode.FULL,
+            choices=[ProfileMode.OFF, ProfileMode.TIMERS, ProfileMode.FULL],
+            help="Phasen eines Laufs messen; Bericht landet im Output-Ordner (ohne Wert: full)",
+        )
+        profile = parser.parse_args().profile
+
+    init_started = time.perf_counter()
+    app = App(profile=profile)
+    probe = os.environ.get("LIPGUI_STARTUP_PROBE", "").strip()
+    if probe:
+        init_seconds = time.perf_counter() - init_started
+        app.after(0, lambda: _report_startup(app, Path(probe), import_seconds, init_seconds))
     app.mainloop()
 
 
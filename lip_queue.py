@@ -0,0 +1,475 @@
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator
+
+from lip_gui import (
+    Job,
+    TextSource,
+    WavProbeCache,
+    build_jobs,
+    estimate_job_cost,
+    load_text_mappings,
+    probe_wav_files,
+    run_lipgenerator_background,
+)
+
+
+# Job states: pending -> leased -> done/failed -> collected (result copied into the output tree).
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    wav_rel TEXT NOT NULL,
+    lip_rel TEXT NOT NULL,
+    text TEXT NOT NULL,
+    note TEXT NOT NULL DEFAULT '',
+    cost REAL NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    returncode INTEGER,
+    log TEXT,
+    lip BLOB
+);
+CREATE INDEX IF NOT EXISTS jobs_by_state ON jobs (state, cost DESC);
+"""
+
+MAX_LOG_CHARS = 4000
+
+
+@dataclass(frozen=True)
+class QueuedJob:
+    id: int
+    wav_rel: str
+    lip_rel: str
+    text: str
+    note: str
+    attempt: int
+
+
+class JobQueue:
+    """Shared job queue in a SQLite file, usable from several machines through a shared folder.
+
+    Every operation opens its own short-lived connection and takes SQLite's write lock with
+    BEGIN IMMEDIATE. The rollback journal is used instead of WAL, because WAL needs shared
+    memory that network file systems don't provide.
+    """
+
+    def __init__(self, db_path: Path, lease_seconds: float = 120.0, max_attempts: int = 3) -> None:
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    @contextmanager
+    def _tx(self) -> Iterator[sqlite3.Connection]:
+        con = sqlite3.connect(str(self.db_path), timeout=60, isolation_level=None)
+        try:
+            con.execute("PRAGMA journal_mode=DELETE")
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                yield con
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+            con.execute("COMMIT")
+        finally:
+            con.close()
+
+    def create(self, jobs: list[Job], costs: list[float], input_root: Path, output_root: Path, language: str, gesture: str) -> None:
+        """Fill a fresh queue; an existing queue file is replaced."""
+        for suffix in ("", "-journal"):
+            p = Path(str(self.db_path) + suffix)
+            if p.exists():
+                p.unlink()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._tx() as con:
+            for stmt in SCHEMA.strip().split(";"):
+                if stmt.strip():
+                    con.execute(stmt)
+            con.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("input_root", str(input_root)),
+                    ("output_root", str(output_root)),
+                    ("language", language),
+                    ("gesture", gesture),
+                ],
+            )
+            con.executemany(
+                "INSERT INTO jobs (wav_rel, lip_rel, text, note, cost) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        j.wav_path.relative_to(input_root).as_posix(),
+                        j.lip_path.relative_to(output_root).as_posix(),
+                        j.text,
+                        j.note,
+                        cost,
+                    )
+                    for j, cost in zip(jobs, costs)
+                ],
+            )
+
+    def meta(self) -> dict[str, str]:
+        with self._tx() as con:
+            return dict(con.execute("SELECT key, value FROM meta").fetchall())
+
+    def _expire_leases(self, con: sqlite3.Connection) -> None:
+        now = time.time()
+        con.execute(
+            "UPDATE jobs SET state = 'failed', worker = NULL, log = 'Lease abgelaufen (zu viele Versuche).' "
+            "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+            (now, self.max_attempts),
+        )
+        con.execute(
+            "UPDATE jobs SET state = 'pending', worker = NULL WHERE state = 'leased' AND lease_expires < ?",
+            (now,),
+        )
+
+    def lease(self, worker: str) -> QueuedJob | None:
+        """Take the most expensive pending job (longest-processing-time-first across all machines)."""
+        with self._tx() as con:
+            self._expire_leases(con)
+            row = con.execute(
+                "SELECT id, wav_rel, lip_rel, text, note, attempts FROM jobs "
+                "WHERE state = 'pending' ORDER BY cost DESC, id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            con.execute(
+                "UPDATE jobs SET state = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1 WHERE id = ?",
+                (worker, time.time() + self.lease_seconds, row[0]),
+            )
+            return QueuedJob(id=row[0], wav_rel=row[1], lip_rel=row[2], text=row[3], note=row[4], attempt=row[5] + 1)
+
+    def heartbeat(self, job_id: int, worker: str) -> bool:
+        """Extend a lease. False means the lease was lost (expired and handed to someone else)."""
+        with self._tx() as con:
+            cur = con.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND state = 'leased' AND worker = ?",
+                (time.time() + self.lease_seconds, job_id, worker),
+            )
+            return cur.rowcount == 1
+
+    def complete(self, job_id: int, worker: str, ok: bool, returncode: int, log: str, lip: bytes | None) -> bool:
+        with self._tx() as con:
+            cur = con.execute(
+                "UPDATE jobs SET state = ?, worker = NULL, lease_expires = NULL, returncode = ?, log = ?, lip = ? "
+                "WHERE id = ? AND state = 'leased' AND worker = ?",
+                ("done" if ok else "failed", returncode, log[-MAX_LOG_CHARS:], lip, job_id, worker),
+            )
+            return cur.rowcount == 1
+
+    def collect(self, limit: int = 200) -> list[tuple[int, str, str, bytes | None, str]]:
+        """Hand out finished results (id, state, lip_rel, lip bytes, log) and mark them collected."""
+        with self._tx() as con:
+            self._expire_leases(con)
+            rows = con.execute(
+                "SELECT id, state, lip_rel, lip, log FROM jobs WHERE state IN ('done', 'failed') LIMIT ?",
+                (limit,),
+            ).fetchall()
+            con.executemany(
+                "UPDATE jobs SET state = 'collected', lip = NULL WHERE id = ?",
+                [(r[0],) for r in rows],
+            )
+            return [(r[0], r[1], r[2], r[3], r[4] or "") for r in rows]
+
+    def counts(self) -> dict[str, int]:
+        with self._tx() as con:
+            return dict(con.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall())
+
+
+def run_worker(
+    queue: JobQueue,
+    lipgenerator_dir: Path,
+    exe_path: Path,
+    work_dir: Path,
+    input_root: Path | None = None,
+    slots: int = 1,
+    stop_event: threading.Event | None = None,
+    poll: float = 2.0,
+) -> tuple[int, int]:
+    """Lease and run jobs until the queue is drained. Returns (ok, failed) of this process."""
+    stop_event = stop_event or threading.Event()
+    pause_event = threading.Event()
+    pause_event.set()
+    meta = queue.meta()
+    input_root = input_root or Path(meta["input_root"])
+    language = meta["language"]
+    gesture = meta.get("gesture", "")
+    counts = {"ok": 0, "failed": 0}
+    lock = threading.Lock()
+
+    def _slot(slot_no: int) -> None:
+        worker = f"{socket.gethostname()}:{os.getpid()}:{slot_no}"
+        slot_dir = work_dir / f"slot{slot_no}"
+        slot_dir.mkdir(parents=True, exist_ok=True)
+        while not stop_event.is_set():
+            qjob = queue.lease(worker)
+            if qjob is None:
+                state = queue.counts()
+                if not state.get("pending") and not state.get("leased"):
+                    return
+                # Someone else still holds leases that may expire and come back.
+                stop_event.wait(poll)
+                continue
+
+            lip_path = slot_dir / Path(qjob.lip_rel).name
+            if lip_path.exists():
+                lip_path.unlink()
+            job = Job(wav_path=input_root / qjob.wav_rel, lip_path=lip_path, text=qjob.text, note=qjob.note)
+
+            # Heartbeats keep the lease alive; losing it cancels the local run.
+            job_stop = threading.Event()
+            done = threading.Event()
+
+            def _heartbeat() -> None:
+                interval = queue.lease_seconds / 3
+                next_beat = time.monotonic() + interval
+                while not done.wait(0.5):
+                    if stop_event.is_set():
+                        job_stop.set()
+                        return
+                    if time.monotonic() >= next_beat:
+                        if not queue.heartbeat(qjob.id, worker):
+                            job_stop.set()
+                            return
+                        next_beat = time.monotonic() + interval
+
+            hb = threading.Thread(target=_heartbeat, daemon=True)
+            hb.start()
+            try:
+                cp, was_killed = run_lipgenerator_background(
+                    lipgenerator_dir=lipgenerator_dir,
+                    exe_path=exe_path,
+                    job=job,
+                    language=language,
+                    gesture_exaggeration=gesture,
+                    stop_event=job_stop,
+                    pause_event=pause_event,
+                )
+                returncode, log = cp.returncode, (cp.stdout + cp.stderr).strip()
+            except Exception as exc:  # noqa: BLE001
+                was_killed, returncode, log = False, 1, f"FEHLER: {exc}"
+            finally:
+                done.set()
+                hb.join()
+
+            if was_killed:
+                # Lease lost or worker stopping: the job goes back to the queue when the lease expires.
+                continue
+            ok = returncode == 0 and lip_path.exists()
+            lip = lip_path.read_bytes() if ok else None
+            if queue.complete(qjob.id, worker, ok, returncode, log, lip):
+                with lock:
+                    counts["ok" if ok else "failed"] += 1
+                print(f"[{worker}] {'OK  ' if ok else 'FEHL'} {qjob.wav_rel}", flush=True)
+
+    threads = [threading.Thread(target=_slot, args=(n,), daemon=True) for n in range(max(1, slots))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return counts["ok"], counts["failed"]
+
+
+def run_coordinator(
+    queue: JobQueue,
+    output_root: Path,
+    poll: float = 1.0,
+    log: Callable[[str], None] = print,
+    timeout: float = 0.0,
+    idle_status: float = 30.0,
+) -> tuple[int, int]:
+    """Copy finished results into the output tree until no job is pending or leased.
+
+    While jobs are pending but none is leased (no worker attached), a status line is logged
+    every `idle_status` seconds. With `timeout` > 0, TimeoutError is raised once nothing has
+    changed for that many seconds.
+    """
+    ok = failed = 0
+    last_progress = ""
+    last_change = last_status = time.monotonic()
+    while True:
+        results = queue.collect()
+        for _, state, lip_rel, lip, job_log in results:
+            if state == "done" and lip is not None:
+                target = output_root / lip_rel
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp = target.with_name(target.name + ".tmp")
+                tmp.write_bytes(lip)
+                os.replace(tmp, target)
+                ok += 1
+            else:
+                failed += 1
+                log(f"FEHLER {lip_rel}: {job_log.strip()[:500]}")
+        counts = queue.counts()
+        if not any(counts.get(state) for state in ("pending", "leased", "done", "failed")):
+            return ok, failed
+        progress = (
+            f"Fortschritt: {counts.get('collected', 0)}/{sum(counts.values())} "
+            f"(offen: {counts.get('pending', 0)}, in Arbeit: {counts.get('leased', 0)})"
+        )
+        now = time.monotonic()
+        if progress != last_progress:
+            log(progress)
+            last_progress = progress
+            last_change = last_status = now
+        elif not counts.get("leased") and now - last_status >= idle_status:
+            log(f"{counts.get('pending', 0)} Job(s) offen, keine aktiven Leases (kein Worker verbunden?)")
+            last_status = now
+        if timeout > 0 and now - last_change >= timeout:
+            raise TimeoutError(f"Seit {timeout:.0f}s kein Fortschritt ({progress}).")
+        if not results:
+            time.sleep(poll)
+
+
+def _report_problems(problems: list[str], report_path: Path) -> None:
+    """Print the first few skipped WAVs like the GUI log and write the full list to report_path."""
+    print(f"{len(problems)} Datei(en) übersprungen (Text fehlt oder ist leer):")
+    for line in problems[:20]:
+        print(f"  {line}")
+    try:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text("\n".join(problems) + "\n", encoding="utf-8")
+        print(f"  Vollständige Liste: {report_path}")
+    except OSError:
+        if len(problems) > 20:
+            print(f"  … und {len(problems) - 20} weitere")
+
+
+def _spawn_local_workers(args: argparse.Namespace, n: int) -> list[subprocess.Popen]:
+    cmd = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "worker",
+        "--db",
+        str(args.db),
+        "--lipgenerator",
+        str(args.lipgenerator),
+        "--lease",
+        str(args.lease),
+    ]
+    if args.exe:
+        cmd += ["--exe", str(args.exe)]
+    return [subprocess.Popen(cmd) for _ in range(n)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Verteilt LipGUI-Jobs über eine gemeinsame SQLite-Queue auf mehrere Rechner.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def _common(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--db", type=Path, required=True, help="Queue-Datei (SQLite) im gemeinsamen Ordner")
+        p.add_argument("--lipgenerator", type=Path, default=Path(__file__).resolve().parent / "LipGenerator", help="Ordner mit LipGenerator.exe + FonixData.cdf")
+        p.add_argument("--exe", type=Path, default=None, help="Generator-Programm (Default: <lipgenerator>/LipGenerator.exe)")
+        p.add_argument("--lease", type=float, default=120.0, help="Lease-Dauer in Sekunden (Default: 120)")
+
+    coord = sub.add_parser("coordinator", help="Jobs anlegen und Ergebnisse einsammeln")
+    _common(coord)
+    coord.add_argument("--input", type=Path, required=True, help="WAV-Ordner")
+    coord.add_argument("--output", type=Path, required=True, help="Output-Ordner")
+    coord.add_argument("--recursive", action="store_true", help="Unterordner einbeziehen")
+    coord.add_argument("--flat", action="store_true", help="Ordnerstruktur nicht beibehalten")
+    coord.add_argument(
+        "--text-source",
+        choices=[TextSource.SIDECAR_TXT, TextSource.FILENAME, TextSource.FIXED, TextSource.MAPPING_FILE],
+        default=TextSource.SIDECAR_TXT,
+    )
+    coord.add_argument("--fixed-text", default="")
+    coord.add_argument("--mapping", type=Path, action="append", default=[], help="Mapping-Datei (mehrfach möglich)")
+    coord.add_argument("--language", default="USEnglish")
+    coord.add_argument("--gesture", default="")
+    coord.add_argument("--local-workers", type=int, default=0, help="Zusätzlich N Worker-Prozesse auf diesem Rechner starten")
+    coord.add_argument(
+        "--timeout", type=float, default=0.0, help="Abbrechen, wenn so viele Sekunden kein Fortschritt kommt (Default: 0 = nie)"
+    )
+
+    work = sub.add_parser("worker", help="Jobs aus der Queue abarbeiten")
+    _common(work)
+    work.add_argument("--input-root", type=Path, default=None, help="WAV-Ordner auf diesem Rechner, falls anders gemountet")
+    work.add_argument("--slots", type=int, default=1, help="Parallele Prozesse in diesem Worker")
+    work.add_argument("--work-dir", type=Path, default=None, help="Lokaler Ordner für Zwischenergebnisse")
+
+    args = parser.parse_args()
+    exe_path = (args.exe or args.lipgenerator / "LipGenerator.exe").resolve()
+    queue = JobQueue(args.db.resolve(), lease_seconds=args.lease)
+
+    if args.command == "worker":
+        work_dir = args.work_dir or Path(tempfile.gettempdir()) / f"lipgui-worker-{os.getpid()}"
+        ok, failed = run_worker(
+            queue,
+            lipgenerator_dir=args.lipgenerator.resolve(),
+            exe_path=exe_path,
+            work_dir=work_dir,
+            input_root=args.input_root.resolve() if args.input_root else None,
+            slots=args.slots,
+        )
+        print(f"Worker fertig. OK: {ok}, Fehler: {failed}")
+        return
+
+    input_root = args.input.expanduser().resolve()
+    output_root = args.output.expanduser().resolve()
+    mapping = load_text_mappings(args.mapping) if args.text_source == TextSource.MAPPING_FILE else None
+    problems: list[str] = []
+    jobs = build_jobs(
+        input_folder=input_root,
+        output_folder=output_root,
+        recursive=args.recursive,
+        preserve_structure=not args.flat,
+        text_source=args.text_source,
+        fixed_text=args.fixed_text,
+        mapping_file=None,
+        mapping=mapping,
+        problems=problems,
+    )
+    if problems:
+        _report_problems(problems, output_root / "lipgui_missing_text.txt")
+    infos = probe_wav_files([j.wav_path for j in jobs], cache=WavProbeCache())
+    kept = []
+    for j in jobs:
+        info = infos[j.wav_path]
+        if info.ok:
+            kept.append(j)
+        else:
+            print(f"ÜBERSPRUNGEN {j.wav_path.name}: {info.error}")
+    queue.create(
+        kept,
+        [estimate_job_cost(j, infos[j.wav_path]) for j in kept],
+        input_root,
+        output_root,
+        args.language,
+        args.gesture,
+    )
+    print(f"Queue: {args.db} ({len(kept)} Jobs)")
+
+    local = _spawn_local_workers(args, args.local_workers)
+    try:
+        ok, failed = run_coordinator(queue, output_root, timeout=args.timeout)
+    except TimeoutError as exc:
+        for p in local:
+            p.terminate()
+        raise SystemExit(f"Abgebrochen: {exc} Die Queue bleibt erhalten, Worker können später weitermachen.") from exc
+    finally:
+        for p in local:
+            p.wait()
+    print(f"Fertig. OK: {ok}, Fehler: {failed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""Shared CSV/TSV parser for mapping files, used by LipGUI and merge_lazyvoice_csv.py.
+
+A file is read in two steps. The first non-empty row picks the column profile once:
+
+    LazyVoiceFinder   Voice Type, File Name, Dialogue 2 - <language>
+    xTranslator       sID/FormID, Source, Dest (Dest preferred, Source for untranslated rows)
+    table             any other header with an ID/file and a text column (LipGUI heuristics)
+    plain             no header: ID, text
+
+Then every row is handled by a single loop with the column indices in local variables.
+"""
+from __future__ import annotations
+
+import io
+import itertools
+import re
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+_FORMID_PREFIX_RE = re.compile(r"^([0-9A-Fa-f]{8})")
+
+# Cells that are column names, not keys; such rows are skipped even if no header was found.
+_HEADER_KEYS = frozenset({"formid", "id", "key", "filename", "file", "wav", "path", "voicefile"})
+_HEADER_TOKENS = _HEADER_KEYS | {"subtitle", "text", "dialogue", "translated", "translation", "target"}
+
+# A column rule: (substring match, names). Rules are tried in order, each against all columns.
+_Rule = tuple[bool, tuple[str, ...]]
+
+
+def _exact(*names: str) -> _Rule:
+    return False, names
+
+
+def _contains(*names: str) -> _Rule:
+    return True, names
+
+
+@dataclass(frozen=True)
+class ColumnProfile:
+    name: str
+    key: tuple[_Rule, ...]
+    text: tuple[_Rule, ...]
+    voice: tuple[_Rule, ...] = ()
+    alt_text: tuple[_Rule, ...] = ()
+    # Column names for error messages (merge_lazyvoice_csv.py requires all of them).
+    labels: tuple[str, ...] = ()
+    requires_voice: bool = False
+    # Any of these in the first row makes it a header, even without usable columns
+    # (the rows are then read as ID, text).
+    header_tokens: frozenset[str] = frozenset()
+
+
+LAZYVOICEFINDER = ColumnProfile(
+    "LazyVoiceFinder",
+    key=(_exact("filename"),),
+    text=(_exact("dialogue2-german"), _contains("dialogue2")),
+    voice=(_exact("voicetype"),),
+    labels=("Voice Type", "File Name", "Dialogue 2 - German"),
+    requires_voice=True,
+)
+XTRANSLATOR = ColumnProfile(
+    "xTranslator",
+    key=(_exact("sid", "formid"),),
+    text=(_exact("dest"),),
+    alt_text=(_exact("source"),),
+    labels=("sID", "Dest"),
+)
+TABLE = ColumnProfile(
+    "Tabelle",
+    key=(
+        _exact("formid", "id", "key"),
+        _exact("filename", "file", "wav", "path", "voicefile"),
+        _contains("filename", "file", "wav", "path", "voice"),
+    ),
+    # Prefer translated/target text columns, fall back to subtitle/text, then to headers
+    # like "Dialogue2-German" / "Dialogue 2 - German".
+    text=(
+        _exact("translated", "translation", "target", "targettext", "translatedtext"),
+        _exact("subtitle", "subtitles", "text", "dialogue", "line"),
+        _contains("translated", "translation", "target", "subtitle", "dialogue", "text"),
+    ),
+    voice=(_exact("voicetype", "voice", "voicename"), _contains("voicetype", "voice")),
+    header_tokens=_HEADER_TOKENS,
+)
+PLAIN = ColumnProfile("2 Spalten", key=(), text=())
+
+# Tried in this order on the first row; PLAIN is the fallback.
+AUTO_PROFILES = (LAZYVOICEFINDER, XTRANSLATOR, TABLE)
+
+
+@dataclass(frozen=True)
+class Columns:
+    """Column indices picked for one file (-1: column not present)."""
+
+    profile: ColumnProfile
+    header: bool
+    key: int = 0
+    text: int = 1
+    alt_text: int = -1
+    voice: int = -1
+
+
+def normalize_header(name: str) -> str:
+    # Keep '-' so substring checks like 'dialogue2-german' still work.
+    return name.strip().lower().replace(" ", "").replace("_", "")
+
+
+def normalize_mapping_key(raw_key: str) -> str:
+    key = raw_key.strip()
+    if not key:
+        return ""
+    key = key.removeprefix("0x").removeprefix("0X").strip()
+    m = _FORMID_PREFIX_RE.match(key)
+    if m:
+        return m.group(1).upper()
+    return key.lower()
+
+
+def _first_column(header: Sequence[str], rules: tuple[_Rule, ...], skip: int = -1) -> int:
+    for contains, names in rules:
+        for i, col in enumerate(header):
+            if i == skip:
+                continue
+            if any(n in col for n in names) if contains else col in names:
+                return i
+    return -1
+
+
+def _match_profile(profile: ColumnProfile, header: list[str]) -> Columns | None:
+    if not profile.key:
+        return None
+    key = _first_column(header, profile.key)
+    text = _first_column(header, profile.text, skip=key)
+    voice = _first_column(header, profile.voice) if profile.voice else -1
+    if key < 0 or text < 0 or (profile.requires_voice and voice < 0):
+        return None
+    alt_text = _first_column(header, profile.alt_text) if profile.alt_text else -1
+    return Columns(profile, True, key, text, alt_text, voice)
+
+
+def detect_columns(first_row: list[str], profiles: Sequence[ColumnProfile] = AUTO_PROFILES) -> Columns:
+    """Pick the column profile and indices from the first row of a file."""
+    header = [normalize_header(c) for c in first_row]
+    for profile in profiles:
+        if profile.header_tokens and not any(token in profile.header_tokens for token in header):
+            continue
+        columns = _match_profile(profile, header)
+        if columns is not None:
+            return columns
+        if profile.header_tokens:
+            return Columns(profile, True)
+    return Columns(PLAIN, False)
+
+
+def detect_delimiter(line: str) -> str:
+    """The first tab, semicolon or comma of a line (the header or first row) is the delimiter.
+
+    The first field is an ID or a column name, so unlike the text it holds none of them.
+    """
+    positions = [(line.find(d), d) for d in ("\t", ";", ",")]
+    found = [p for p in positions if p[0] >= 0]
+    return min(found)[1] if found else "\t"
+
+
+def sniff_delimiter(path: Path) -> str:
+    """The delimiter of a CSV/TSV file, from its first non-empty line only."""
+    with path.open("rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                return detect_delimiter(line.decode("utf-8", errors="replace"))
+    return "\t"
+
+
+def scan_delimited(path: Path) -> tuple[str, int]:
+    """Return (delimiter, line count + 1) of a CSV/TSV file without holding it in memory.
+
+    Reads the whole file; only for callers that need the count (sizing the on-disk index).
+    """
+    lines = 0
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            lines += chunk.count(b"\n")
+    return sniff_delimiter(path), lines + 1
+
+
+def _first_row(rows: Iterator[list[str]]) -> list[str] | None:
+    for row in rows:
+        if any(c.strip() for c in row):
+            return row
+    return None
+
+
+def _open(path: Path) -> io.TextIOWrapper:
+    # utf-8-sig: Excel and LazyVoiceFinder write a BOM in front of the first column name.
+    return path.open("r", encoding="utf-8-sig", errors="replace", newline="")
+
+
+def iter_delimited_mapping(
+    path: Path, delimiter: str | None = None, profiles: Sequence[ColumnProfile] = AUTO_PROFILES
+) -> Iterator[tuple[str, str]]:
+    """Yield (key, text) pairs of a CSV/TSV mapping file, as LipGUI looks them up.
+
+    Keys are normalized: FormIDs to 8 upper-case hex digits, file names and paths to the
+    lower-case stem. With a voice type column, "<voice>/<key>" and "<voice>\\<key>" follow.
+    """
+    from csv import reader as csv_reader
+
+    if delimiter is None:
+        delimiter = sniff_delimiter(path)
+    with _open(path) as f:
+        rows = csv_reader(f, delimiter=delimiter)
+        first = _first_row(rows)
+        if first is None:
+            raise ValueError("Mapping-Datei ist leer.")
+        columns = detect_columns(first, profiles)
+        if not columns.header:
+            rows = itertools.chain([first], rows)
+
+        key_idx, text_idx, alt_idx, voice_idx = columns.key, columns.text, columns.alt_text, columns.voice
+        width = max(key_idx, text_idx) + 1
+        formid_match = _FORMID_PREFIX_RE.match
+        header_keys = _HEADER_KEYS
+        for row in rows:
+            if len(row) < width:
+                continue
+            key = row[key_idx].strip()
+            if not key:
+                continue
+            text = row[text_idx].strip()
+            if not text and 0 <= alt_idx < len(row):
+                text = row[alt_idx].strip()
+            if not text:
+                continue
+
+            # Paths and file names are reduced to the stem.
+            if "/" in key or "\\" in key or key[-4:].lower() == ".wav":
+                key = key.replace("\\", "/").rpartition("/")[2]
+                dot = key.rfind(".")
+                if dot > 0:
+                    key = key[:dot]
+                key = key.strip()
+            if key[:2] in ("0x", "0X"):
+                key = key[2:].strip()
+            m = formid_match(key)
+            key = m.group(1).upper() if m else key.lower()
+            if not key or key in header_keys:
+                continue
+
+            yield key, text
+
+            # LazyVoiceFinder-style exports: Voice Type (folder) + File Name stem.
+            if 0 <= voice_idx < len(row):
+                voice = row[voice_idx].strip().lower()
+                if voice:
+                    yield f"{voice}/{key}", text
+                    yield f"{voice}\\{key}", text
+
+
+def iter_delimited_entries(
+    path: Path, profile: ColumnProfile, delimiter: str | None = None
+) -> Iterator[tuple[str, str, str]]:
+    """Yield (voice, key cell, text) of a file with a header in `profile`, cells stripped but unchanged.
+
+    Raises ValueError if the header lacks a column of the profile.
+    """
+    from csv import reader as csv_reader
+
+    if delimiter is None:
+        delimiter = sniff_delimiter(path)
+    with _open(path) as f:
+        rows = csv_reader(f, delimiter=delimiter)
+        first = _first_row(rows)
+        if first is None:
+            return
+        columns = _match_profile(profile, [normalize_header(c) for c in first])
+        if columns is None:
+            raise ValueError(
+                f"In {path.name} fehlen Spalten ({', '.join(profile.labels)} erwartet). Gefunden: {first}"
+            )
+
+        key_idx, text_idx, alt_idx, voice_idx = columns.key, columns.text, columns.alt_text, columns.voice
+        for row in rows:
+            n = len(row)
+            if key_idx >= n or text_idx >= n:
+                continue
+            key = row[key_idx].strip()
+            text = row[text_idx].strip()
+            if not text and 0 <= alt_idx < n:
+                text = row[alt_idx].strip()
+            voice = row[voice_idx].strip() if 0 <= voice_idx < n else ""
+            if not key or not text or (profile.requires_voice and not voice):
+                continue
+            yield voice, key, text
@@ -5,26 +5,7 @@ import csv
 from dataclasses import dataclass
 from pathlib import Path
 
-
-REQUIRED_COLUMNS = {
-    "voice type": "Voice Type",
-    "file name": "File Name",
-    "dialogue 2 - german": "Dialogue 2 - German",
-}
-
-
-def normalize_header(name: str) -> str:
-    return name.strip().lower()
-
-
-def detect_delimiter(text: str) -> str:
-    # LazyVoiceFinder exports are typically comma-separated, but be tolerant.
-    if "\t" in text:
-        return "\t"
-    # If semicolons dominate and commas are rare, prefer ';'
-    if text.count(";") > text.count(","):
-        return ";"
-    return ","
+from mapping_parser import LAZYVOICEFINDER, iter_delimited_entries
 
 
 @dataclass
@@ -40,52 +21,10 @@ class Row:
 
 
 def read_lazyvoice_csv(path: Path) -> list[Row]:
-    raw = path.read_text(encoding="utf-8", errors="replace")
-    delim = detect_delimiter(raw)
-    lines = [ln for ln in raw.splitlines() if ln.strip()]
-    if not lines:
-        return []
-
-    reader = csv.reader(lines, delimiter=delim)
-    try:
-        header_row = next(reader)
-    except StopIteration:
-        return []
-
-    header_norm = [normalize_header(h) for h in header_row]
-
-    def find_col(target_norm: str) -> int:
-        for i, col in enumerate(header_norm):
-            if col == target_norm:
-                return i
-        raise ValueError(
-            f"In {path.name} fehlt die Spalte '{REQUIRED_COLUMNS[target_norm]}'. Gefunden: {header_row}"
-        )
-
-    idx_voice = find_col("voice type")
-    idx_file = find_col("file name")
-    idx_text = find_col("dialogue 2 - german")
-
-    out: list[Row] = []
-    for row in reader:
-        if not row:
-            continue
-        # Pad short rows
-        if len(row) <= max(idx_voice, idx_file, idx_text):
-            row = row + [""] * (max(idx_voice, idx_file, idx_text) + 1 - len(row))
-
-        voice_type = (row[idx_voice] or "").strip()
-        file_name = (row[idx_file] or "").strip()
-        text = (row[idx_text] or "").strip()
-
-        if not voice_type or not file_name:
-            continue
-        if not text:
-            continue
-
-        out.append(Row(voice_type=voice_type, file_name=file_name, text=text))
-
-    return out
+    return [
+        Row(voice_type=voice_type, file_name=file_name, text=text)
+        for voice_type, file_name, text in iter_delimited_entries(path, LAZYVOICEFINDER)
+    ]
 
 
 def merge_rows(rows: list[Row]) -> dict[tuple[str, str], Row]:
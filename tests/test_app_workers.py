@@ -0,0 +1,80 @@
+"""App worker-thread methods, run against a stand-in for the window (no display needed)."""
+import queue
+import types
+
+import pytest
+
+from lip_gui import App
+
+
+def _app(**methods) -> types.SimpleNamespace:
+    app = types.SimpleNamespace(_queue=queue.Queue())
+    for name, func in methods.items():
+        setattr(app, name, types.MethodType(func, app))
+    return app
+
+
+def _messages(app) -> list[tuple[str, str]]:
+    out = []
+    while not app._queue.empty():
+        out.append(app._queue.get_nowait())
+    return out
+
+
+def test_mapping_test_reports_load_errors_through_the_queue(tmp_path):
+    def _open_mapping(self, files):
+        raise ValueError("kaputt")
+
+    app = _app(_open_mapping=_open_mapping)
+    App._worker_test_mapping(app, [tmp_path / "m.tsv"], tmp_path, False, tmp_path / "report.txt")
+    assert ("error", "kaputt") in _messages(app)
+
+
+def test_mapping_test_loads_and_scans_on_the_worker(tmp_path):
+    calls = []
+    app = _app(
+        _open_mapping=lambda self, files: calls.append("open") or {},
+        _scan_wavs=lambda self, folder, recursive: calls.append("scan") or [],
+    )
+    App._worker_test_mapping(app, [], tmp_path, False, tmp_path / "report.txt")
+    assert calls == ["open", "scan"]
+    assert ("info", "Keine .wav Dateien gefunden.") in _messages(app)
+
+
+@pytest.mark.parametrize("mapping", [None, {}])
+def test_run_errors_are_reported_instead_of_leaving_the_buttons_disabled(mapping):
+    def _run_jobs(self, opts, jobs, mapping):
+        raise RuntimeError("Backend weg")
+
+    app = _app(_build_run_jobs=lambda self, opts: ([], mapping), _run_jobs=_run_jobs)
+    App._worker_run(app, opts=None)
+    messages = _messages(app)
+    assert ("error", "Backend weg") in messages
+    assert any(kind == "log" and "Backend weg" in text for kind, text in messages)
+
+
+def test_mappings_are_closed_when_building_the_jobs_fails(tmp_path):
+    from lip_gui import PhaseProfiler, RunOptions, TextSource, build_mapped_text_mapping
+
+    mapping_file = tmp_path / "m.tsv"
+    mapping_file.write_text("0001A2B3\tHallo\n", encoding="utf-8")
+    opened = []
+
+    def _open_mapping(self, files):
+        opened.append(build_mapped_text_mapping(files, tmp_path / f"m{len(opened)}.idx"))
+        return opened[-1]
+
+    def _scan_wavs(self, folder, recursive):
+        raise OSError("Ordner weg")
+
+    app = _app(_open_mapping=_open_mapping, _scan_wavs=_scan_wavs)
+    app._profiler = PhaseProfiler()
+    opts = RunOptions(
+        tmp_path, tmp_path, False, True, TextSource.MAPPING_FILE, "", (mapping_file,),
+        "German", "", 1, False, "off", False,
+    )
+    with pytest.raises(OSError):
+        App._build_run_jobs(app, opts)
+    assert len(opened) == 1
+    with pytest.raises(ValueError):
+        opened[0]["0001A2B3"]  # mmap closed
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from lip_gui import ChildLimits, ProcessPriority
+
+posix_only = pytest.mark.skipif(os.name == "nt" or not hasattr(os, "sched_getaffinity"), reason="POSIX limit wrapper")
+
+_REPORT = (
+    "import os, resource; "
+    "print(os.getpid(), os.getpriority(os.PRIO_PROCESS, 0), sorted(os.sched_getaffinity(0)), "
+    "resource.getrlimit(resource.RLIMIT_AS)[0], resource.getrlimit(resource.RLIMIT_CPU)[0])"
+)
+
+
+@posix_only
+def test_limits_hold_from_the_start_of_the_generator():
+    cpu = min(os.sched_getaffinity(0))
+    limits = ChildLimits(ProcessPriority.IDLE, (cpu,), memory_mb=2048, cpu_seconds=60)
+    proc = subprocess.Popen(limits.command([sys.executable, "-c", _REPORT]), stdout=subprocess.PIPE, text=True)
+    out, _ = proc.communicate(timeout=60)
+    fields = out.split()
+    # exec keeps the pid, so Pause, Stop and the rusage accounting still see the generator.
+    assert int(fields[0]) == proc.pid
+    assert int(fields[1]) == 19
+    assert fields[2] == f"[{cpu}]"
+    assert (int(fields[3]), int(fields[4])) == (2048 * 1024 * 1024, 60)
+    assert limits.apply(proc) == []
+    assert "nach bestem Bemühen" not in limits.describe()
+
+
+@posix_only
+def test_missing_generator_fails_like_a_process():
+    limits = ChildLimits(ProcessPriority.BELOW_NORMAL)
+    cp = subprocess.run(limits.command(["/nonexistent/LipGenerator"]), capture_output=True, text=True, timeout=60)
+    assert cp.returncode == 127
+    assert "FEHLER: /nonexistent/LipGenerator" in cp.stderr
+
+
+def test_no_limits_no_wrapper():
+    assert ChildLimits().command(["LipGenerator.exe"]) == ["LipGenerator.exe"]
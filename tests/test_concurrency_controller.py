@@ -0,0 +1,48 @@
+import time
+from collections import Counter
+
+from lip_gui import ConcurrencyController
+
+
+class _IdleSampler:
+    def sample(self):
+        return None, None
+
+
+def _simulate(controller: ConcurrencyController, throughput, windows: int) -> list[int]:
+    """Feed one measurement window per step with throughput(limit); return the limits seen."""
+    limits = []
+    for _ in range(windows):
+        controller._window_start = time.monotonic() - 1.0
+        controller._window_cost = throughput(controller.limit)
+        controller._window_jobs = controller.limit
+        controller._maybe_adjust()
+        limits.append(controller.limit)
+    return limits
+
+
+def _controller(start: int) -> ConcurrencyController:
+    return ConcurrencyController(min_workers=1, max_workers=8, start=start, window=0.0, sampler=_IdleSampler())
+
+
+def test_settles_at_the_peak_when_throughput_is_flat_above_it():
+    limits = _simulate(_controller(1), lambda n: 10.0 * min(n, 4), 200)
+    settled = limits[20:]
+    assert set(settled) <= {3, 4, 5}
+    assert Counter(settled)[4] >= 0.7 * len(settled)
+
+
+def test_settles_at_the_peak_when_throughput_falls_off_above_it():
+    limits = _simulate(_controller(8), lambda n: 100.0 - 10.0 * (n - 3) ** 2, 200)
+    settled = limits[20:]
+    assert set(settled) <= {2, 3, 4}
+    assert Counter(settled)[3] >= 0.7 * len(settled)
+
+
+def test_low_memory_steps_down():
+    class _LowMemory:
+        def sample(self):
+            return 0.5, 0.05
+
+    controller = ConcurrencyController(min_workers=1, max_workers=8, start=6, window=0.0, sampler=_LowMemory())
+    assert _simulate(controller, lambda n: 10.0 * n, 3) == [5, 4, 3]
@@ -0,0 +1,108 @@
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+
+from esp_text import count_info_records, iter_plugin_texts
+
+
+def _sub(sig: bytes, data: bytes) -> bytes:
+    return struct.pack("<4sH", sig, len(data)) + data
+
+
+def _record(sig: bytes, form_id: int, data: bytes, flags: int = 0) -> bytes:
+    if flags & 0x00040000:
+        data = struct.pack("<I", len(data)) + zlib.compress(data)
+    return struct.pack("<4sIII8x", sig, len(data), flags, form_id) + data
+
+
+def _group(label: bytes, group_type: int, content: bytes) -> bytes:
+    return struct.pack("<4sI4si8x", b"GRUP", 24 + len(content), label, group_type) + content
+
+
+def _info(form_id: int, responses: list[tuple[int, bytes]], flags: int = 0) -> bytes:
+    data = b"".join(
+        _sub(b"TRDT", struct.pack("<II4xB11x", 0, 50, number)) + _sub(b"NAM1", nam1) for number, nam1 in responses
+    )
+    return _record(b"INFO", form_id, data, flags)
+
+
+def _plugin(path: Path, infos: list[bytes], localized: bool = False) -> Path:
+    topic = _record(b"DIAL", 0x01000800, _sub(b"EDID", b"Topic\0"))
+    dial = _group(b"DIAL", 0, topic + _group(struct.pack("<I", 0x01000800), 7, b"".join(infos)))
+    other = _group(b"WEAP", 0, _record(b"WEAP", 0x01000900, _sub(b"EDID", b"Sword\0")))
+    tes4 = _record(b"TES4", 0, _sub(b"HEDR", b"\0" * 12), flags=0x80 if localized else 0)
+    path.write_bytes(tes4 + other + dial)
+    return path
+
+
+def _ilstrings(path: Path, strings: dict[int, str]) -> Path:
+    directory, data = b"", b""
+    for string_id, text in strings.items():
+        raw = text.encode("utf-8") + b"\0"
+        directory += struct.pack("<II", string_id, len(data))
+        data += struct.pack("<I", len(raw)) + raw
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(struct.pack("<II", len(strings), len(data)) + directory + data)
+    return path
+
+
+def test_plain_and_compressed_info_records(tmp_path):
+    plugin = _plugin(
+        tmp_path / "Test.esp",
+        [
+            _info(0x0100ABCD, [(1, b"Hello there.\0"), (2, b"Second line.\0")]),
+            _info(0x0200ABCE, [(1, "Grüß dich.".encode("utf-8") + b"\0")], flags=0x00040000),
+            _info(0x0100ABCF, [(1, b"\0")]),
+        ],
+    )
+    assert list(iter_plugin_texts(plugin)) == [
+        ("0000ABCD", "Hello there."),
+        ("0000ABCD_1", "Hello there."),
+        ("0000ABCD_2", "Second line."),
+        ("0000ABCE", "Grüß dich."),
+        ("0000ABCE_1", "Grüß dich."),
+    ]
+    assert count_info_records(plugin) == 3
+
+
+def test_localized_plugin_reads_its_string_table(tmp_path):
+    plugin = _plugin(
+        tmp_path / "Test.esp",
+        [_info(0x0100ABCD, [(1, struct.pack("<I", 7))]), _info(0x0100ABCE, [(1, struct.pack("<I", 8))], flags=0x00040000)],
+        localized=True,
+    )
+    table = _ilstrings(tmp_path / "Strings" / "Test_german.ILSTRINGS", {7: "Hallo.", 8: "Tschüss."})
+
+    expected = [("0000ABCD", "Hallo."), ("0000ABCD_1", "Hallo."), ("0000ABCE", "Tschüss."), ("0000ABCE_1", "Tschüss.")]
+    assert list(iter_plugin_texts(plugin)) == expected
+    assert list(iter_plugin_texts(table)) == expected
+    assert count_info_records(table) == 2
+
+
+def test_several_languages_need_an_explicit_table(tmp_path):
+    plugin = _plugin(tmp_path / "Test.esp", [_info(0x0100ABCD, [(1, struct.pack("<I", 7))])], localized=True)
+    _ilstrings(tmp_path / "Strings" / "Test_german.ILSTRINGS", {7: "Hallo."})
+    _ilstrings(tmp_path / "Strings" / "Test_french.ILSTRINGS", {7: "Bonjour."})
+    with pytest.raises(ValueError, match="mehrere Sprachen"):
+        list(iter_plugin_texts(plugin))
+
+
+def test_rejects_files_that_are_not_plugins(tmp_path):
+    path = tmp_path / "Broken.esp"
+    path.write_bytes(b"not a plugin at all, just some bytes")
+    with pytest.raises(ValueError):
+        list(iter_plugin_texts(path))
+    with pytest.raises(ValueError):
+        count_info_records(path)
+
+
+def test_mapping_dialog_offers_every_plugin_source_suffix():
+    import esp_text
+    from lip_gui import MAPPING_FILETYPES, _is_plugin_source
+
+    patterns = dict(MAPPING_FILETYPES)["Plugins/Strings"].split()
+    for suffix in esp_text.PLUGIN_SUFFIXES | esp_text.STRINGS_SUFFIXES:
+        assert f"*{suffix}" in patterns and f"*{suffix.upper()}" in patterns
+        assert _is_plugin_source(Path(f"Skyrim_English{suffix.upper()}"))
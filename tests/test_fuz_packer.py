@@ -0,0 +1,44 @@
+import os
+from pathlib import Path
+
+from lip_gui import FuzPacker, Job
+
+
+def _job(root: Path, lip_data: bytes) -> Job:
+    lip = root / "out" / "a.lip"
+    lip.parent.mkdir(parents=True, exist_ok=True)
+    lip.write_bytes(lip_data)
+    return Job(wav_path=root / "a.wav", lip_path=lip, text="")
+
+
+def test_fuz_is_kept_only_for_the_same_lip_bytes(tmp_path):
+    (tmp_path / "a.xwm").write_bytes(b"XWMAUDIO")
+    fuz = tmp_path / "out" / "a.fuz"
+
+    packer = FuzPacker()
+    packer.process(_job(tmp_path, b"LIP1"))
+    assert fuz.read_bytes()[12:] == b"LIP1XWMAUDIO"
+
+    # Regenerated with the same result: the .fuz stays.
+    os.utime(fuz, ns=(1, 1))
+    os.utime(tmp_path / "a.xwm", ns=(0, 0))
+    packer.process(_job(tmp_path, b"LIP1"))
+    assert fuz.stat().st_mtime_ns == 1
+
+    # Same size, different bytes: packed again.
+    packer.process(_job(tmp_path, b"LIP2"))
+    assert fuz.read_bytes()[12:] == b"LIP2XWMAUDIO"
+    assert packer.finish(canceled=False) == ["FUZ: 2 geschrieben, 1 unverändert, 0 ohne .xwm"]
+
+
+def test_newer_xwm_is_packed_again(tmp_path):
+    (tmp_path / "a.xwm").write_bytes(b"OLDAUDIO")
+    packer = FuzPacker()
+    packer.process(_job(tmp_path, b"LIP1"))
+    fuz = tmp_path / "out" / "a.fuz"
+    os.utime(fuz, ns=(1, 1))
+    (tmp_path / "a.xwm").write_bytes(b"NEWAUDIO")
+
+    packer.process(_job(tmp_path, b"LIP1"))
+    assert fuz.read_bytes()[12:] == b"LIP1NEWAUDIO"
+    assert packer.unchanged == 0
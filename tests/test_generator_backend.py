@@ -0,0 +1,16 @@
+import pytest
+
+from lip_gui import GeneratorBackend, ServerBackend, SpawnBackend
+
+
+def test_backend_without_run_fails_on_construction():
+    class Incomplete(GeneratorBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_shipped_backends_are_complete():
+    assert not SpawnBackend.__abstractmethods__
+    assert not ServerBackend.__abstractmethods__
@@ -0,0 +1,99 @@
+import subprocess
+import sys
+import wave
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _wav(path: Path) -> None:
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(8000)
+        w.writeframes(b"\0\0" * 800)
+
+
+def test_imports_without_tkinter():
+    code = "import sys; sys.modules['tkinter'] = None; import lip_queue"
+    cp = subprocess.run([sys.executable, "-c", code], cwd=str(ROOT), capture_output=True, text=True, timeout=60)
+    assert cp.returncode == 0, cp.stderr
+
+
+def test_coordinator_skips_wavs_without_text(tmp_path):
+    wavs = tmp_path / "wav"
+    wavs.mkdir()
+    for name in ("a", "b", "c"):
+        _wav(wavs / f"{name}.wav")
+    (wavs / "a.txt").write_text("Hallo", encoding="utf-8")
+    (wavs / "c.txt").write_text("Welt", encoding="utf-8")
+    (tmp_path / "lipgen").mkdir()
+    out = tmp_path / "out"
+
+    cp = subprocess.run(
+        [
+            sys.executable,
+            str(ROOT / "lip_queue.py"),
+            "coordinator",
+            "--db", str(tmp_path / "q.sqlite"),
+            "--input", str(wavs),
+            "--output", str(out),
+            "--lipgenerator", str(tmp_path / "lipgen"),
+            "--exe", str(ROOT / "tools" / "fake_lipgenerator.py"),
+            "--local-workers", "1",
+        ],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert cp.returncode == 0, cp.stderr
+    assert "1 Datei(en) übersprungen" in cp.stdout
+    assert sorted(p.name for p in out.glob("*.lip")) == ["a.lip", "c.lip"]
+    assert "b.txt" in (out / "lipgui_missing_text.txt").read_text(encoding="utf-8")
+
+
+def _queue(tmp_path: Path, costs: list[float], lease_seconds: float = 60.0, max_attempts: int = 3):
+    from lip_gui import Job
+    from lip_queue import JobQueue
+
+    inp, out = tmp_path / "in", tmp_path / "out"
+    jobs = [Job(wav_path=inp / f"{n}.wav", lip_path=out / f"{n}.lip", text=f"t{n}") for n in range(len(costs))]
+    queue = JobQueue(tmp_path / "q.sqlite", lease_seconds=lease_seconds, max_attempts=max_attempts)
+    queue.create(jobs, costs, inp, out, "German", "")
+    return queue
+
+
+def test_lease_hands_out_the_most_expensive_job_once(tmp_path):
+    queue = _queue(tmp_path, [1.0, 5.0, 3.0])
+    leased = [queue.lease("w1"), queue.lease("w2"), queue.lease("w1"), queue.lease("w2")]
+    assert [j.wav_rel if j else None for j in leased] == ["1.wav", "2.wav", "0.wav", None]
+
+    assert queue.complete(leased[0].id, "w1", True, 0, "ok", b"LIP")
+    assert not queue.complete(leased[1].id, "w1", True, 0, "wrong worker", b"")
+    assert queue.collect() == [(leased[0].id, "done", "1.lip", b"LIP", "ok")]
+    assert queue.counts() == {"collected": 1, "leased": 2}
+
+
+def test_expired_leases_go_back_to_the_queue_until_the_attempts_run_out(tmp_path):
+    queue = _queue(tmp_path, [1.0], lease_seconds=-1.0, max_attempts=2)
+    first = queue.lease("w1")
+    second = queue.lease("w2")
+    assert second.id == first.id
+    assert (first.attempt, second.attempt) == (1, 2)
+    assert not queue.heartbeat(first.id, "w1")
+    assert queue.lease("w3") is None
+    assert queue.collect()[0][1] == "failed"
+
+
+def test_coordinator_without_workers_reports_and_times_out(tmp_path):
+    from lip_queue import run_coordinator
+
+    queue = _queue(tmp_path, [1.0, 2.0])
+    lines: list[str] = []
+    with pytest.raises(TimeoutError):
+        run_coordinator(queue, tmp_path / "out", poll=0.01, log=lines.append, timeout=0.3, idle_status=0.1)
+    assert lines[0] == "Fortschritt: 0/2 (offen: 2, in Arbeit: 0)"
+    assert "2 Job(s) offen, keine aktiven Leases (kein Worker verbunden?)" in lines[1:]
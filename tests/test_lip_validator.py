@@ -0,0 +1,83 @@
+import subprocess
+import threading
+from pathlib import Path
+
+from lip_gui import BatchRunner, GeneratorBackend, Job, LipValidator, WavInfo
+
+
+def _validator(tmp_path: Path, lips: dict[str, bytes], min_samples: int = 20) -> tuple[LipValidator, list[Job]]:
+    jobs = []
+    infos = {}
+    for name, data in lips.items():
+        lip = tmp_path / f"{name}.lip"
+        lip.write_bytes(data)
+        job = Job(wav_path=tmp_path / f"{name}.wav", lip_path=lip, text="")
+        infos[job.wav_path] = WavInfo(path=job.wav_path, size=0, mtime_ns=0, duration=2.0)
+        jobs.append(job)
+    return LipValidator(infos, min_samples=min_samples), jobs
+
+
+def _lip(size: int, header: bytes = b"\x02\x00\x00\x00") -> bytes:
+    return header + b"\x01" * (size - len(header))
+
+
+def test_early_files_are_checked_again_once_the_median_exists(tmp_path):
+    lips = {"cut": _lip(20), "bad_header": _lip(400, b"XXXX")}
+    lips.update({f"ok{i}": _lip(400) for i in range(20)})
+    validator, jobs = _validator(tmp_path, lips)
+
+    errors = [validator.process(job) for job in jobs]
+    assert errors == [""] * len(jobs)  # all checked before the reference existed or fine
+    rejected = {job.lip_path.stem: reason for job, reason in validator.take_rejected()}
+    assert set(rejected) == {"cut", "bad_header"}
+    assert "abgeschnitten" in rejected["cut"]
+    assert "Header" in rejected["bad_header"]
+    assert validator.take_rejected() == []
+    assert validator.finish(canceled=False) == [f"Prüfung: {len(jobs)} .lip geprüft, 2 ungültig"]
+
+
+def test_small_batch_is_checked_in_finish(tmp_path):
+    validator, jobs = _validator(tmp_path, {"a": _lip(400), "b": _lip(400), "c": _lip(400), "cut": _lip(30)})
+    assert [validator.process(job) for job in jobs] == ["", "", "", ""]
+    validator.finish(canceled=False)
+    assert [job.lip_path.stem for job, _ in validator.take_rejected()] == ["cut"]
+
+
+def test_structural_checks(tmp_path):
+    validator, jobs = _validator(tmp_path, {"empty": b"", "nul": b"\0" * 64, "short": b"\x02\x00"})
+    assert [validator.process(job) for job in jobs] == [
+        "leere .lip-Datei",
+        ".lip enthält nur Nullbytes",
+        ".lip zu kurz für einen Header (2 Bytes)",
+    ]
+
+
+class _Backend(GeneratorBackend):
+    """Writes 400 bytes per lip, 20 for names starting with "cut"."""
+
+    def run(self, job, language, stop_event, pause_event, problems=None, spill_path=None, slot=0, usage=None):
+        job.lip_path.write_bytes(_lip(20 if job.wav_path.stem.startswith("cut") else 400))
+        return subprocess.CompletedProcess([], 0, "", ""), False
+
+
+def test_runner_counts_late_rejections_as_failed(tmp_path):
+    names = ["cut"] + [f"ok{i}" for i in range(20)]
+    jobs = [Job(wav_path=tmp_path / f"{n}.wav", lip_path=tmp_path / "out" / f"{n}.lip", text="") for n in names]
+    infos = {job.wav_path: WavInfo(path=job.wav_path, size=0, mtime_ns=0, duration=2.0) for job in jobs}
+    pause = threading.Event()
+    pause.set()
+    runner = BatchRunner(
+        tmp_path,
+        tmp_path / "LipGenerator.exe",
+        "German",
+        "",
+        workers=1,
+        emit=lambda kind, payload: None,
+        stop_event=threading.Event(),
+        pause_event=pause,
+        backend=_Backend(),
+        stages=[LipValidator(infos)],
+    )
+    # Most expensive first: give "cut" the highest cost so it runs before the reference exists.
+    assert runner.run(jobs, [2.0] + [1.0] * 20) == (20, 1)
+    assert [(job.wav_path.stem, "abgeschnitten" in reason) for job, reason in runner.failed_jobs] == [("cut", True)]
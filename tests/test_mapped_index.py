@@ -0,0 +1,101 @@
+import random
+from pathlib import Path
+
+import lip_gui
+from lip_gui import build_mapped_text_mapping, load_text_mappings
+
+
+def _write(path: Path, rows: list[tuple[str, str]]) -> Path:
+    path.write_text("".join(f"{key}\t{text}\n" for key, text in rows), encoding="utf-8")
+    return path
+
+
+def _both(files: list[Path], tmp_path: Path) -> tuple[dict[str, str], dict[str, str]]:
+    memory = load_text_mappings(files)
+    mapped = build_mapped_text_mapping(files, tmp_path / "cache" / "test.idx")
+    try:
+        return memory, dict(mapped.items())
+    finally:
+        mapped.close()
+
+
+def test_later_row_wins_within_a_file_before_the_length_rule(tmp_path):
+    a = _write(tmp_path / "a.tsv", [("0001A2B3", "short one but long")])
+    b = _write(tmp_path / "b.tsv", [("0001A2B3", "a much longer text than the first file"), ("0001A2B3", "b2")])
+    memory, mapped = _both([a, b], tmp_path)
+    assert memory == mapped == {"0001A2B3": "short one but long"}
+
+
+def test_longer_text_of_a_later_file_wins(tmp_path):
+    a = _write(tmp_path / "a.tsv", [("0001A2B3", "short"), ("0001A2B4", "only in a")])
+    b = _write(tmp_path / "b.tsv", [("0001A2B3", "x"), ("0001A2B3", "longer in b")])
+    memory, mapped = _both([a, b], tmp_path)
+    assert memory == mapped
+    assert mapped["0001A2B3"] == "longer in b"
+
+
+def test_random_multi_file_merges_agree(tmp_path):
+    rng = random.Random(26)
+    keys = [f"{rng.randrange(1 << 32):08X}" for _ in range(300)]
+    files = []
+    for n in range(4):
+        rows = [(rng.choice(keys), "t" * rng.randrange(1, 30) + str(i)) for i in range(600)]
+        files.append(_write(tmp_path / f"{n}.tsv", rows))
+    memory, mapped = _both(files, tmp_path)
+    assert memory == mapped
+
+
+def test_hash_collisions_keep_keys_apart(tmp_path, monkeypatch):
+    monkeypatch.setattr(lip_gui, "_mapped_hash", lambda key: 42)
+    a = _write(tmp_path / "a.tsv", [("0001A2B3", "one"), ("0001A2B4", "two"), ("0001A2B3", "one again")])
+    b = _write(tmp_path / "b.tsv", [("0001A2B4", "two, but longer"), ("0001A2B5", "three")])
+    memory, mapped = _both([a, b], tmp_path)
+    assert memory == mapped
+    assert len(mapped) == 3
+
+
+def test_close_can_be_called_twice(tmp_path):
+    a = _write(tmp_path / "a.tsv", [("0001A2B3", "Hello")])
+    mapped = build_mapped_text_mapping([a], tmp_path / "test.idx")
+    assert mapped["0001A2B3"] == "Hello"
+    mapped.close()
+    mapped.close()
+
+
+def test_table_grows_when_the_size_estimate_is_too_low(tmp_path, monkeypatch):
+    # Plugin and XML sizes are estimates; pretend every file has a single line.
+    scan = lip_gui._scan_mapping_file
+    monkeypatch.setattr(lip_gui, "_scan_mapping_file", lambda path: (scan(path)[0], 1))
+    rng = random.Random(48)
+    keys = [f"{n:08X}" for n in range(1500)]
+    files = []
+    for n in range(3):
+        rows = [(rng.choice(keys), "t" * rng.randrange(1, 30)) for _ in range(1200)]
+        files.append(_write(tmp_path / f"{n}.tsv", rows))
+    memory, mapped = _both(files, tmp_path)
+    assert memory == mapped
+    assert not list((tmp_path / "cache").glob("*.tmp")) and not list((tmp_path / "cache").glob("*.grow"))
+
+
+def test_stale_indexes_are_pruned_after_a_build(tmp_path):
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    a = _write(tmp_path / "a.tsv", [("0001A2B3", "Hello")])
+    b = _write(tmp_path / "b.tsv", [("0001A2B4", "World")])
+    old_layout = cache / "mapping-0123456789abcdef.idx"
+    old_layout.write_bytes(b"LIPMAP01" + bytes(16))
+    old_layout.with_suffix(".data").write_bytes(b"")
+
+    lip_gui.open_mapped_text_mapping([b], cache).close()
+    first = lip_gui.mapped_index_path([a], cache)
+    lip_gui.open_mapped_text_mapping([a], cache).close()
+    assert not old_layout.exists() and not old_layout.with_suffix(".data").exists()
+    # b.tsv is unchanged, so its index stays.
+    assert lip_gui.mapped_index_path([b], cache).exists()
+
+    _write(a, [("0001A2B3", "Hello again")])
+    mapped = lip_gui.open_mapped_text_mapping([a], cache)
+    assert mapped["0001A2B3"] == "Hello again"
+    mapped.close()
+    assert not first.exists() and not first.with_suffix(".json").exists()
+    assert sorted(p.suffix for p in cache.iterdir()) == [".data", ".data", ".idx", ".idx", ".json", ".json"]
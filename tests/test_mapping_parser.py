@@ -0,0 +1,150 @@
+from pathlib import Path
+
+import pytest
+
+import mapping_parser
+import merge_lazyvoice_csv
+from mapping_parser import (
+    LAZYVOICEFINDER,
+    PLAIN,
+    TABLE,
+    XTRANSLATOR,
+    detect_columns,
+    detect_delimiter,
+    iter_delimited_entries,
+    iter_delimited_mapping,
+    scan_delimited,
+    sniff_delimiter,
+)
+
+
+def _file(tmp_path: Path, name: str, text: str) -> Path:
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize(
+    ("line", "delimiter"),
+    [
+        ("000A1234\tHello, traveler; welcome", "\t"),
+        ("000A1234;Hello, traveler, welcome", ";"),
+        ("000A1234,Hi; there", ","),
+        ("Voice Type;File Name;Dialogue 2 - German", ";"),
+        ("000A1234", "\t"),
+    ],
+)
+def test_delimiter_is_the_first_separator_of_the_first_line(line, delimiter):
+    assert detect_delimiter(line) == delimiter
+
+
+def test_scan_skips_leading_blank_lines_and_counts_lines(tmp_path):
+    path = _file(tmp_path, "m.csv", "\n\n000A1234;Hallo, Welt\n000A1235;Tschüss\n")
+    assert scan_delimited(path) == (";", 5)
+    assert sniff_delimiter(path) == ";"
+
+
+def test_readers_take_the_delimiter_from_the_first_line_only(tmp_path, monkeypatch):
+    def _no_full_scan(path):
+        raise AssertionError("read the whole file for the delimiter")
+
+    monkeypatch.setattr(mapping_parser, "scan_delimited", _no_full_scan)
+    path = _file(tmp_path, "m.csv", "\ufeff000A1234;Hallo, Welt\n000A1235;Tschüss\n")
+    assert list(iter_delimited_mapping(path)) == [("000A1234", "Hallo, Welt"), ("000A1235", "Tschüss")]
+    lvf = _file(tmp_path, "lvf.csv", "Voice Type,File Name,Dialogue 2 - German\nMaleNord,a_000A1234_1.fuz,Hallo\n")
+    assert list(iter_delimited_entries(lvf, LAZYVOICEFINDER)) == [("MaleNord", "a_000A1234_1.fuz", "Hallo")]
+
+
+@pytest.mark.parametrize(
+    ("header", "profile", "key", "text", "voice"),
+    [
+        (["Plugin", "Voice Type", "File Name", "Dialogue 1 - English", "Dialogue 2 - German"], LAZYVOICEFINDER, 2, 4, 1),
+        (["EDID", "sID", "REC", "Source", "Dest"], XTRANSLATOR, 1, 4, -1),
+        (["FormID", "Subtitle"], TABLE, 0, 1, -1),
+        (["File", "Voice", "Dialogue2-German"], TABLE, 0, 2, 1),
+        (["000A1234", "Hello"], PLAIN, 0, 1, -1),
+    ],
+)
+def test_profiles(header, profile, key, text, voice):
+    columns = detect_columns(header)
+    assert (columns.profile, columns.key, columns.text, columns.voice) == (profile, key, text, voice)
+    assert columns.header == (profile is not PLAIN)
+
+
+def test_header_without_usable_columns_falls_back_to_the_first_two(tmp_path):
+    path = _file(tmp_path, "m.tsv", "ID\tWhatever\n000A1234\tHallo\n")
+    assert list(iter_delimited_mapping(path)) == [("000A1234", "Hallo")]
+
+
+def test_keys_are_normalized(tmp_path):
+    path = _file(
+        tmp_path,
+        "m.tsv",
+        "0x000a1234\tFormID with prefix\n"
+        "Data\\Sound\\Voice\\Skyrim.esm\\MaleNord\\Abc_000A1235_1.wav\tWindows path\n"
+        "sub/Other.WAV\tPosix path\n"
+        "formid\theader-ish row\n"
+        "\tno key\n"
+        "xyz\t\n",
+    )
+    assert list(iter_delimited_mapping(path)) == [
+        ("000A1234", "FormID with prefix"),
+        ("abc_000a1235_1", "Windows path"),
+        ("other", "Posix path"),
+    ]
+
+
+def test_lazyvoicefinder_export_with_bom_and_voice_keys(tmp_path):
+    path = tmp_path / "lvf.csv"
+    path.write_text(
+        "Voice Type,File Name,Dialogue 1 - English,Dialogue 2 - German\n"
+        'MaleNord,Foo_000A1234_1.wav,Hello,"Hallo, Welt"\n',
+        encoding="utf-8-sig",
+    )
+    assert list(iter_delimited_mapping(path)) == [
+        ("foo_000a1234_1", "Hallo, Welt"),
+        ("malenord/foo_000a1234_1", "Hallo, Welt"),
+        ("malenord\\foo_000a1234_1", "Hallo, Welt"),
+    ]
+
+
+def test_xtranslator_export_falls_back_to_source(tmp_path):
+    path = _file(tmp_path, "x.txt", "sID\tSource\tDest\n0100ABCD\tHello\t\n0100ABCE\tHello\tHallo\n")
+    assert list(iter_delimited_mapping(path)) == [("0100ABCD", "Hello"), ("0100ABCE", "Hallo")]
+
+
+def test_quoted_multiline_text(tmp_path):
+    path = _file(tmp_path, "m.csv", 'FormID,Subtitle\n000A1234,"Hello,\nworld"\n')
+    assert list(iter_delimited_mapping(path)) == [("000A1234", "Hello,\nworld")]
+
+
+def test_empty_file(tmp_path):
+    path = _file(tmp_path, "m.csv", "\n\n")
+    with pytest.raises(ValueError, match="leer"):
+        list(iter_delimited_mapping(path))
+    assert list(iter_delimited_entries(path, LAZYVOICEFINDER)) == []
+
+
+def test_entries_require_the_profile_columns(tmp_path):
+    path = _file(tmp_path, "m.csv", "FormID,Subtitle\n000A1234,Hi\n")
+    with pytest.raises(ValueError, match="Voice Type, File Name"):
+        list(iter_delimited_entries(path, LAZYVOICEFINDER))
+
+
+def test_merge_tool_reads_and_merges_lazyvoicefinder_exports(tmp_path):
+    path = _file(
+        tmp_path,
+        "lvf.csv",
+        "Voice Type;File Name;Dialogue 2 - German\n"
+        "MaleNord;Foo_000A1234_1.wav;Hallo, Welt\n"
+        "malenord;foo_000a1234_1.wav;Hallo, Welt, wie geht's?\n"
+        ";Bar.wav;no voice type\n"
+        "FemaleEven;Short.wav\n",
+    )
+    rows = merge_lazyvoice_csv.read_lazyvoice_csv(path)
+    assert [(r.voice_type, r.file_name, r.text) for r in rows] == [
+        ("MaleNord", "Foo_000A1234_1.wav", "Hallo, Welt"),
+        ("malenord", "foo_000a1234_1.wav", "Hallo, Welt, wie geht's?"),
+    ]
+    merged = merge_lazyvoice_csv.merge_rows(rows)
+    assert [r.text for r in merged.values()] == ["Hallo, Welt, wie geht's?"]
@@ -0,0 +1,58 @@
+import threading
+
+from lip_gui import PhaseProfiler, ProfileMode
+
+
+def test_only_memory_phases_report_a_peak():
+    profiler = PhaseProfiler(ProfileMode.FULL)
+    try:
+        with profiler.phase("build_jobs", memory=True):
+            data = [bytes(1024) for _ in range(1024)]
+        with profiler.phase("worker"):
+            del data
+        profiler.add("drain_queue", 0.5)
+        stats = profiler._stats
+        assert stats["build_jobs"][3] >= 1 << 20
+        assert stats["worker"][3] == 0
+        assert stats["drain_queue"][:2] == [1, 0.5]
+        assert "Prozess-Speicherspitze" in next(line for line in profiler.summary() if line.startswith("build_jobs"))
+    finally:
+        profiler.enabled = False
+        import tracemalloc
+
+        if profiler._started_tracing:
+            tracemalloc.stop()
+
+
+def test_phases_without_cprofile_are_reported():
+    profiler = PhaseProfiler(ProfileMode.FULL)
+    inside = threading.Event()
+    release = threading.Event()
+
+    def slot() -> None:
+        with profiler.phase("worker"):
+            inside.set()
+            release.wait(5)
+
+    first = threading.Thread(target=slot)
+    first.start()
+    inside.wait(5)
+    with profiler.phase("worker"):
+        pass
+    release.set()
+    first.join()
+
+    lines = profiler.summary()
+    skipped = profiler._unprofiled.get("worker", 0)
+    # Before Python 3.12 several profilers may run at once; then nothing is skipped.
+    assert skipped in (0, 1)
+    assert any("ohne cProfile" in line for line in lines) == bool(skipped)
+
+
+def test_write_stops_recording(tmp_path):
+    profiler = PhaseProfiler(ProfileMode.TIMERS)
+    with profiler.phase("scan", memory=True):
+        pass
+    assert (tmp_path / "lipgui_profile.txt") == profiler.write(tmp_path)
+    profiler.add("drain_queue", 1.0)
+    assert "drain_queue" not in profiler._stats
@@ -0,0 +1,32 @@
+import zipfile
+from pathlib import Path
+
+from lip_gui import Job, ZipPackager
+
+
+def _job(root: Path, name: str, data: bytes) -> Job:
+    lip = root / name
+    lip.parent.mkdir(parents=True, exist_ok=True)
+    lip.write_bytes(data)
+    return Job(wav_path=lip.with_suffix(".wav"), lip_path=lip, text="")
+
+
+def _run(root: Path, jobs: list[Job]) -> list[str]:
+    packager = ZipPackager([root])
+    for job in jobs:
+        assert packager.process(job) == ""
+    return packager.finish(canceled=False)
+
+
+def test_incremental_update_counts_each_entry_once(tmp_path):
+    _run(tmp_path, [_job(tmp_path, "a.lip", b"a1"), _job(tmp_path, "sub/b.lip", b"b1")])
+
+    again = _job(tmp_path, "a.lip", b"a2")
+    lines = _run(tmp_path, [again, _job(tmp_path, "c.lip", b"c1"), again])
+
+    assert lines == [f"Archiv: {tmp_path / 'lipgui_lips.zip'} (2 neu, 1 davon mehrfach erzeugt, 3 insgesamt)"]
+    with zipfile.ZipFile(tmp_path / "lipgui_lips.zip") as archive:
+        assert sorted(archive.namelist()) == ["a.lip", "c.lip", "sub/b.lip"]
+        assert archive.read("a.lip") == b"a2"
+    manifest = (tmp_path / "lipgui_lips.zip.sha256").read_text(encoding="utf-8").splitlines()
+    assert [line.split("  ")[1] for line in manifest] == ["a.lip", "c.lip", "sub/b.lip"]
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Measure mapping file parsing (mapping_parser) on large generated inputs.
+
+Writes one file per column profile with --rows rows (default: 1,000,000) and times how long
+LipGUI's reader (into a dict, like load_text_mapping) and merge_lazyvoice_csv.py take for each.
+
+    python tools/bench_mapping.py
+    python tools/bench_mapping.py --rows 200000 --runs 5
+    python tools/bench_mapping.py --keep bench_data   # keep the generated files
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mapping_parser import iter_delimited_mapping  # noqa: E402
+from merge_lazyvoice_csv import read_lazyvoice_csv  # noqa: E402
+
+_TEXT = "Ich habe gehört, dass du in Weißlauf warst; stimmt das, Reisender?"
+
+
+def _write(path: Path, delimiter: str, header: list[str] | None, row: Callable[[int], list[str]], rows: int) -> Path:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        if header:
+            writer.writerow(header)
+        writer.writerows(row(i) for i in range(rows))
+    return path
+
+
+def _generate(folder: Path, rows: int) -> dict[str, Path]:
+    return {
+        "LazyVoiceFinder": _write(
+            folder / "lazyvoice.csv",
+            ",",
+            ["Plugin", "Voice Type", "File Name", "Dialogue 1 - English", "Dialogue 2 - German"],
+            lambda i: [
+                "Skyrim.esm",
+                f"MaleNord{i % 40}",
+                f"DialogueGe_Topic{i % 997}_{i:08X}_1.fuz",
+                "I heard you were in Whiterun.",
+                f"{_TEXT} ({i})",
+            ],
+            rows,
+        ),
+        "xTranslator": _write(
+            folder / "xtranslator.txt",
+            "\t",
+            ["EDID", "sID", "REC", "Source", "Dest"],
+            lambda i: [f"Info{i}", f"{i:08X}", "INFO:NAM1", "I heard you were in Whiterun.", f"{_TEXT} ({i})" if i % 7 else ""],
+            rows,
+        ),
+        "2 Spalten": _write(folder / "plain.tsv", "\t", None, lambda i: [f"{i:08X}", f"{_TEXT} ({i})"], rows),
+    }
+
+
+def _time(func: Callable[[], int], runs: int) -> tuple[float, int]:
+    samples: list[float] = []
+    count = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        count = func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--keep", type=Path, default=None, help="Write the inputs to this folder and keep them")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = args.keep or Path(tmp)
+        folder.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        files = _generate(folder, args.rows)
+        print(f"{args.rows} Zeilen pro Datei erzeugt ({time.perf_counter() - started:.1f}s)\n")
+
+        print(f"{'profile':<16} {'reader':<10} {'seconds':>8} {'rows/s':>10} {'entries':>9}   (median of {args.runs})")
+        for name, path in files.items():
+            benches: list[tuple[str, Callable[[], int]]] = [
+                ("LipGUI", lambda p=path: len(dict(iter_delimited_mapping(p)))),
+            ]
+            if name == "LazyVoiceFinder":
+                benches.append(("merge", lambda p=path: len(read_lazyvoice_csv(p))))
+            for reader, func in benches:
+                seconds, entries = _time(func, args.runs)
+                print(f"{name:<16} {reader:<10} {seconds:8.2f} {args.rows / seconds:10.0f} {entries:9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Measure LipGUI start-up time: module import, App construction and first paint.
+
+Starts the GUI several times with LIPGUI_STARTUP_PROBE set. The app writes its timings once
+the main window is visible and quits. The wall-clock column also covers interpreter start-up
+and, for the frozen build, the PyInstaller bootloader.
+
+    python tools/bench_startup.py                       # script (lip_gui.py)
+    python tools/bench_startup.py --exe dist/LipGUI.exe # script and frozen build
+    python tools/bench_startup.py -X importtime         # plus the slowest imports
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run_once(cmd: list[str], timeout: float) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        probe = Path(tmp) / "startup.json"
+        env = dict(os.environ, LIPGUI_STARTUP_PROBE=str(probe))
+        started = time.time()
+        subprocess.run(cmd, env=env, cwd=str(ROOT), timeout=timeout, check=False)
+        if not probe.exists():
+            raise RuntimeError(f"Keine Messwerte von: {' '.join(cmd)}")
+        data = json.loads(probe.read_text(encoding="utf-8"))
+    data["wall_to_paint_s"] = data["painted_at"] - started
+    return data
+
+
+def _bench(name: str, cmd: list[str], runs: int, timeout: float) -> dict[str, object]:
+    samples = [_run_once(cmd, timeout) for _ in range(runs)]
+    keys = ("import_s", "init_s", "first_paint_s", "wall_to_paint_s")
+    summary: dict[str, object] = {"target": name, "runs": runs}
+    for key in keys:
+        values = [float(s[key]) for s in samples]
+        summary[key] = {"median": statistics.median(values), "min": min(values)}
+    return summary
+
+
+def _slowest_imports(top: int) -> list[tuple[int, str]]:
+    cp = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import lip_gui"],
+        cwd=str(ROOT),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    rows: list[tuple[int, str]] = []
+    for line in cp.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--exe", type=Path, default=None, help="Frozen build (e.g. dist/LipGUI.exe)")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--json", type=Path, default=None, help="Append results as one JSON line (for tracking)")
+    parser.add_argument("-X", dest="xopt", default="", help="'importtime': also list the slowest imports")
+    args = parser.parse_args()
+
+    targets = [("script", [sys.executable, str(ROOT / "lip_gui.py")])]
+    if args.exe is not None:
+        targets.append(("frozen", [str(args.exe.resolve())]))
+
+    results = [_bench(name, cmd, args.runs, args.timeout) for name, cmd in targets]
+    print(f"{'target':<8} {'import':>9} {'App()':>9} {'paint':>9} {'wall':>9}   (median of {args.runs}, seconds)")
+    for r in results:
+        cols = [r[k]["median"] for k in ("import_s", "init_s", "first_paint_s", "wall_to_paint_s")]  # type: ignore[index]
+        print(f"{r['target']:<8} " + " ".join(f"{c:9.3f}" for c in cols))
+
+    if args.xopt == "importtime":
+        print("\nLangsamste Imports (kumulativ, µs):")
+        for us, name in _slowest_imports(15):
+            print(f"{us:>9}  {name}")
+
+    if args.json is not None:
+        with args.json.open("a", encoding="utf-8") as f:
+            f.write(json.dumps({"time": time.time(), "results": results}) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Stand-in for LipGenerator.exe to exercise LipGUI's batch code on machines without the real tool.
+
+Accepts the same command line as LipGenerator.exe:
+
+    fake_lipgenerator.py <wav> <text> -Language:<lang> -OutputFileName:<lip> [-GestureExaggeration:<x>]
+
+It sleeps for a fraction of the WAV duration and writes a small placeholder .lip file.
+
+With --server it instead handles many jobs per process using LipGUI's generator server
+protocol (settings: "generator_backend": "server"), one JSON object per line:
+
+    stdin:  {"id": 1, "wav": "...", "text": "...", "language": "...", "output": "...", "gesture": ""}
+    stdout: {"id": 1, "ok": true, "returncode": 0, "output": "..."}
+
+    FAKE_LIPGEN_STARTUP seconds to sleep once per process, like loading FonixData.cdf (default: 0)
+
+Environment:
+    FAKE_LIPGEN_SPEED   seconds of work per second of audio (default: 0.05)
+    FAKE_LIPGEN_FAIL    substring; WAVs whose path contains it fail with exit code 1
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+import wave
+from pathlib import Path
+
+
+def _wav_duration(path: Path) -> float:
+    try:
+        with wave.open(str(path), "rb") as w:
+            return w.getnframes() / float(w.getframerate() or 1)
+    except (OSError, wave.Error, EOFError):
+        return 0.0
+
+
+def _generate(wav_path: Path, text: str, language: str, out_path: Path) -> tuple[int, str]:
+    """Returns (exit code, message)."""
+    fail = os.environ.get("FAKE_LIPGEN_FAIL", "")
+    if fail and fail in str(wav_path):
+        return 1, f"ERROR: simulated failure for {wav_path}"
+    if not wav_path.exists():
+        return 1, f"ERROR: file not found: {wav_path}"
+
+    duration = _wav_duration(wav_path)
+    time.sleep(duration * float(os.environ.get("FAKE_LIPGEN_SPEED", "0.05")))
+
+    out_path.write_bytes(b"FAKELIP\0" + f"{language}|{duration:.3f}|{text}".encode("utf-8"))
+    return 0, f"Generated {out_path.name} ({duration:.2f}s)"
+
+
+def serve() -> int:
+    time.sleep(float(os.environ.get("FAKE_LIPGEN_STARTUP", "0")))
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        code, message = _generate(
+            Path(request["wav"]), request.get("text", ""), request.get("language", ""), Path(request["output"])
+        )
+        response = {"id": request.get("id"), "ok": code == 0, "returncode": code, "output": message}
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    if argv[:1] == ["--server"]:
+        return serve()
+    positional = [a for a in argv if not a.startswith("-")]
+    options = dict(a[1:].split(":", 1) for a in argv if a.startswith("-") and ":" in a)
+    if len(positional) < 2 or "OutputFileName" not in options:
+        print("usage: fake_lipgenerator.py <wav> <text> -Language:<lang> -OutputFileName:<lip>", file=sys.stderr)
+        return 2
+
+    time.sleep(float(os.environ.get("FAKE_LIPGEN_STARTUP", "0")))
+    code, message = _generate(
+        Path(positional[0]), positional[1], options.get("Language", ""), Path(options["OutputFileName"])
+    )
+    print(message, file=sys.stderr if code else sys.stdout)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))